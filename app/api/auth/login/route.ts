@@ -1,7 +1,7 @@
 import { NextResponse } from 'next/server';
 import { db } from '@/lib/db';
 import { verifyPassword } from '@/lib/auth/password';
-import { createSession, setSessionCookie } from '@/lib/auth/simple-session';
+import { createSession, setAccessTokenCookie, setSessionCookie } from '@/lib/auth/simple-session';
 import { loginSchema } from '@/lib/utils/validation';
 import { apiHandler } from '@/lib/api/handler';
 
@@ -38,6 +38,7 @@ export const POST = apiHandler(
     // Create session
     const session = await createSession(user.id);
     await setSessionCookie(session.id, session.expiresAt);
+    await setAccessTokenCookie({ id: user.id, username: user.username, email: user.email, role: user.role });
 
     return NextResponse.json({
       success: true,
@@ -1,58 +1,46 @@
 import { NextResponse } from 'next/server';
-import { db, users } from '@/lib/db';
 import { hashPassword } from '@/lib/auth/password';
-import { createSession, setSessionCookie } from '@/lib/auth/simple-session';
+import { createSession, setAccessTokenCookie, setSessionCookie } from '@/lib/auth/simple-session';
 import { registerSchema } from '@/lib/utils/validation';
-import { sql } from 'drizzle-orm';
+import { createUser, findTakenIdentity, type IdentityField } from '@/lib/db/repositories/users';
 import { apiHandler } from '@/lib/api/handler';
 import { badRequest } from '@/lib/api/errors';
 
+const TAKEN_MESSAGES: Record<IdentityField, string> = {
+  username: 'Nombre de usuario ya registrado',
+  email: 'Correo electrónico ya registrado',
+};
+
 export const POST = apiHandler(
   { auth: 'none', schema: registerSchema },
   async (ctx) => {
     const validatedData = ctx.body as { username: string; email: string; password: string };
 
-    // Check if username already exists
-    const existingUsername = await db.query.users.findFirst({
-      where: (users, { eq }) => eq(users.username, validatedData.username),
-    });
-
-    if (existingUsername) {
-      badRequest('Nombre de usuario ya registrado');
+    // Fail fast on obvious duplicates while the password hashes
+    const [taken, passwordHash] = await Promise.all([
+      findTakenIdentity(validatedData.username, validatedData.email),
+      hashPassword(validatedData.password),
+    ]);
+    if (taken) {
+      badRequest(TAKEN_MESSAGES[taken]);
     }
 
-    // Check if email already exists
-    const existingEmail = await db.query.users.findFirst({
-      where: (users, { eq }) => eq(users.email, validatedData.email),
+    // The unique constraints are authoritative: a concurrent signup can still take the name
+    const result = await createUser({
+      username: validatedData.username,
+      email: validatedData.email,
+      passwordHash,
     });
-
-    if (existingEmail) {
-      badRequest('Correo electrónico ya registrado');
+    if (result.taken) {
+      badRequest(TAKEN_MESSAGES[result.taken]);
     }
-
-    // Check if this is the first user (becomes admin)
-    const userCount = await db
-      .select({ count: sql<number>`count(*)` })
-      .from(users);
-    const isFirstUser = Number(userCount[0].count) === 0;
-
-    // Hash password
-    const passwordHash = await hashPassword(validatedData.password);
-
-    // Create user
-    const [newUser] = await db
-      .insert(users)
-      .values({
-        username: validatedData.username,
-        email: validatedData.email,
-        passwordHash,
-        role: isFirstUser ? 'admin' : 'candidate',
-      })
-      .returning();
+    const { user: newUser } = result;
+    const isFirstUser = newUser.role === 'admin';
 
     // Create session
     const session = await createSession(newUser.id);
     await setSessionCookie(session.id, session.expiresAt);
+    await setAccessTokenCookie({ id: newUser.id, username: newUser.username, email: newUser.email, role: newUser.role });
 
     return NextResponse.json(
       {
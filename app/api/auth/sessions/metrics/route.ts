@@ -0,0 +1,11 @@
+import { NextResponse } from 'next/server';
+import { apiHandler } from '@/lib/api/handler';
+import { getSessionMetrics } from '@/lib/auth/session-reaper';
+
+export const GET = apiHandler(
+  { auth: 'admin' },
+  async () => {
+    const metrics = await getSessionMetrics();
+    return NextResponse.json(metrics);
+  }
+);
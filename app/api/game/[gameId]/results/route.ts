@@ -3,7 +3,7 @@ import { db } from '@/lib/db';
 import { games } from '@/lib/db/schema';
 import { eq } from 'drizzle-orm';
 import { apiHandler } from '@/lib/api/handler';
-import { getGameResults, getLeaderboard } from '@/lib/game/engine';
+import { getGameResults } from '@/lib/game/engine';
 
 export const GET = apiHandler(
   { auth: 'user' },
@@ -28,9 +28,9 @@ export const GET = apiHandler(
       return NextResponse.json({ error: 'Juego no encontrado' }, { status: 404 });
     }
 
+    // Also serves archived games, from their game_archives row
     const results = await getGameResults(gameId);
-    const leaderboard = await getLeaderboard(gameId);
 
-    return NextResponse.json({ ...results, leaderboard });
+    return NextResponse.json(results);
   }
 );
@@ -0,0 +1,34 @@
+import { NextResponse } from 'next/server';
+import { db } from '@/lib/db';
+import { games } from '@/lib/db/schema';
+import { eq } from 'drizzle-orm';
+import { apiHandler } from '@/lib/api/handler';
+import { auditGameScores } from '@/lib/game/engine';
+
+export const GET = apiHandler(
+  { auth: 'admin' },
+  async (ctx) => {
+    // Extract gameId from route params
+    const params = (ctx as Record<string, unknown>).params as { gameId: string } | undefined;
+    if (!params?.gameId) {
+      return NextResponse.json({ error: 'Game ID requerido' }, { status: 400 });
+    }
+
+    const gameId = parseInt(params.gameId, 10);
+    if (isNaN(gameId)) {
+      return NextResponse.json({ error: 'Game ID inválido' }, { status: 400 });
+    }
+
+    // Verify game exists
+    const game = await db.query.games.findFirst({
+      where: eq(games.id, gameId),
+    });
+
+    if (!game) {
+      return NextResponse.json({ error: 'Juego no encontrado' }, { status: 404 });
+    }
+
+    const audit = await auditGameScores(gameId);
+    return NextResponse.json(audit);
+  }
+);
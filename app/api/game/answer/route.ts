@@ -1,6 +1,6 @@
 import { NextResponse } from 'next/server';
 import { apiHandler } from '@/lib/api/handler';
-import { getActiveGame, submitAnswer } from '@/lib/game/engine';
+import { getActiveGame, submitAnswer, ANSWER_CONFLICT_ERRORS } from '@/lib/game/engine';
 import { findParticipant } from '@/lib/db/repositories/participants';
 import { submitAnswerSchema } from '@/lib/utils/validation';
 
@@ -34,15 +34,9 @@ export const POST = apiHandler(
         pointsAwarded: result.pointsAwarded,
       });
     } catch (error) {
-      if (error instanceof Error) {
-        // Known game errors → 409 Conflict
-        if (
-          error.message === 'Ya respondiste esta pregunta' ||
-          error.message === 'Tiempo agotado' ||
-          error.message === 'No está en fase de pregunta'
-        ) {
-          return NextResponse.json({ error: error.message }, { status: 409 });
-        }
+      // Known game errors → 409 Conflict
+      if (error instanceof Error && ANSWER_CONFLICT_ERRORS.has(error.message)) {
+        return NextResponse.json({ error: error.message }, { status: 409 });
       }
       throw error;
     }
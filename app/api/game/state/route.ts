@@ -1,19 +1,51 @@
 import { NextResponse } from 'next/server';
 import { apiHandler } from '@/lib/api/handler';
-import { getActiveGame, resolveGameState } from '@/lib/game/engine';
-import type { IdleState } from '@/lib/game/types';
+import { getActiveGame, peekGameStateRevision, resolveVersionedGameState } from '@/lib/game/engine';
+import { COMPACT_MEDIA_TYPE, createStateEncoder, wantsCompactEncoding } from '@/lib/game/compact';
+import type { GameStateResponse, IdleState } from '@/lib/game/types';
+
+// State bodies are per-user and per-encoding, so both are part of the validator
+function stateETag(gameId: number, revision: string, userId: number, compact: boolean): string {
+  return `W/"${gameId}.${revision}.${userId}${compact ? '.c' : ''}"`;
+}
+
+const cacheHeaders = { 'Cache-Control': 'private, no-cache', Vary: 'Accept' };
+
+function stateResponse(state: GameStateResponse, compact: boolean, etag: string): NextResponse {
+  // Clock sample for counting down to the phase deadline
+  const headers = { ...cacheHeaders, ETag: etag, 'X-Server-Time': String(Date.now()) };
+  if (!compact) return NextResponse.json(state, { headers });
+
+  // A one-off response carries the full username dictionary
+  const body = JSON.stringify(createStateEncoder()(state));
+  return new NextResponse(body, { headers: { ...headers, 'Content-Type': COMPACT_MEDIA_TYPE } });
+}
 
 export const GET = apiHandler(
   { auth: 'user' },
   async (ctx) => {
+    const userId = ctx.user!.id;
+    const compact = wantsCompactEncoding(ctx.request!);
     const activeGame = await getActiveGame();
 
     if (!activeGame) {
       const idle: IdleState = { phase: 'idle' };
-      return NextResponse.json(idle);
+      return stateResponse(idle, compact, compact ? 'W/"idle.c"' : 'W/"idle"');
+    }
+
+    // Conditional GET: skip the full resolve when nothing changed for this game
+    const ifNoneMatch = ctx.request!.headers.get('if-none-match');
+    if (ifNoneMatch) {
+      const revision = await peekGameStateRevision(activeGame.id);
+      if (revision !== null) {
+        const etag = stateETag(activeGame.id, revision, userId, compact);
+        if (ifNoneMatch === etag) {
+          return new NextResponse(null, { status: 304, headers: { ...cacheHeaders, ETag: etag } });
+        }
+      }
     }
 
-    const state = await resolveGameState(activeGame.id, ctx.user!.id);
-    return NextResponse.json(state);
+    const { state, version } = await resolveVersionedGameState(activeGame.id, userId);
+    return stateResponse(state, compact, stateETag(activeGame.id, version, userId, compact));
   }
 );
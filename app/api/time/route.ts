@@ -0,0 +1,26 @@
+import { NextResponse } from 'next/server';
+import { apiHandler } from '@/lib/api/handler';
+import { recordClockReport } from '@/lib/game/clock-skew';
+import { clockReportSchema, type ClockReportInput } from '@/lib/utils/validation';
+
+// Time-sync sample for client timers (see lib/game/server-clock.ts).
+// No auth, so no session lookup sits between receive and reply.
+export const GET = apiHandler(
+  { auth: 'none' },
+  async () => {
+    return NextResponse.json(
+      { serverTime: Date.now() },
+      { headers: { 'Cache-Control': 'no-store' } }
+    );
+  }
+);
+
+// Clients report the offset and round trip they measured
+export const POST = apiHandler(
+  { auth: 'user', schema: clockReportSchema },
+  async (ctx) => {
+    recordClockReport(ctx.user!.id, ctx.body as ClockReportInput);
+
+    return NextResponse.json({ ok: true });
+  }
+);
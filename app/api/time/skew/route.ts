@@ -0,0 +1,10 @@
+import { NextResponse } from 'next/server';
+import { apiHandler } from '@/lib/api/handler';
+import { getClockSkewMetrics } from '@/lib/game/clock-skew';
+
+export const GET = apiHandler(
+  { auth: 'admin' },
+  async () => {
+    return NextResponse.json(getClockSkewMetrics());
+  }
+);
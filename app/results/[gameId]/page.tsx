@@ -4,7 +4,7 @@ import { db } from '@/lib/db';
 import { games } from '@/lib/db/schema';
 import { eq } from 'drizzle-orm';
 import { findParticipant } from '@/lib/db/repositories/participants';
-import { getGameResults, getLeaderboard } from '@/lib/game/engine';
+import { getGameResults } from '@/lib/game/engine';
 import ResultsView from '@/components/game/ResultsView';
 
 interface Props {
@@ -27,12 +27,15 @@ export default async function ResultsPage({ params }: Props) {
 
   if (!game) redirect('/');
 
-  // Check access: must be participant or admin
-  const participant = await findParticipant(gameId, user.id);
-  if (!participant && user.role !== 'admin') redirect('/');
-
   const results = await getGameResults(gameId);
-  const leaderboard = await getLeaderboard(gameId);
+  const { leaderboard } = results;
+
+  // Check access: must be participant or admin. Archived games have no
+  // participant rows; their leaderboard lists who played.
+  const isParticipant = game.status === 'archived'
+    ? leaderboard.some((entry) => entry.userId === user.id)
+    : !!(await findParticipant(gameId, user.id));
+  if (!isParticipant && user.role !== 'admin') redirect('/');
 
   return (
     <ResultsView
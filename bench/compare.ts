@@ -0,0 +1,72 @@
+import { readFileSync } from 'fs';
+import { resolve } from 'path';
+import type { BenchReport, BenchResult } from './lib/measure';
+
+const DEFAULT_THRESHOLD_PERCENT = 10;
+
+// Usage: bench:compare <baseline.json> <current.json> [--threshold=10]
+//   Flags benchmarks whose throughput dropped, or whose p95 latency grew, by
+//   more than the threshold (in percent). Exits 1 when any regressed.
+function parseArgs(argv: string[]) {
+  const files: string[] = [];
+  let threshold = DEFAULT_THRESHOLD_PERCENT;
+  for (const arg of argv) {
+    if (arg.startsWith('--threshold=')) threshold = Number(arg.split('=')[1]);
+    else files.push(resolve(arg));
+  }
+  return { files, threshold };
+}
+
+function readReport(path: string): BenchReport {
+  return JSON.parse(readFileSync(path, 'utf-8')) as BenchReport;
+}
+
+const percentChange = (before: number, after: number) =>
+  before === 0 ? 0 : ((after - before) / before) * 100;
+
+const formatChange = (change: number) => `${change >= 0 ? '+' : ''}${change.toFixed(1)}%`;
+
+function compare() {
+  const { files, threshold } = parseArgs(process.argv.slice(2));
+  if (files.length !== 2 || !(threshold >= 0)) {
+    console.error('Usage: bench:compare <baseline.json> <current.json> [--threshold=10]');
+    process.exit(1);
+  }
+
+  const baseline = readReport(files[0]);
+  const current = readReport(files[1]);
+  const currentByName = new Map<string, BenchResult>(current.results.map((r) => [r.name, r]));
+
+  console.log(`Baseline ${baseline.createdAt} (${baseline.node}) vs current ${current.createdAt} (${current.node})`);
+  console.log(`Threshold: ${threshold}%\n`);
+
+  let regressions = 0;
+  for (const base of baseline.results) {
+    const cur = currentByName.get(base.name);
+    if (!cur) {
+      console.log(`  ? ${base.name.padEnd(48)} missing from current run`);
+      continue;
+    }
+    currentByName.delete(base.name);
+
+    const opsChange = percentChange(base.opsPerSec, cur.opsPerSec);
+    const p95Change = percentChange(base.p95Ms, cur.p95Ms);
+    const regressed = opsChange < -threshold || p95Change > threshold;
+    if (regressed) regressions++;
+
+    console.log(
+      `  ${regressed ? '✗' : '✓'} ${base.name.padEnd(48)}` +
+      ` ops/s ${String(cur.opsPerSec).padStart(10)} (${formatChange(opsChange).padStart(7)})` +
+      `  p95 ${cur.p95Ms.toFixed(2).padStart(8)}ms (${formatChange(p95Change).padStart(7)})`
+    );
+  }
+
+  for (const name of currentByName.keys()) {
+    console.log(`  + ${name.padEnd(48)} new, no baseline`);
+  }
+
+  console.log(regressions === 0 ? '\nNo regressions' : `\n${regressions} regression(s) above ${threshold}%`);
+  process.exit(regressions === 0 ? 0 : 1);
+}
+
+compare();
@@ -0,0 +1,75 @@
+/**
+ * Timing helpers shared by the bench suites. Each benchmark runs a few
+ * warmup calls, then `iterations` timed calls one after another, and reports
+ * throughput plus latency percentiles.
+ */
+
+export interface BenchResult {
+  name: string;
+  iterations: number;
+  opsPerSec: number;
+  meanMs: number;
+  p50Ms: number;
+  p95Ms: number;
+  p99Ms: number;
+  maxMs: number;
+}
+
+// What a bench run writes, and what bench/compare.ts reads
+export interface BenchReport {
+  createdAt: string;
+  node: string;
+  options: Record<string, unknown>;
+  results: BenchResult[];
+}
+
+export interface MeasureOptions {
+  iterations: number;
+  warmup?: number;
+}
+
+function percentile(sorted: number[], p: number): number {
+  if (sorted.length === 0) return 0;
+  const index = Math.min(sorted.length - 1, Math.ceil((p / 100) * sorted.length) - 1);
+  return sorted[Math.max(0, index)];
+}
+
+const round = (value: number) => Math.round(value * 1000) / 1000;
+
+/** Time `fn(i)` for i = 0..iterations-1 (warmup calls get negative i). */
+export async function measure(
+  name: string,
+  fn: (i: number) => Promise<unknown> | unknown,
+  { iterations, warmup = Math.min(10, Math.ceil(iterations / 10)) }: MeasureOptions
+): Promise<BenchResult> {
+  for (let i = -warmup; i < 0; i++) {
+    await fn(i);
+  }
+
+  const samples: number[] = [];
+  const startedAt = performance.now();
+  for (let i = 0; i < iterations; i++) {
+    const t0 = performance.now();
+    await fn(i);
+    samples.push(performance.now() - t0);
+  }
+  const totalMs = performance.now() - startedAt;
+
+  samples.sort((a, b) => a - b);
+  const result: BenchResult = {
+    name,
+    iterations,
+    opsPerSec: round((iterations * 1000) / totalMs),
+    meanMs: round(samples.reduce((sum, s) => sum + s, 0) / samples.length),
+    p50Ms: round(percentile(samples, 50)),
+    p95Ms: round(percentile(samples, 95)),
+    p99Ms: round(percentile(samples, 99)),
+    maxMs: round(samples[samples.length - 1]),
+  };
+
+  console.log(
+    `  ${name.padEnd(48)} ${String(result.opsPerSec).padStart(10)} ops/s` +
+    `  p50 ${result.p50Ms.toFixed(2)}ms  p95 ${result.p95Ms.toFixed(2)}ms`
+  );
+  return result;
+}
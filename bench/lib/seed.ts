@@ -0,0 +1,65 @@
+import { count, inArray, isNull } from 'drizzle-orm';
+import { db, questions, users } from '../../lib/db';
+
+/**
+ * Idempotent seeding for the bench suite. Bench users and questions are
+ * reused across runs; games are created by each run.
+ */
+
+const INSERT_CHUNK = 5000;
+
+/** Users `${prefix}_1..count` (created if missing), ids in that order. */
+export async function ensureUsers(prefix: string, total: number): Promise<number[]> {
+  const usernames = Array.from({ length: total }, (_, i) => `${prefix}_${i + 1}`);
+
+  for (let i = 0; i < usernames.length; i += INSERT_CHUNK) {
+    await db
+      .insert(users)
+      .values(usernames.slice(i, i + INSERT_CHUNK).map((username) => ({
+        username,
+        email: `${username}@bench.invalid`,
+        passwordHash: '!', // Not a valid hash: bench users cannot log in
+      })))
+      .onConflictDoNothing();
+  }
+
+  const ids = new Map<string, number>();
+  for (let i = 0; i < usernames.length; i += INSERT_CHUNK) {
+    const rows = await db
+      .select({ id: users.id, username: users.username })
+      .from(users)
+      .where(inArray(users.username, usernames.slice(i, i + INSERT_CHUNK)));
+    for (const r of rows) ids.set(r.username, r.id);
+  }
+  return usernames.map((u) => ids.get(u)!);
+}
+
+const DIFFICULTIES = ['easy', 'medium', 'hard'];
+const CATEGORIES = ['bench-a', 'bench-b', 'bench-c', 'bench-d'];
+
+/** Top the question bank up to at least `total` live questions. Returns the count added. */
+export async function ensureQuestions(total: number): Promise<number> {
+  const [{ live }] = await db
+    .select({ live: count() })
+    .from(questions)
+    .where(isNull(questions.deletedAt));
+
+  const missing = Math.max(0, total - live);
+  const offset = Date.now();
+  for (let i = 0; i < missing; i += INSERT_CHUNK) {
+    const batch = Math.min(INSERT_CHUNK, missing - i);
+    await db.insert(questions).values(
+      Array.from({ length: batch }, (_, k) => {
+        const n = i + k;
+        return {
+          questionText: `Bench question ${offset}-${n}`,
+          answers: ['A', 'B', 'C', 'D'].map((label) => `Answer ${label} ${n}`),
+          correctIndex: n % 4,
+          difficulty: DIFFICULTIES[n % DIFFICULTIES.length],
+          category: CATEGORIES[n % CATEGORIES.length],
+        };
+      })
+    );
+  }
+  return missing;
+}
@@ -0,0 +1,151 @@
+import { mkdirSync, writeFileSync } from 'fs';
+import { dirname, resolve } from 'path';
+import { fileURLToPath } from 'url';
+import { VirtualClock, setClock } from '../lib/game/clock';
+import { resolveGameRules } from '../lib/game/config';
+import {
+  finishGame,
+  getGameResults,
+  getGlobalLeaderboard,
+  getLeaderboard,
+  initializeGame,
+  resolveGameState,
+  selectQuestionsForGame,
+  submitAnswer,
+} from '../lib/game/engine';
+import { loadGameEvents, loadGameReplay } from '../lib/game/events';
+import { foldGameEvents, projectGameState } from '../lib/game/replay';
+import { playSimulatedGame } from '../lib/game/simulation';
+import { measure, type BenchReport, type BenchResult } from './lib/measure';
+import { ensureQuestions, ensureUsers } from './lib/seed';
+
+const __dirname = dirname(fileURLToPath(import.meta.url));
+
+// Usage: bench [--lobbies=6,50,200] [--iterations=200] [--history=20] [--questions=500] [--out=bench/results/latest.json]
+//   Seeds the configured (local!) database with bench users, questions and
+//   games, then times the engine's hot paths at each lobby size.
+function parseArgs(argv: string[]) {
+  const flags = new Map<string, string>();
+  for (const arg of argv) {
+    const [key, ...value] = arg.replace(/^--/, '').split('=');
+    flags.set(key, value.join('='));
+  }
+  const num = (key: string, fallback: number) => (flags.has(key) ? Number(flags.get(key)) : fallback);
+  return {
+    lobbies: (flags.get('lobbies') ?? '6,50,200').split(',').map(Number),
+    iterations: num('iterations', 200),
+    history: num('history', 20), // Finished games seeded for the global leaderboard
+    questions: num('questions', 500),
+    outPath: resolve(flags.get('out') || resolve(__dirname, 'results/latest.json')),
+  };
+}
+
+async function runBenchmarks() {
+  if (process.env.NODE_ENV === 'production') {
+    console.error('Refusing to benchmark against a production database');
+    process.exit(1);
+  }
+
+  const { outPath, ...options } = parseArgs(process.argv.slice(2));
+  const { lobbies, iterations, history, questions } = options;
+  if (lobbies.some((n) => !Number.isInteger(n) || n < 2) || !(iterations > 0)) {
+    console.error('Invalid arguments (lobby sizes must be integers >= 2)');
+    process.exit(1);
+  }
+
+  // Frozen unless a seeding step advances it, so question phases never expire mid-run
+  const clock = new VirtualClock();
+  setClock(clock);
+  const rules = resolveGameRules();
+
+  // ── Seed ────────────────────────────────────────────────────────
+  console.log('Seeding...');
+  const added = await ensureQuestions(questions);
+  const maxLobby = Math.max(...lobbies);
+  const userIds = await ensureUsers('bench_user', maxLobby + 1);
+  const spectatorId = userIds[maxLobby]; // Never a participant
+  console.log(`  ${added} question(s) added, ${userIds.length} bench users`);
+
+  for (let g = 0; g < history; g++) {
+    const players = userIds.slice(0, lobbies[g % lobbies.length]);
+    const gameId = await initializeGame(players);
+    await playSimulatedGame(gameId, players, clock, { rules });
+  }
+  console.log(`  ${history} finished game(s) played`);
+
+  const results: BenchResult[] = [];
+
+  // ── Per lobby size ──────────────────────────────────────────────
+  for (const lobby of lobbies) {
+    console.log(`\nLobby of ${lobby}`);
+    const players = userIds.slice(0, lobby);
+
+    // Finished game for the results endpoint and log replay
+    const finishedId = await initializeGame(players);
+    await playSimulatedGame(finishedId, players, clock, { rules });
+
+    results.push(await measure(`getGameResults (${lobby})`, () => getGameResults(finishedId), { iterations }));
+
+    const replay = (await loadGameReplay(finishedId))!;
+    const events = await loadGameEvents(finishedId);
+    results.push(await measure(`loadGameEvents (${lobby})`, () => loadGameEvents(finishedId), { iterations }));
+    results.push(await measure(
+      `replay fold + project (${lobby})`,
+      () => projectGameState(foldGameEvents(finishedId, events)!, players[0], replay.refs),
+      { iterations }
+    ));
+
+    // Live game mid-question: half the lobby has answered
+    const liveId = await initializeGame(players);
+    for (const userId of players.slice(0, Math.floor(lobby / 2))) {
+      await submitAnswer(liveId, userId, 0);
+    }
+
+    results.push(await measure(
+      `resolveGameState participant (${lobby})`,
+      (i) => resolveGameState(liveId, players[Math.abs(i) % lobby]),
+      { iterations }
+    ));
+    results.push(await measure(
+      `resolveGameState spectator (${lobby})`,
+      () => resolveGameState(liveId, spectatorId),
+      { iterations }
+    ));
+    results.push(await measure(`getLeaderboard (${lobby})`, () => getLeaderboard(liveId), { iterations }));
+
+    // submitAnswer needs a fresh (game, player) pair per call; the last
+    // answer of each game also pays for the transition to summary
+    const answerGames: number[] = [];
+    for (let g = 0; g < Math.ceil(iterations / lobby); g++) {
+      answerGames.push(await initializeGame(players));
+    }
+    results.push(await measure(
+      `submitAnswer (${lobby})`,
+      (i) => submitAnswer(answerGames[Math.floor(i / lobby)], players[i % lobby], i % 4),
+      { iterations, warmup: 0 }
+    ));
+
+    for (const gameId of [liveId, ...answerGames]) {
+      await finishGame(gameId);
+    }
+  }
+
+  // ── Global ──────────────────────────────────────────────────────
+  console.log('\nGlobal');
+  results.push(await measure('getGlobalLeaderboard', () => getGlobalLeaderboard(), { iterations }));
+  results.push(await measure('selectQuestionsForGame', () => selectQuestionsForGame(), { iterations }));
+
+  const report: BenchReport = {
+    createdAt: new Date().toISOString(),
+    node: process.version,
+    options,
+    results,
+  };
+  mkdirSync(dirname(outPath), { recursive: true });
+  writeFileSync(outPath, JSON.stringify(report, null, 2) + '\n');
+  console.log(`\nWrote ${results.length} result(s) to ${outPath}`);
+
+  process.exit(0);
+}
+
+runBenchmarks();
@@ -0,0 +1,13 @@
+"""
+Headless bot players for end-to-end games at scale.
+
+Each bot is a coroutine that follows /api/game/stream and answers through
+/api/game/answer, so one process can drive hundreds of players. Run a swarm
+with `python -m bots` (see bots/__main__.py).
+"""
+
+from .player import AnswerRecord, BotPlayer
+from .think import ThinkTime, parse_think_time
+from .verify import verify_results
+
+__all__ = ["AnswerRecord", "BotPlayer", "ThinkTime", "parse_think_time", "verify_results"]
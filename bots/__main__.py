@@ -0,0 +1,176 @@
+"""
+Run a swarm of bot players against a local server.
+
+    python -m bots --players=1000 --start --think=lognormal:1.5,0.5 --accuracy=0.6
+
+Bots are provisioned straight in the database (testsprite_tests/provisioning.py)
+and, with --login, log in through /api/auth/login with the shared password.
+Each bot opens /api/game/stream, which also marks it online. Once every bot
+is connected (or has failed to connect), --start asks the admin (TEST_ADMIN_SESSION, or ADMIN_USERNAME /
+ADMIN_PASSWORD) to start a game. The bots play it to the end, then the final
+/api/game/{id}/results is checked against every bot's local score tracking.
+Exits 1 on any mismatch or bot error.
+
+--accuracy needs the answer key, which is read from the questions table.
+Without it, bots answer at random.
+
+Requires `aiohttp` and `psycopg` (plus `argon2-cffi` for --login).
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import aiohttp
+import psycopg
+
+from .player import SESSION_COOKIE_NAME, BotPlayer
+from .think import parse_think_time
+from .verify import verify_results
+
+# provisioning.py lives with the Python tests
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "testsprite_tests"))
+from provisioning import database_url, delete_provisioned_users, provision_users, random_prefix  # noqa: E402
+
+BASE_URL = os.environ.get("BASE_URL", "http://localhost:3000")
+
+
+def load_answer_key(conn):
+    """question id -> correct answer text (original order; matched by text after shuffling)."""
+    with conn.cursor() as cur:
+        cur.execute("SELECT id, answers ->> correct_index FROM questions")
+        return dict(cur.fetchall())
+
+
+async def login(http, username, password):
+    async with http.post(f"{BASE_URL}/api/auth/login", json={"username": username, "password": password}) as resp:
+        if resp.status != 200:
+            raise RuntimeError(f"Login as '{username}' failed: {resp.status} {await resp.text()}")
+        return resp.cookies[SESSION_COOKIE_NAME].value
+
+
+async def admin_session(http):
+    return os.environ.get("TEST_ADMIN_SESSION") or await login(
+        http, os.environ.get("ADMIN_USERNAME", "admin"), os.environ.get("ADMIN_PASSWORD", "changeme")
+    )
+
+
+async def start_game(http):
+    session_id = await admin_session(http)
+    async with http.post(
+        f"{BASE_URL}/api/game/start",
+        headers={"Cookie": f"{SESSION_COOKIE_NAME}={session_id}"},
+    ) as resp:
+        body = await resp.json(content_type=None)
+        if resp.status != 201:
+            raise RuntimeError(f"Could not start a game: {resp.status} {body}")
+        return body["gameId"]
+
+
+async def run_swarm(bots, args):
+    connector = aiohttp.TCPConnector(limit=0)  # One stream per bot, plus their answers
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=30)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout, cookie_jar=aiohttp.DummyCookieJar()) as http:
+        if args.login:
+            logins = [login(http, bot.username, args.password) for bot in bots]
+            for bot, session_id in zip(bots, await asyncio.gather(*logins)):
+                bot.session_id = session_id
+
+        async def play(bot, delay):
+            await asyncio.sleep(delay)
+            await bot.play(http, BASE_URL)
+
+        # Spread the connections over --ramp seconds
+        tasks = [
+            asyncio.create_task(play(bot, args.ramp * i / len(bots)))
+            for i, bot in enumerate(bots)
+        ]
+        # A bot sets `connected` on its first frame or when its stream fails
+        await asyncio.wait_for(asyncio.gather(*(bot.connected.wait() for bot in bots)), args.timeout)
+        failed = sum(1 for bot in bots if bot.errors)
+        print(f"{len(bots) - failed} bot(s) connected, {failed} failed")
+        if failed == len(bots):
+            return ["No bot could open the game stream"]
+
+        if args.start:
+            game_id = await start_game(http)
+            print(f"Started game {game_id}")
+
+        started = time.perf_counter()
+        await asyncio.wait_for(asyncio.gather(*tasks), args.timeout)
+        print(f"Game played in {time.perf_counter() - started:.1f}s")
+
+        game_ids = {bot.game_id for bot in bots if bot.game_id is not None}
+        if len(game_ids) != 1:
+            return [f"Bots saw {len(game_ids)} game(s): {sorted(game_ids)}"]
+        [game_id] = game_ids
+        async with http.get(
+            f"{BASE_URL}/api/game/{game_id}/results",
+            headers={"Cookie": f"{SESSION_COOKIE_NAME}={bots[0].session_id}"},
+        ) as resp:
+            results = await resp.json()
+        return verify_results(results, bots)
+
+
+def report(bots, mismatches):
+    answers = [record for bot in bots for record in bot.answers.values()]
+    answered = [record for record in answers if record.answer_index is not None]
+    latencies = sorted(latency for bot in bots for latency in bot.answer_latencies)
+    print(f"Answers: {len(answered)} sent, {len(answers) - len(answered)} timed out")
+    if latencies:
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        print(f"Answer latency: p50 {statistics.median(latencies) * 1000:.0f}ms, p95 {p95 * 1000:.0f}ms")
+    if answered:
+        print(f"Accuracy: {sum(r.is_correct for r in answered) / len(answered):.0%}")
+
+    errors = [f"{bot.username}: {error}" for bot in bots for error in bot.errors]
+    for line in (errors + mismatches)[:50]:
+        print(f"  ✗ {line}")
+    print(f"{len(errors)} bot error(s), {len(mismatches)} result mismatch(es)")
+    return 1 if errors or mismatches else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m bots", description="Headless bot players")
+    parser.add_argument("--players", type=int, default=100)
+    parser.add_argument("--think", type=parse_think_time, default=parse_think_time("uniform:1,10"),
+                        help="think-time distribution in seconds (default uniform:1,10)")
+    parser.add_argument("--accuracy", type=float, default=0.5, help="chance of picking the right answer")
+    parser.add_argument("--start", action="store_true", help="start a game once every bot is connected")
+    parser.add_argument("--login", action="store_true", help="log in through the API instead of reusing provisioned sessions")
+    parser.add_argument("--password", default="Password123!", help="password of the provisioned bots")
+    parser.add_argument("--ramp", type=float, default=5.0, help="seconds over which bots connect")
+    parser.add_argument("--timeout", type=float, default=900.0, help="seconds to wait for the game to finish")
+    parser.add_argument("--seed", type=int, help="seed for reproducible think times and picks")
+    args = parser.parse_args()
+
+    if args.players < 1 or not 0 <= args.accuracy <= 1:
+        parser.error("--players must be positive and --accuracy between 0 and 1")
+
+    rng = random.Random(args.seed)
+    prefix = random_prefix()
+    with psycopg.connect(database_url()) as conn:
+        answer_key = load_answer_key(conn)
+        users = provision_users(conn, args.players, prefix=prefix, password=args.password if args.login else None)
+        try:
+            bots = [
+                BotPlayer(
+                    user.id, user.username, user.session_id, args.think, args.accuracy, answer_key,
+                    random.Random(rng.random()),
+                )
+                for user in users
+            ]
+            mismatches = asyncio.run(run_swarm(bots, args))
+        finally:
+            conn.rollback()
+            delete_provisioned_users(conn, prefix)
+    return report(bots, mismatches)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""One bot: follows the game stream and answers like a (configurable) player."""
+
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass, field
+
+from .think import ThinkTime
+
+SESSION_COOKIE_NAME = "auth_session"
+
+
+@dataclass
+class AnswerRecord:
+    question_index: int
+    question_id: int
+    answer_index: int | None  # Display index; None = timed out
+    is_correct: bool
+    points: int
+    expected_correct: bool | None = None  # From the answer key, when known
+
+
+@dataclass
+class BotPlayer:
+    user_id: int
+    username: str
+    session_id: str
+    think: ThinkTime
+    accuracy: float = 0.25
+    answer_key: dict = field(default_factory=dict, repr=False)  # question id -> correct answer text
+    rng: random.Random = field(default_factory=random.Random, repr=False)
+
+    game_id: int | None = None
+    answers: dict = field(default_factory=dict)  # question index -> AnswerRecord
+    answer_latencies: list = field(default_factory=list, repr=False)  # Seconds per POST /api/game/answer
+    clock_offset_ms: float | None = None  # Server minus local clock (lower bound)
+    connected: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+    errors: list = field(default_factory=list)
+
+    @property
+    def score(self):
+        return sum(record.points for record in self.answers.values())
+
+    def server_now(self):
+        return time.time() * 1000 + (self.clock_offset_ms or 0)
+
+    def choose(self, question):
+        """Display index to pick: the right one with probability `accuracy` when the key knows it."""
+        answers = question["answers"]
+        correct_text = self.answer_key.get(question["id"])
+        if correct_text not in answers:
+            return self.rng.randrange(len(answers)), None
+        correct = answers.index(correct_text)
+        if self.rng.random() < self.accuracy:
+            return correct, True
+        return self.rng.choice([i for i in range(len(answers)) if i != correct]), False
+
+    async def answer(self, http, base_url, state):
+        index = state["currentQuestionIndex"]
+        question = state["question"]
+        think_ms = self.think.sample(self.rng) * 1000
+        remaining_ms = state["deadline"] - self.server_now()
+
+        if think_ms >= remaining_ms:
+            # Too slow: the server records the timeout when the phase ends
+            self.answers[index] = AnswerRecord(index, question["id"], None, False, 0)
+            return
+        await asyncio.sleep(think_ms / 1000)
+
+        choice, expected_correct = self.choose(question)
+        started = time.perf_counter()
+        async with http.post(
+            f"{base_url}/api/game/answer",
+            json={"answerIndex": choice},
+            headers={"Cookie": f"{SESSION_COOKIE_NAME}={self.session_id}"},
+        ) as resp:
+            body = await resp.json(content_type=None)
+        self.answer_latencies.append(time.perf_counter() - started)
+
+        if resp.status == 200:
+            self.answers[index] = AnswerRecord(
+                index, question["id"], choice, body["isCorrect"], body["pointsAwarded"], expected_correct
+            )
+        elif resp.status == 409:
+            # Lost the race with the deadline
+            self.answers[index] = AnswerRecord(index, question["id"], None, False, 0)
+        else:
+            self.errors.append(f"answer q{index}: {resp.status} {body}")
+
+    async def answer_safely(self, http, base_url, state):
+        try:
+            await self.answer(http, base_url, state)
+        except Exception as error:  # Keep following the stream
+            self.errors.append(f"answer q{state['currentQuestionIndex']}: {error!r}")
+
+    async def play(self, http, base_url):
+        """Follow /api/game/stream until the game this bot plays in finishes."""
+        pending = set()
+        seen = set()
+        try:
+            async with http.get(
+                f"{base_url}/api/game/stream",
+                headers={"Cookie": f"{SESSION_COOKIE_NAME}={self.session_id}", "Accept": "text/event-stream"},
+            ) as resp:
+                if resp.status != 200:
+                    self.errors.append(f"stream: {resp.status}")
+                    return
+
+                async for raw in resp.content:
+                    line = raw.decode().strip()
+                    if not line.startswith("data: "):
+                        continue
+                    message = json.loads(line[len("data: "):])
+                    if message["type"] == "error":
+                        self.errors.append(f"stream: {message['error']}")
+                        break
+                    if message.get("serverTime") is not None:
+                        offset = message["serverTime"] - time.time() * 1000
+                        self.clock_offset_ms = offset if self.clock_offset_ms is None else max(self.clock_offset_ms, offset)
+                    self.connected.set()
+
+                    state = message["data"]
+                    if state["phase"] == "question" and state["isParticipant"]:
+                        self.game_id = state["gameId"]
+                        index = state["currentQuestionIndex"]
+                        if not state["hasAnswered"] and index not in seen:
+                            seen.add(index)
+                            task = asyncio.create_task(self.answer_safely(http, base_url, state))
+                            pending.add(task)
+                            task.add_done_callback(pending.discard)
+                    elif state["phase"] == "finished" and state["gameId"] == self.game_id:
+                        break
+        except Exception as error:  # Connection refused, reset, bad frame...
+            self.errors.append(f"stream: {error!r}")
+        finally:
+            # Whoever waits for the swarm to connect must not wait on a dead bot
+            self.connected.set()
+
+        await asyncio.gather(*pending)
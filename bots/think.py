@@ -0,0 +1,45 @@
+"""Think-time distributions: how long a bot waits before answering."""
+
+import random
+from dataclasses import dataclass
+
+KINDS = ("fixed", "uniform", "normal", "lognormal", "exponential")
+
+
+@dataclass(frozen=True)
+class ThinkTime:
+    kind: str
+    a: float
+    b: float = 0.0
+
+    def sample(self, rng=random):
+        """Seconds to wait (never negative)."""
+        if self.kind == "fixed":
+            value = self.a
+        elif self.kind == "uniform":
+            value = rng.uniform(self.a, self.b)
+        elif self.kind == "normal":
+            value = rng.gauss(self.a, self.b)
+        elif self.kind == "lognormal":
+            value = rng.lognormvariate(self.a, self.b)
+        else:
+            value = rng.expovariate(1 / self.a)
+        return max(0.0, value)
+
+
+def parse_think_time(spec):
+    """
+    Parse `kind:params` (seconds):
+
+        fixed:2  uniform:1,10  normal:5,2  lognormal:1.2,0.6  exponential:4
+    """
+    kind, _, params = spec.partition(":")
+    if kind not in KINDS:
+        raise ValueError(f"Unknown think-time distribution '{kind}' (expected one of {', '.join(KINDS)})")
+    values = [float(v) for v in params.split(",") if v]
+    expected = 1 if kind in ("fixed", "exponential") else 2
+    if len(values) != expected:
+        raise ValueError(f"'{kind}' takes {expected} parameter(s), got '{params}'")
+    if kind == "exponential" and values[0] <= 0:
+        raise ValueError("'exponential' needs a positive mean")
+    return ThinkTime(kind, *values)
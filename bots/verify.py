@@ -0,0 +1,42 @@
+"""Check the server's final results against what each bot tracked locally."""
+
+
+def verify_results(results, bots):
+    """
+    Compare GET /api/game/{id}/results with the bots' own records.
+    Returns a list of human-readable mismatches (empty when everything agrees).
+    """
+    mismatches = []
+    scores = {entry["userId"]: entry["score"] for entry in results["leaderboard"]}
+    by_question = {
+        q["index"]: (q, {r["userId"]: r for r in q["playerResults"]})
+        for q in results["questions"]
+    }
+
+    for bot in bots:
+        if bot.game_id is None:
+            mismatches.append(f"{bot.username}: never saw a question")
+            continue
+        if scores.get(bot.user_id) != bot.score:
+            mismatches.append(f"{bot.username}: score {scores.get(bot.user_id)} on the server, {bot.score} locally")
+
+        for index, record in sorted(bot.answers.items()):
+            question, player_results = by_question.get(index, (None, {}))
+            server = player_results.get(bot.user_id)
+            if server is None:
+                mismatches.append(f"{bot.username} q{index}: no answer on the server")
+                continue
+            if server["answerIndex"] != record.answer_index:
+                mismatches.append(
+                    f"{bot.username} q{index}: answer {server['answerIndex']} on the server, {record.answer_index} locally"
+                )
+            if server["isCorrect"] != record.is_correct or server["pointsAwarded"] != record.points:
+                mismatches.append(
+                    f"{bot.username} q{index}: {server['isCorrect']}/{server['pointsAwarded']} pts on the server,"
+                    f" {record.is_correct}/{record.points} locally"
+                )
+            if record.answer_index is not None and (record.answer_index == question["correctIndex"]) != record.is_correct:
+                mismatches.append(f"{bot.username} q{index}: isCorrect disagrees with the revealed correct answer")
+            if record.expected_correct is not None and record.expected_correct != record.is_correct:
+                mismatches.append(f"{bot.username} q{index}: answer key expected isCorrect={record.expected_correct}")
+    return mismatches
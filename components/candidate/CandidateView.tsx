@@ -12,8 +12,9 @@ interface Props {
 }
 
 export default function CandidateView({ currentUserId, username }: Props) {
-  useHeartbeat();
-  const { gameState, error: sseError, refetch } = useGameSSE();
+  const { gameState, error: sseError, submitAnswer, connected } = useGameSSE();
+  // An open stream already counts as presence; heartbeat only without one
+  useHeartbeat({ enabled: !connected });
 
   if (!gameState) {
     return (
@@ -54,7 +55,7 @@ export default function CandidateView({ currentUserId, username }: Props) {
         <GamePlay
           gameState={gameState}
           userId={currentUserId}
-          refetch={refetch}
+          submitAnswer={submitAnswer}
         />
       ) : (
         <SpectatorView gameState={gameState} />
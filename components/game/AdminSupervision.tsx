@@ -73,7 +73,7 @@ export default function AdminSupervision({ gameId }: Props) {
         {gameState.phase === 'question' && (
           <div className="animate-fade-in-up">
             <TimerDisplay
-              serverTimeRemainingMs={gameState.timeRemainingMs}
+              deadline={gameState.deadline}
               totalSeconds={GAME_CONFIG.QUESTION_TIME_LIMIT_SECONDS}
             />
 
@@ -113,7 +113,7 @@ export default function AdminSupervision({ gameId }: Props) {
         {gameState.phase === 'summary' && (
           <SummaryPhase
             summary={gameState.summary}
-            timeRemainingMs={gameState.timeRemainingMs}
+            deadline={gameState.deadline}
           />
         )}
 
@@ -122,6 +122,8 @@ export default function AdminSupervision({ gameId }: Props) {
           <Leaderboard
             entries={gameState.leaderboard}
             currentUserId={-1}
+            totalEntries={gameState.leaderboardSize}
+            gameId={gameState.gameId}
           />
         )}
 
@@ -27,6 +27,8 @@ interface QuestionResult {
     username: string;
     answerIndex: number | null;
     isCorrect: boolean;
+    pointsAwarded: number;
+    elapsedMs: number | null;
   }[];
 }
 
@@ -493,6 +495,7 @@ export default function FinishedPhase({
                                   ? 'sin respuesta'
                                   : answerLabels[pr.answerIndex]}
                                 {pr.isCorrect ? ' \u2713' : pr.answerIndex !== null ? ' \u2717' : ''}
+                                {pr.elapsedMs !== null && ` · ${(pr.elapsedMs / 1000).toFixed(1)}s`}
                               </span>
                             ))}
                           </div>
@@ -11,30 +11,18 @@ import type { GameStateResponse } from '@/lib/game/types';
 interface Props {
   gameState: GameStateResponse;
   userId: number;
-  refetch: () => Promise<void>;
+  submitAnswer: (answerIndex: number) => Promise<boolean>;
 }
 
-export default function GamePlay({ gameState, userId, refetch }: Props) {
+export default function GamePlay({ gameState, userId, submitAnswer }: Props) {
   const { addToast } = useToast();
 
   const handleSubmitAnswer = async (answerIndex: number): Promise<boolean> => {
-    try {
-      const res = await fetch('/api/game/answer', {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ answerIndex }),
-      });
-
-      if (res.ok) {
-        await refetch();
-        return true;
-      }
-      addToast('error', 'Error al enviar respuesta');
-      return false;
-    } catch {
+    const ok = await submitAnswer(answerIndex);
+    if (!ok) {
       addToast('error', 'Error al enviar respuesta');
-      return false;
     }
+    return ok;
   };
 
   if (gameState.phase === 'idle') return null;
@@ -53,7 +41,7 @@ export default function GamePlay({ gameState, userId, refetch }: Props) {
       {gameState.phase === 'question' && (
         <QuestionPhase
           question={gameState.question}
-          timeRemainingMs={gameState.timeRemainingMs}
+          deadline={gameState.deadline}
           hasAnswered={gameState.hasAnswered}
           selectedAnswerIndex={gameState.selectedAnswerIndex}
           answeredCount={gameState.answeredCount}
@@ -65,7 +53,7 @@ export default function GamePlay({ gameState, userId, refetch }: Props) {
       {gameState.phase === 'summary' && (
         <SummaryPhase
           summary={gameState.summary}
-          timeRemainingMs={gameState.timeRemainingMs}
+          deadline={gameState.deadline}
         />
       )}
 
@@ -82,6 +70,8 @@ export default function GamePlay({ gameState, userId, refetch }: Props) {
         <Leaderboard
           entries={gameState.leaderboard}
           currentUserId={userId}
+          totalEntries={gameState.leaderboardSize}
+          gameId={gameState.gameId}
         />
       )}
     </>
@@ -1,16 +1,52 @@
 'use client';
 
-import type { LeaderboardEntry } from '@/lib/game/types';
+import { Fragment, useState } from 'react';
+import { GAME_CONFIG } from '@/lib/game/config';
+import type { LeaderboardEntry, LeaderboardPage } from '@/lib/game/types';
 
 interface Props {
   entries: LeaderboardEntry[];
   currentUserId: number;
+  // Full board size; when larger than entries, entries is a window (top N + own rank)
+  totalEntries?: number;
+  gameId?: number;
 }
 
-export default function Leaderboard({ entries, currentUserId }: Props) {
+const rankColors: Record<number, string> = {
+  1: 'text-yellow-400',
+  2: 'text-cyan-400',
+  3: 'text-purple-400',
+};
+
+export default function Leaderboard({ entries, currentUserId, totalEntries, gameId }: Props) {
+  const [fullBoard, setFullBoard] = useState<LeaderboardEntry[] | null>(null);
+  const [fullTotal, setFullTotal] = useState(0);
+  const [loading, setLoading] = useState(false);
+
   if (entries.length === 0) return null;
 
-  const maxScore = Math.max(...entries.map((e) => e.score), 1);
+  const isWindowed = totalEntries !== undefined && totalEntries > entries.length;
+  const shown = fullBoard ?? entries;
+  const maxScore = Math.max(...shown.map((e) => e.score), 1);
+
+  const loadPage = async (offset: number) => {
+    if (gameId === undefined || loading) return;
+    setLoading(true);
+    try {
+      const res = await fetch(
+        `/api/game/${gameId}/leaderboard?offset=${offset}&limit=${GAME_CONFIG.LEADERBOARD_PAGE_SIZE}`
+      );
+      if (res.ok) {
+        const page: LeaderboardPage = await res.json();
+        setFullBoard((prev) => (offset === 0 ? page.entries : [...(prev ?? []), ...page.entries]));
+        setFullTotal(page.total);
+      }
+    } catch {
+      // Keep showing the windowed view
+    } finally {
+      setLoading(false);
+    }
+  };
 
   return (
     <div className="mt-6">
@@ -18,50 +54,84 @@ export default function Leaderboard({ entries, currentUserId }: Props) {
         Clasificación
       </h3>
       <div className="space-y-2">
-        {entries.map((entry, index) => {
+        {shown.map((entry, index) => {
           const isMe = entry.userId === currentUserId;
-          const rankColors: Record<number, string> = {
-            1: 'text-yellow-400',
-            2: 'text-cyan-400',
-            3: 'text-purple-400',
-          };
           const rankColor = rankColors[entry.rank] || 'text-gray-500';
+          // Windowed boards skip ranks between the top N and the player's neighborhood
+          const hasGap = index > 0 && entry.rank > shown[index - 1].rank + 1;
 
           return (
-            <div
-              key={entry.userId}
-              className={`flex items-center gap-3 p-2 rounded card-hover-lift animate-stagger-in ${
-                isMe
-                  ? 'bg-cyan-500/10 border border-cyan-500/30'
-                  : 'bg-gray-800/50'
-              }`}
-              style={{ '--i': index } as React.CSSProperties}
-            >
-              <span
-                className={`font-mono font-bold w-6 text-center ${rankColor}`}
+            <Fragment key={entry.userId}>
+              {hasGap && (
+                <div className="text-center text-gray-600 text-sm leading-none">···</div>
+              )}
+              <div
+                className={`flex items-center gap-3 p-2 rounded card-hover-lift animate-stagger-in ${
+                  isMe
+                    ? 'bg-cyan-500/10 border border-cyan-500/30'
+                    : 'bg-gray-800/50'
+                }`}
+                style={{ '--i': index } as React.CSSProperties}
               >
-                {entry.rank}
-              </span>
-              <span
-                className={`flex-1 text-sm ${isMe ? 'text-white font-semibold' : 'text-gray-300'}`}
-              >
-                {entry.username}
-              </span>
-              <div className="flex-1 h-1.5 bg-gray-800 rounded-full overflow-hidden">
-                <div
-                  className="h-full bg-gradient-to-r from-cyan-500 to-purple-500 transition-all duration-500 rounded-full"
-                  style={{
-                    width: `${(entry.score / maxScore) * 100}%`,
-                  }}
-                />
+                <span
+                  className={`font-mono font-bold w-6 text-center ${rankColor}`}
+                >
+                  {entry.rank}
+                </span>
+                <span
+                  className={`flex-1 text-sm ${isMe ? 'text-white font-semibold' : 'text-gray-300'}`}
+                >
+                  {entry.username}
+                </span>
+                <div className="flex-1 h-1.5 bg-gray-800 rounded-full overflow-hidden">
+                  <div
+                    className="h-full bg-gradient-to-r from-cyan-500 to-purple-500 transition-all duration-500 rounded-full"
+                    style={{
+                      width: `${(entry.score / maxScore) * 100}%`,
+                    }}
+                  />
+                </div>
+                <span className="font-mono text-sm text-yellow-400 w-16 text-right">
+                  {(entry.score / 10).toFixed(1)}
+                </span>
               </div>
-              <span className="font-mono text-sm text-yellow-400 w-16 text-right">
-                {(entry.score / 10).toFixed(1)}
-              </span>
-            </div>
+            </Fragment>
           );
         })}
       </div>
+
+      {/* Full board on demand (paginated) */}
+      {isWindowed && gameId !== undefined && (
+        <div className="mt-3 flex items-center justify-center gap-4 text-xs">
+          {fullBoard === null ? (
+            <button
+              onClick={() => loadPage(0)}
+              disabled={loading}
+              className="text-cyan-400 hover:text-cyan-300 cursor-pointer disabled:opacity-50"
+            >
+              Ver clasificación completa ({totalEntries})
+            </button>
+          ) : (
+            <>
+              {fullBoard.length < fullTotal && (
+                <button
+                  onClick={() => loadPage(fullBoard.length)}
+                  disabled={loading}
+                  className="text-cyan-400 hover:text-cyan-300 cursor-pointer disabled:opacity-50"
+                >
+                  Cargar más ({fullBoard.length}/{fullTotal})
+                </button>
+              )}
+              <button
+                onClick={() => setFullBoard(null)}
+                className="text-gray-500 hover:text-gray-300 cursor-pointer"
+              >
+                Ocultar
+              </button>
+            </>
+          )}
+        </div>
+      )}
     </div>
   );
 }
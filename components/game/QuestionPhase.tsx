@@ -1,8 +1,9 @@
 'use client';
 
-import { useState } from 'react';
+import { useState, useEffect } from 'react';
 import TimerDisplay from './TimerDisplay';
 import { GAME_CONFIG } from '@/lib/game/config';
+import { serverNow } from '@/lib/game/server-clock';
 import { NeuralNetworkIcon } from '@/components/icons';
 
 interface Question {
@@ -15,7 +16,7 @@ interface Question {
 
 interface Props {
   question: Question;
-  timeRemainingMs: number;
+  deadline: number;
   hasAnswered: boolean;
   selectedAnswerIndex: number | null;
   answeredCount: number;
@@ -33,7 +34,7 @@ const answerLabels = ['A', 'B', 'C', 'D'];
 
 export default function QuestionPhase({
   question,
-  timeRemainingMs,
+  deadline,
   hasAnswered,
   selectedAnswerIndex,
   answeredCount,
@@ -42,9 +43,19 @@ export default function QuestionPhase({
 }: Props) {
   const [submitting, setSubmitting] = useState(false);
   const [localSelectedIndex, setLocalSelectedIndex] = useState<number | null>(null);
+  const [expired, setExpired] = useState(() => serverNow() >= deadline);
+
+  // Lock the answers when the synced clock reaches the deadline, without waiting for a frame
+  useEffect(() => {
+    const remaining = deadline - serverNow();
+    setExpired(remaining <= 0);
+    if (remaining <= 0) return;
+    const timeout = setTimeout(() => setExpired(true), remaining);
+    return () => clearTimeout(timeout);
+  }, [deadline]);
 
   const handleAnswer = async (index: number) => {
-    if (hasAnswered || submitting) return;
+    if (hasAnswered || submitting || expired) return;
     setSubmitting(true);
     setLocalSelectedIndex(index);
     const ok = await onSubmitAnswer(index);
@@ -54,13 +65,13 @@ export default function QuestionPhase({
     }
   };
 
-  const effectiveHasAnswered = hasAnswered || submitting;
+  const effectiveHasAnswered = hasAnswered || submitting || expired;
   const effectiveSelectedIndex = selectedAnswerIndex ?? localSelectedIndex;
 
   return (
     <div className="animate-fade-in-up">
       <TimerDisplay
-        serverTimeRemainingMs={timeRemainingMs}
+        deadline={deadline}
         totalSeconds={GAME_CONFIG.QUESTION_TIME_LIMIT_SECONDS}
       />
 
@@ -130,6 +141,8 @@ export default function QuestionPhase({
           <span className="text-cyan-400/70">
             Enviando...
           </span>
+        ) : expired ? (
+          <span className="text-gray-500 italic">Tiempo agotado</span>
         ) : (
           <span>Selecciona tu respuesta</span>
         )}
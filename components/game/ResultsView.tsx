@@ -16,6 +16,8 @@ interface QuestionResult {
     username: string;
     answerIndex: number | null;
     isCorrect: boolean;
+    pointsAwarded: number;
+    elapsedMs: number | null;
   }[];
 }
 
@@ -145,6 +147,7 @@ export default function ResultsView({
                       {pr.answerIndex === null
                         ? 'sin respuesta'
                         : answerLabels[pr.answerIndex]}
+                      {pr.elapsedMs !== null && ` · ${(pr.elapsedMs / 1000).toFixed(1)}s`}
                     </span>
                   ))}
                 </div>
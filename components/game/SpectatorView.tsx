@@ -50,7 +50,7 @@ export default function SpectatorView({ gameState }: Props) {
       {gameState.phase === 'question' && (
         <div className="animate-fade-in-up">
           <TimerDisplay
-            serverTimeRemainingMs={gameState.timeRemainingMs}
+            deadline={gameState.deadline}
             totalSeconds={GAME_CONFIG.QUESTION_TIME_LIMIT_SECONDS}
           />
 
@@ -88,7 +88,7 @@ export default function SpectatorView({ gameState }: Props) {
       {gameState.phase === 'summary' && (
         <SummaryPhase
           summary={gameState.summary}
-          timeRemainingMs={gameState.timeRemainingMs}
+          deadline={gameState.deadline}
         />
       )}
 
@@ -106,6 +106,8 @@ export default function SpectatorView({ gameState }: Props) {
         <Leaderboard
           entries={gameState.leaderboard}
           currentUserId={-1}
+          totalEntries={gameState.leaderboardSize}
+          gameId={gameState.gameId}
         />
       )}
     </>
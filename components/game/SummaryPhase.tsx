@@ -13,16 +13,16 @@ interface Summary {
 
 interface Props {
   summary: Summary;
-  timeRemainingMs: number;
+  deadline: number;
 }
 
 const answerLabels = ['A', 'B', 'C', 'D'];
 
-export default function SummaryPhase({ summary, timeRemainingMs }: Props) {
+export default function SummaryPhase({ summary, deadline }: Props) {
   return (
     <div className="animate-fade-in-up">
       <TimerDisplay
-        serverTimeRemainingMs={timeRemainingMs}
+        deadline={deadline}
         totalSeconds={GAME_CONFIG.SUMMARY_DISPLAY_SECONDS}
       />
 
@@ -82,6 +82,14 @@ export default function SummaryPhase({ summary, timeRemainingMs }: Props) {
                       {answerLabels[result.answerIndex!]} ✗
                     </span>
                   )}
+                  {result.elapsedMs !== null && (
+                    <span className="text-gray-500 text-xs ml-2">
+                      {(result.elapsedMs / 1000).toFixed(1)}s
+                    </span>
+                  )}
+                  {result.pointsAwarded > 0 && (
+                    <span className="text-yellow-400 text-xs ml-2">+{(result.pointsAwarded / 10).toFixed(1)}</span>
+                  )}
                 </span>
               </div>
             );
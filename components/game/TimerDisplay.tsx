@@ -1,34 +1,26 @@
 'use client';
 
-import { useState, useEffect, useRef } from 'react';
+import { useState, useEffect } from 'react';
+import { serverNow } from '@/lib/game/server-clock';
 
 interface Props {
-  serverTimeRemainingMs: number;
+  deadline: number; // Epoch ms on the server clock
   totalSeconds: number;
 }
 
 export default function TimerDisplay({
-  serverTimeRemainingMs,
+  deadline,
   totalSeconds,
 }: Props) {
-  const [displayMs, setDisplayMs] = useState(serverTimeRemainingMs);
-  const lastSyncRef = useRef(Date.now());
+  const [displayMs, setDisplayMs] = useState(() => Math.max(0, deadline - serverNow()));
 
-  // Resync when server value changes
+  // Count down locally; frames only arrive when the state actually changes
   useEffect(() => {
-    setDisplayMs(serverTimeRemainingMs);
-    lastSyncRef.current = Date.now();
-  }, [serverTimeRemainingMs]);
-
-  // Smooth countdown between polls
-  useEffect(() => {
-    const interval = setInterval(() => {
-      const elapsed = Date.now() - lastSyncRef.current;
-      const remaining = Math.max(0, serverTimeRemainingMs - elapsed);
-      setDisplayMs(remaining);
-    }, 100);
+    const tick = () => setDisplayMs(Math.max(0, deadline - serverNow()));
+    tick();
+    const interval = setInterval(tick, 100);
     return () => clearInterval(interval);
-  }, [serverTimeRemainingMs]);
+  }, [deadline]);
 
   const seconds = Math.ceil(displayMs / 1000);
   const fraction = displayMs / (totalSeconds * 1000);
@@ -1,7 +1,23 @@
 'use client';
 
 import { useState, useEffect, useRef, useCallback } from 'react';
-import type { GameStateResponse, SSEMessage } from '@/lib/game/types';
+import { COMPACT_MEDIA_TYPE, createStateDecoder } from '@/lib/game/compact';
+import { recordServerTime, syncServerClock } from '@/lib/game/server-clock';
+import { GAME_CONFIG } from '@/lib/game/config';
+import type {
+  GameStateResponse,
+  SSEMessage,
+  SubmitAnswerResponse,
+  WSClientMessage,
+  WSServerMessage,
+} from '@/lib/game/types';
+
+// Opt-in: only servers started via server.ts accept WebSocket upgrades
+const WEBSOCKET_ENABLED = process.env.NEXT_PUBLIC_GAME_TRANSPORT === 'websocket';
+const WEBSOCKET_PATH = '/api/game/ws';
+const ANSWER_TIMEOUT_MS = 10000;
+
+export type GameTransport = 'websocket' | 'sse';
 
 interface UseGameSSEOptions {
   enabled?: boolean;
@@ -11,34 +27,126 @@ interface UseGameSSEResult {
   gameState: GameStateResponse | null;
   error: string;
   refetch: () => Promise<void>;
+  submitAnswer: (answerIndex: number) => Promise<boolean>;
+  transport: GameTransport | null;
+  // True while a stream is open; the server then tracks presence itself
+  connected: boolean;
 }
 
+type PendingAnswer = (result: SubmitAnswerResponse | null) => void;
+
 export function useGameSSE({
   enabled = true,
 }: UseGameSSEOptions = {}): UseGameSSEResult {
   const [gameState, setGameState] = useState<GameStateResponse | null>(null);
   const [error, setError] = useState('');
+  const [transport, setTransport] = useState<GameTransport | null>(null);
+  const [connected, setConnected] = useState(false);
   const eventSourceRef = useRef<EventSource | null>(null);
+  const socketRef = useRef<WebSocket | null>(null);
+  const pendingAnswersRef = useRef(new Map<number, PendingAnswer>());
+  const nextRequestIdRef = useRef(1);
+  const etagRef = useRef<string | null>(null);
+  const decodeRef = useRef(createStateDecoder());
+
+  const applyMessage = useCallback((message: SSEMessage) => {
+    if (message.type === 'state' || message.type === 'compact') {
+      if (message.serverTime) recordServerTime(message.serverTime);
+      const data = message.type === 'compact' ? decodeRef.current(message.data) : message.data;
+      setGameState((prev) => {
+        // Don't let idle overwrite an active game — user must manually leave scoreboard
+        if (prev?.phase === 'finished' && data.phase === 'idle') {
+          return prev;
+        }
+        return data;
+      });
+      setError('');
+    } else if (message.type === 'error') {
+      setError(message.error);
+    }
+  }, []);
 
   // One-off fetch for immediate feedback (e.g., after answer submission)
   const refetch = useCallback(async () => {
     try {
-      const res = await fetch('/api/game/state');
+      const headers: Record<string, string> = { Accept: COMPACT_MEDIA_TYPE };
+      if (etagRef.current) headers['If-None-Match'] = etagRef.current;
+      const res = await fetch('/api/game/state', { headers, cache: 'no-store' });
+      if (res.status === 304) return; // Unchanged since last fetch
       if (res.ok) {
-        const data: GameStateResponse = await res.json();
-        setGameState((prev) => {
-          // Don't let idle overwrite an active game — user must manually leave scoreboard
-          if (prev?.phase === 'finished' && data.phase === 'idle') {
-            return prev;
-          }
-          return data;
-        });
-        setError('');
+        etagRef.current = res.headers.get('ETag');
+        const data = await res.json();
+        const isCompact = res.headers.get('Content-Type')?.startsWith(COMPACT_MEDIA_TYPE);
+        const serverTime = Number(res.headers.get('X-Server-Time')) || undefined;
+        applyMessage(isCompact ? { type: 'compact', data, serverTime } : { type: 'state', data, serverTime });
       }
     } catch {
       // SSE stream will catch up
     }
-  }, []);
+  }, [applyMessage]);
+
+  // Over the socket when one is open; otherwise POST and refetch
+  const submitAnswer = useCallback(async (answerIndex: number): Promise<boolean> => {
+    const socket = socketRef.current;
+
+    if (socket && socket.readyState === WebSocket.OPEN) {
+      const requestId = nextRequestIdRef.current++;
+      const result = await new Promise<SubmitAnswerResponse | null>((resolve) => {
+        const timeout = setTimeout(() => {
+          pendingAnswersRef.current.delete(requestId);
+          resolve(null);
+        }, ANSWER_TIMEOUT_MS);
+        pendingAnswersRef.current.set(requestId, (value) => {
+          clearTimeout(timeout);
+          resolve(value);
+        });
+        const message: WSClientMessage = { type: 'answer', requestId, answerIndex };
+        socket.send(JSON.stringify(message));
+      });
+      // The server pushes the updated state itself
+      return result !== null;
+    }
+
+    try {
+      const res = await fetch('/api/game/answer', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ answerIndex }),
+      });
+      if (res.ok) {
+        await refetch();
+        return true;
+      }
+      return false;
+    } catch {
+      return false;
+    }
+  }, [refetch]);
+
+  // NTP-style clock sync for the local countdowns; the measured skew is reported back
+  useEffect(() => {
+    if (!enabled) return;
+    let cancelled = false;
+
+    const sync = async () => {
+      const { offsetMs, rttMs } = await syncServerClock();
+      if (cancelled || rttMs === null) return;
+      fetch('/api/time', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ offsetMs, rttMs }),
+      }).catch(() => {
+        // Best effort
+      });
+    };
+
+    void sync();
+    const interval = setInterval(sync, GAME_CONFIG.CLOCK_SYNC_INTERVAL_MS);
+    return () => {
+      cancelled = true;
+      clearInterval(interval);
+    };
+  }, [enabled]);
 
   useEffect(() => {
     if (!enabled) {
@@ -47,45 +155,93 @@ export function useGameSSE({
         eventSourceRef.current.close();
         eventSourceRef.current = null;
       }
+      if (socketRef.current) {
+        socketRef.current.close();
+        socketRef.current = null;
+      }
       return;
     }
 
-    const es = new EventSource('/api/game/stream');
-    eventSourceRef.current = es;
-
-    es.onmessage = (event) => {
-      try {
-        const message: SSEMessage = JSON.parse(event.data);
-        if (message.type === 'state') {
-          setGameState((prev) => {
-            // Don't let idle overwrite an active game — user must manually leave scoreboard
-            if (prev?.phase === 'finished' && message.data.phase === 'idle') {
-              return prev;
-            }
-            return message.data;
-          });
-          setError('');
-        } else if (message.type === 'error') {
-          setError(message.error);
+    let disposed = false;
+    const pendingAnswers = pendingAnswersRef.current;
+
+    const openEventSource = () => {
+      const es = new EventSource('/api/game/stream?encoding=compact');
+      eventSourceRef.current = es;
+      setTransport('sse');
+
+      es.onopen = () => setConnected(true);
+
+      es.onmessage = (event) => {
+        try {
+          applyMessage(JSON.parse(event.data));
+        } catch {
+          // Ignore malformed messages
         }
-      } catch {
-        // Ignore malformed messages
-      }
+      };
+
+      es.onerror = () => {
+        setConnected(false);
+        // EventSource auto-reconnects on error.
+        // Only set error if connection is fully closed.
+        if (es.readyState === EventSource.CLOSED) {
+          setError('Conexión perdida');
+        }
+      };
     };
 
-    es.onerror = () => {
-      // EventSource auto-reconnects on error.
-      // Only set error if connection is fully closed.
-      if (es.readyState === EventSource.CLOSED) {
-        setError('Conexión perdida');
-      }
+    const openWebSocket = () => {
+      const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+      const socket = new WebSocket(
+        `${protocol}//${window.location.host}${WEBSOCKET_PATH}?encoding=compact`
+      );
+      socketRef.current = socket;
+
+      socket.onopen = () => {
+        setTransport('websocket');
+        setConnected(true);
+      };
+
+      socket.onmessage = (event) => {
+        try {
+          const message: WSServerMessage = JSON.parse(event.data);
+          if (message.type === 'answer' || message.type === 'answer-error') {
+            const pending = pendingAnswers.get(message.requestId);
+            pendingAnswers.delete(message.requestId);
+            pending?.(message.type === 'answer' ? message.result : null);
+          } else if (message.type !== 'pong') {
+            applyMessage(message);
+          }
+        } catch {
+          // Ignore malformed messages
+        }
+      };
+
+      // Server without WebSocket support, or socket dropped: fall back to SSE
+      socket.onclose = () => {
+        setConnected(false);
+        socketRef.current = null;
+        for (const pending of pendingAnswers.values()) pending(null);
+        pendingAnswers.clear();
+        if (!disposed) openEventSource();
+      };
     };
 
+    if (WEBSOCKET_ENABLED && typeof WebSocket !== 'undefined') {
+      openWebSocket();
+    } else {
+      openEventSource();
+    }
+
     return () => {
-      es.close();
+      disposed = true;
+      setConnected(false);
+      eventSourceRef.current?.close();
       eventSourceRef.current = null;
+      socketRef.current?.close();
+      socketRef.current = null;
     };
-  }, [enabled]);
+  }, [enabled, applyMessage]);
 
-  return { gameState, error, refetch };
+  return { gameState, error, refetch, submitAnswer, transport, connected };
 }
@@ -0,0 +1 @@
+ALTER TABLE "game_states" ADD COLUMN "version" integer DEFAULT 0 NOT NULL;
\ No newline at end of file
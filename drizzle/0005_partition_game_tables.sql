@@ -0,0 +1,117 @@
+-- Range-partition player_answers and scores by game_id (1000 games per partition).
+-- Partitions are created by a trigger on games, so the app never inserts into a missing range.
+CREATE OR REPLACE FUNCTION ensure_game_partitions(p_game_id integer) RETURNS void AS $$
+DECLARE
+  span constant integer := 1000;
+  lo integer := (p_game_id / span) * span;
+  suffix text := 'g' || (p_game_id / span);
+  parent text;
+BEGIN
+  FOREACH parent IN ARRAY ARRAY['player_answers', 'scores'] LOOP
+    IF to_regclass(parent || '_' || suffix) IS NULL THEN
+      BEGIN
+        EXECUTE format('CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%s) TO (%s)',
+          parent || '_' || suffix, parent, lo, lo + span);
+      EXCEPTION WHEN duplicate_table THEN
+        NULL; -- created concurrently
+      END;
+    END IF;
+  END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+--> statement-breakpoint
+-- Drops partitions whose whole range lies below p_below_game_id and holds no rows
+-- (i.e. every game in it has been archived). Returns the number of tables dropped.
+CREATE OR REPLACE FUNCTION drop_archived_game_partitions(p_below_game_id integer) RETURNS integer AS $$
+DECLARE
+  span constant integer := 1000;
+  bucket integer;
+  parent text;
+  part text;
+  has_rows boolean;
+  dropped integer := 0;
+BEGIN
+  FOR bucket IN 0 .. (p_below_game_id / span) - 1 LOOP
+    FOREACH parent IN ARRAY ARRAY['player_answers', 'scores'] LOOP
+      part := parent || '_g' || bucket;
+      IF to_regclass(part) IS NOT NULL THEN
+        EXECUTE format('SELECT EXISTS (SELECT 1 FROM %I)', part) INTO has_rows;
+        IF NOT has_rows THEN
+          EXECUTE format('DROP TABLE %I', part);
+          dropped := dropped + 1;
+        END IF;
+      END IF;
+    END LOOP;
+  END LOOP;
+  RETURN dropped;
+END;
+$$ LANGUAGE plpgsql;
+--> statement-breakpoint
+CREATE OR REPLACE FUNCTION games_ensure_partitions() RETURNS trigger AS $$
+BEGIN
+  PERFORM ensure_game_partitions(NEW.id);
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+--> statement-breakpoint
+CREATE TRIGGER "games_ensure_partitions" AFTER INSERT ON "games" FOR EACH ROW EXECUTE FUNCTION games_ensure_partitions();
+--> statement-breakpoint
+ALTER SEQUENCE "player_answers_id_seq" OWNED BY NONE;--> statement-breakpoint
+ALTER SEQUENCE "scores_id_seq" OWNED BY NONE;--> statement-breakpoint
+ALTER TABLE "player_answers" RENAME TO "player_answers_unpartitioned";--> statement-breakpoint
+ALTER TABLE "scores" RENAME TO "scores_unpartitioned";--> statement-breakpoint
+CREATE TABLE "player_answers" (
+	"id" integer DEFAULT nextval('player_answers_id_seq') NOT NULL,
+	"game_id" integer NOT NULL,
+	"user_id" integer NOT NULL,
+	"question_id" integer NOT NULL,
+	"answer_index" integer,
+	"is_correct" boolean DEFAULT false NOT NULL,
+	"timestamp" timestamp DEFAULT now() NOT NULL,
+	CONSTRAINT "player_answers_id_game_id_pk" PRIMARY KEY("id","game_id")
+) PARTITION BY RANGE ("game_id");
+--> statement-breakpoint
+CREATE TABLE "scores" (
+	"id" integer DEFAULT nextval('scores_id_seq') NOT NULL,
+	"game_id" integer NOT NULL,
+	"user_id" integer NOT NULL,
+	"score" integer DEFAULT 0 NOT NULL,
+	"updated_at" timestamp DEFAULT now() NOT NULL,
+	CONSTRAINT "scores_id_game_id_pk" PRIMARY KEY("id","game_id")
+) PARTITION BY RANGE ("game_id");
+--> statement-breakpoint
+ALTER SEQUENCE "player_answers_id_seq" OWNED BY "player_answers"."id";--> statement-breakpoint
+ALTER SEQUENCE "scores_id_seq" OWNED BY "scores"."id";--> statement-breakpoint
+SELECT ensure_game_partitions(g) FROM generate_series(0, COALESCE((SELECT max("id") FROM "games"), 0), 1000) AS g;--> statement-breakpoint
+INSERT INTO "player_answers" ("id", "game_id", "user_id", "question_id", "answer_index", "is_correct", "timestamp")
+	SELECT "id", "game_id", "user_id", "question_id", "answer_index", "is_correct", "timestamp" FROM "player_answers_unpartitioned";--> statement-breakpoint
+INSERT INTO "scores" ("id", "game_id", "user_id", "score", "updated_at")
+	SELECT "id", "game_id", "user_id", "score", "updated_at" FROM "scores_unpartitioned";--> statement-breakpoint
+DROP TABLE "player_answers_unpartitioned";--> statement-breakpoint
+DROP TABLE "scores_unpartitioned";--> statement-breakpoint
+ALTER TABLE "player_answers" ADD CONSTRAINT "player_answers_game_id_games_id_fk" FOREIGN KEY ("game_id") REFERENCES "public"."games"("id") ON DELETE cascade ON UPDATE no action;--> statement-breakpoint
+ALTER TABLE "player_answers" ADD CONSTRAINT "player_answers_user_id_users_id_fk" FOREIGN KEY ("user_id") REFERENCES "public"."users"("id") ON DELETE cascade ON UPDATE no action;--> statement-breakpoint
+ALTER TABLE "player_answers" ADD CONSTRAINT "player_answers_question_id_questions_id_fk" FOREIGN KEY ("question_id") REFERENCES "public"."questions"("id") ON DELETE cascade ON UPDATE no action;--> statement-breakpoint
+ALTER TABLE "scores" ADD CONSTRAINT "scores_game_id_games_id_fk" FOREIGN KEY ("game_id") REFERENCES "public"."games"("id") ON DELETE cascade ON UPDATE no action;--> statement-breakpoint
+ALTER TABLE "scores" ADD CONSTRAINT "scores_user_id_users_id_fk" FOREIGN KEY ("user_id") REFERENCES "public"."users"("id") ON DELETE cascade ON UPDATE no action;--> statement-breakpoint
+CREATE INDEX "answer_game_question_idx" ON "player_answers" USING btree ("game_id","question_id");--> statement-breakpoint
+CREATE INDEX "answer_game_user_question_idx" ON "player_answers" USING btree ("game_id","user_id","question_id");--> statement-breakpoint
+CREATE UNIQUE INDEX "score_game_user_idx" ON "scores" USING btree ("game_id","user_id");--> statement-breakpoint
+CREATE TABLE "game_archives" (
+	"game_id" integer PRIMARY KEY NOT NULL,
+	"created_at" timestamp NOT NULL,
+	"archived_at" timestamp DEFAULT now() NOT NULL,
+	"question_order" jsonb NOT NULL,
+	"scores" jsonb NOT NULL,
+	"answers" jsonb NOT NULL
+);
+--> statement-breakpoint
+CREATE TABLE "archived_score_totals" (
+	"user_id" integer PRIMARY KEY NOT NULL,
+	"total_score" integer DEFAULT 0 NOT NULL,
+	"games_played" integer DEFAULT 0 NOT NULL,
+	"updated_at" timestamp DEFAULT now() NOT NULL
+);
+--> statement-breakpoint
+ALTER TABLE "archived_score_totals" ADD CONSTRAINT "archived_score_totals_user_id_users_id_fk" FOREIGN KEY ("user_id") REFERENCES "public"."users"("id") ON DELETE cascade ON UPDATE no action;--> statement-breakpoint
+CREATE INDEX "game_archive_archived_at_idx" ON "game_archives" USING btree ("archived_at");
\ No newline at end of file
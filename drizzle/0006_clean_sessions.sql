@@ -0,0 +1 @@
+CREATE INDEX "session_expires_at_idx" ON "sessions" USING btree ("expires_at");
\ No newline at end of file
@@ -0,0 +1,11 @@
+CREATE OR REPLACE FUNCTION question_content_hash(
+  question_text text, answers jsonb, correct_index integer, difficulty varchar, category varchar
+) RETURNS varchar AS $$
+  SELECT encode(sha256(convert_to(
+    concat_ws(E'\x1f', question_text, answers::text, correct_index::text, difficulty, category), 'UTF8'
+  )), 'hex')
+$$ LANGUAGE sql IMMUTABLE;
+--> statement-breakpoint
+ALTER TABLE "questions" ADD COLUMN "content_hash" varchar(64) GENERATED ALWAYS AS (question_content_hash("question_text", "answers", "correct_index", "difficulty", "category")) STORED;--> statement-breakpoint
+ALTER TABLE "questions" ADD COLUMN "deleted_at" timestamp;--> statement-breakpoint
+CREATE INDEX "question_text_idx" ON "questions" USING btree ("question_text");
\ No newline at end of file
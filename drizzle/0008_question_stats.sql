@@ -0,0 +1,19 @@
+CREATE TABLE "analytics_watermarks" (
+	"name" varchar(50) PRIMARY KEY NOT NULL,
+	"last_id" integer DEFAULT 0 NOT NULL,
+	"updated_at" timestamp DEFAULT now() NOT NULL
+);
+--> statement-breakpoint
+CREATE TABLE "question_stats" (
+	"question_id" integer PRIMARY KEY NOT NULL,
+	"attempts" integer DEFAULT 0 NOT NULL,
+	"correct" integer DEFAULT 0 NOT NULL,
+	"timeouts" integer DEFAULT 0 NOT NULL,
+	"picks_0" integer DEFAULT 0 NOT NULL,
+	"picks_1" integer DEFAULT 0 NOT NULL,
+	"picks_2" integer DEFAULT 0 NOT NULL,
+	"picks_3" integer DEFAULT 0 NOT NULL,
+	"updated_at" timestamp DEFAULT now() NOT NULL
+);
+--> statement-breakpoint
+ALTER TABLE "question_stats" ADD CONSTRAINT "question_stats_question_id_questions_id_fk" FOREIGN KEY ("question_id") REFERENCES "public"."questions"("id") ON DELETE cascade ON UPDATE no action;
\ No newline at end of file
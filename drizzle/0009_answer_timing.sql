@@ -0,0 +1,2 @@
+ALTER TABLE "player_answers" ADD COLUMN "elapsed_ms" integer;--> statement-breakpoint
+ALTER TABLE "player_answers" ADD COLUMN "points_awarded" integer DEFAULT 0 NOT NULL;
\ No newline at end of file
@@ -0,0 +1 @@
+ALTER TABLE "game_states" ADD COLUMN "config_override" jsonb;
\ No newline at end of file
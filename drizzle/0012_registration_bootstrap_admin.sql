@@ -0,0 +1,2 @@
+ALTER TABLE "users" ADD COLUMN "bootstrap_admin" boolean DEFAULT false NOT NULL;--> statement-breakpoint
+CREATE UNIQUE INDEX "user_bootstrap_admin_idx" ON "users" USING btree ("bootstrap_admin") WHERE "users"."bootstrap_admin";
\ No newline at end of file
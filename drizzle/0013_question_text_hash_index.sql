@@ -0,0 +1,2 @@
+DROP INDEX "question_text_idx";--> statement-breakpoint
+CREATE INDEX "question_text_idx" ON "questions" USING hash ("question_text");
\ No newline at end of file
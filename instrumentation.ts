@@ -0,0 +1,15 @@
+/**
+ * Next.js startup hook: runs once per server process (both `next start` and
+ * the custom server in `server.ts`).
+ */
+export async function register() {
+  if (process.env.NEXT_RUNTIME === 'nodejs') {
+    // Throws on a misconfigured ACCESS_TOKEN_SECRET before any request is served
+    await import('@/lib/auth/access-token');
+
+    const { startSessionReaper } = await import('@/lib/auth/session-reaper');
+    const { startQuestionStatsJob } = await import('@/lib/game/question-stats');
+    startSessionReaper();
+    startQuestionStatsJob();
+  }
+}
@@ -0,0 +1,96 @@
+import { createHmac, timingSafeEqual } from 'crypto';
+import type { SessionUser } from './simple-session';
+
+/**
+ * Short-lived signed access tokens (optional, enabled by ACCESS_TOKEN_SECRET).
+ *
+ * Issued next to the auth_session cookie and re-issued from the DB session
+ * once expired, so user API routes can authenticate without a DB round-trip.
+ * A token cannot be revoked: logout, session deletion or a role change take
+ * effect for token holders within ACCESS_TOKEN_TTL_SECONDS.
+ *
+ * Format: base64url(JSON payload) + '.' + base64url(HMAC-SHA256(payload)).
+ */
+
+export const ACCESS_TOKEN_COOKIE_NAME = 'auth_access';
+export const ACCESS_TOKEN_TTL_SECONDS = 60;
+const MIN_SECRET_LENGTH = 32;
+
+type AccessTokenPayload = {
+  uid: number;
+  role: string;
+  username: string;
+  email: string;
+  exp: number; // Epoch seconds
+};
+
+function readSecret(): string | null {
+  const secret = process.env.ACCESS_TOKEN_SECRET;
+  if (!secret) return null;
+  if (secret.length < MIN_SECRET_LENGTH) {
+    throw new Error(`ACCESS_TOKEN_SECRET must be at least ${MIN_SECRET_LENGTH} characters`);
+  }
+  return secret;
+}
+
+// Validated once at module load; instrumentation.ts imports this module so a
+// bad secret stops the server at startup instead of failing every request
+const SECRET = readSecret();
+
+export function accessTokensEnabled(): boolean {
+  return SECRET !== null;
+}
+
+function sign(encodedPayload: string, secret: string): Buffer {
+  return createHmac('sha256', secret).update(encodedPayload).digest();
+}
+
+/**
+ * Sign a token for `user`. Returns null when access tokens are disabled.
+ */
+export function signAccessToken(
+  user: SessionUser,
+  now: number = Date.now()
+): { token: string; expiresAt: Date } | null {
+  const secret = SECRET;
+  if (!secret) return null;
+
+  const exp = Math.floor(now / 1000) + ACCESS_TOKEN_TTL_SECONDS;
+  const payload: AccessTokenPayload = {
+    uid: user.id,
+    role: user.role,
+    username: user.username,
+    email: user.email,
+    exp,
+  };
+  const encodedPayload = Buffer.from(JSON.stringify(payload)).toString('base64url');
+  const signature = sign(encodedPayload, secret).toString('base64url');
+
+  return { token: `${encodedPayload}.${signature}`, expiresAt: new Date(exp * 1000) };
+}
+
+/**
+ * The user a token was issued to, or null if it is malformed, forged,
+ * expired, or access tokens are disabled.
+ */
+export function verifyAccessToken(token: string, now: number = Date.now()): SessionUser | null {
+  const secret = SECRET;
+  if (!secret) return null;
+
+  const [encodedPayload, signature, extra] = token.split('.');
+  if (!encodedPayload || !signature || extra !== undefined) return null;
+
+  const expected = sign(encodedPayload, secret);
+  const actual = Buffer.from(signature, 'base64url');
+  if (actual.length !== expected.length || !timingSafeEqual(actual, expected)) return null;
+
+  let payload: AccessTokenPayload;
+  try {
+    payload = JSON.parse(Buffer.from(encodedPayload, 'base64url').toString('utf8'));
+  } catch {
+    return null;
+  }
+  if (typeof payload.exp !== 'number' || payload.exp * 1000 <= now) return null;
+
+  return { id: payload.uid, username: payload.username, email: payload.email, role: payload.role };
+}
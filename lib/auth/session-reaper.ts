@@ -0,0 +1,116 @@
+import { db } from '@/lib/db';
+import { sessions } from '@/lib/db/schema';
+import { asc, inArray, lte, sql } from 'drizzle-orm';
+
+/**
+ * Background deletion of expired sessions. Sessions are otherwise only removed
+ * on logout, and validateSessionById() already ignores expired rows, so this
+ * only keeps the table (and its indexes) from growing without bound.
+ *
+ * Deletes run in bounded batches through `session_expires_at_idx`, with
+ * SKIP LOCKED so several app instances can reap concurrently.
+ */
+
+const REAP_INTERVAL_MS = 10 * 60 * 1000;
+const REAP_BATCH_SIZE = 1000;
+const MAX_BATCHES_PER_RUN = 20; // caps one run at 20k deletes; the rest waits for the next run
+
+export interface SessionMetrics {
+  estimatedRows: number;
+  totalBytes: number;
+  expiredRows: number;
+  lastRunAt: string | null;
+  lastRunReaped: number;
+  totalReaped: number;
+}
+
+const reaperStats = {
+  lastRunAt: null as Date | null,
+  lastRunReaped: 0,
+  totalReaped: 0,
+};
+
+declare global {
+  // eslint-disable-next-line no-var
+  var __sessionReaper: ReturnType<typeof setInterval> | undefined;
+}
+
+/** Delete up to `maxBatches` batches of expired sessions. Returns the number deleted. */
+export async function reapExpiredSessions(
+  batchSize: number = REAP_BATCH_SIZE,
+  maxBatches: number = MAX_BATCHES_PER_RUN
+): Promise<number> {
+  let reaped = 0;
+
+  for (let batch = 0; batch < maxBatches; batch++) {
+    const expired = db
+      .select({ id: sessions.id })
+      .from(sessions)
+      .where(lte(sessions.expiresAt, sql`now()`))
+      .orderBy(asc(sessions.expiresAt))
+      .limit(batchSize)
+      .for('update', { skipLocked: true });
+
+    const deleted = await db
+      .delete(sessions)
+      .where(inArray(sessions.id, expired))
+      .returning({ id: sessions.id });
+
+    reaped += deleted.length;
+    if (deleted.length < batchSize) break;
+  }
+
+  reaperStats.lastRunAt = new Date();
+  reaperStats.lastRunReaped = reaped;
+  reaperStats.totalReaped += reaped;
+  return reaped;
+}
+
+/** Table size (planner estimate, no full scan) plus this process's reaper counters. */
+export async function getSessionMetrics(): Promise<SessionMetrics> {
+  const [size] = await db.execute<{ estimated_rows: number; total_bytes: string }>(sql`
+    select greatest(reltuples, 0)::bigint::int as estimated_rows,
+           pg_total_relation_size(oid)::text as total_bytes
+    from pg_class
+    where oid = 'sessions'::regclass
+  `);
+
+  const [expired] = await db
+    .select({ count: sql<number>`count(*)::int` })
+    .from(sessions)
+    .where(lte(sessions.expiresAt, sql`now()`));
+
+  return {
+    estimatedRows: Number(size?.estimated_rows ?? 0),
+    totalBytes: Number(size?.total_bytes ?? 0),
+    expiredRows: expired.count,
+    lastRunAt: reaperStats.lastRunAt?.toISOString() ?? null,
+    lastRunReaped: reaperStats.lastRunReaped,
+    totalReaped: reaperStats.totalReaped,
+  };
+}
+
+async function runReaper(): Promise<void> {
+  try {
+    const reaped = await reapExpiredSessions();
+    if (reaped > 0) {
+      const metrics = await getSessionMetrics();
+      console.log(
+        `[Sessions] Reaped ${reaped} expired session(s); ` +
+        `~${metrics.estimatedRows} rows, ${metrics.expiredRows} still expired, ${metrics.totalBytes} bytes`
+      );
+    }
+  } catch (error) {
+    console.error('[Sessions] Reaper error:', error);
+  }
+}
+
+/** Start the periodic reaper once per process (called from instrumentation.ts). */
+export function startSessionReaper(): void {
+  if (globalThis.__sessionReaper) return;
+
+  globalThis.__sessionReaper = setInterval(runReaper, REAP_INTERVAL_MS);
+  // Don't keep the process alive just for the reaper
+  globalThis.__sessionReaper.unref?.();
+  void runReaper();
+}
@@ -4,9 +4,10 @@ import { db } from '@/lib/db';
 import { users, sessions } from '@/lib/db/schema';
 import { eq, and, gt } from 'drizzle-orm';
 import { nanoid } from 'nanoid';
+import { ACCESS_TOKEN_COOKIE_NAME, signAccessToken, verifyAccessToken } from './access-token';
 
 // Session cookie configuration
-const SESSION_COOKIE_NAME = 'auth_session';
+export const SESSION_COOKIE_NAME = 'auth_session';
 const SESSION_DURATION_DAYS = 30;
 
 export type SessionUser = {
@@ -119,19 +120,38 @@ export async function setSessionCookie(sessionId: string, expiresAt: Date): Prom
 }
 
 /**
- * Clear session cookie
+ * Set the short-lived access token cookie (no-op unless ACCESS_TOKEN_SECRET is set)
  */
-export async function clearSessionCookie(): Promise<void> {
+export async function setAccessTokenCookie(user: SessionUser): Promise<void> {
+  const signed = signAccessToken(user);
+  if (!signed) return;
+
   const cookieStore = await cookies();
-  cookieStore.set(SESSION_COOKIE_NAME, '', {
+  cookieStore.set(ACCESS_TOKEN_COOKIE_NAME, signed.token, {
     httpOnly: true,
     secure: process.env.NODE_ENV === 'production',
     sameSite: 'lax',
-    expires: new Date(0),
+    expires: signed.expiresAt,
     path: '/',
   });
 }
 
+/**
+ * Clear session cookie (and the access token issued with it)
+ */
+export async function clearSessionCookie(): Promise<void> {
+  const cookieStore = await cookies();
+  for (const name of [SESSION_COOKIE_NAME, ACCESS_TOKEN_COOKIE_NAME]) {
+    cookieStore.set(name, '', {
+      httpOnly: true,
+      secure: process.env.NODE_ENV === 'production',
+      sameSite: 'lax',
+      expires: new Date(0),
+      path: '/',
+    });
+  }
+}
+
 /**
  * Get session ID from cookies
  */
@@ -154,6 +174,22 @@ export const validateRequest = cache(async (): Promise<SessionValidationResult>
   return validateSessionById(sessionId);
 });
 
+/**
+ * Authenticate the current request for API routes. A valid access token
+ * skips the DB; otherwise the session is validated and a new token issued.
+ * Cached per request.
+ */
+export const authenticateRequest = cache(async (): Promise<SessionUser | null> => {
+  const cookieStore = await cookies();
+  const accessToken = cookieStore.get(ACCESS_TOKEN_COOKIE_NAME)?.value;
+  const tokenUser = accessToken ? verifyAccessToken(accessToken) : null;
+  if (tokenUser) return tokenUser;
+
+  const { user } = await validateRequest();
+  if (user) await setAccessTokenCookie(user);
+  return user;
+});
+
 /**
  * Get current user or null
  */
@@ -163,10 +199,10 @@ export async function getCurrentUser(): Promise<SessionUser | null> {
 }
 
 /**
- * Require authenticated user or throw
+ * Require authenticated user or throw (accepts access tokens)
  */
 export async function requireAuth(): Promise<SessionUser> {
-  const user = await getCurrentUser();
+  const user = await authenticateRequest();
   if (!user) {
     throw new Error('Unauthorized');
   }
@@ -174,10 +210,14 @@ export async function requireAuth(): Promise<SessionUser> {
 }
 
 /**
- * Require admin role or throw
+ * Require admin role or throw. Always checks the DB session, so revoking
+ * a session or demoting an admin takes effect immediately.
  */
 export async function requireAdmin(): Promise<SessionUser> {
-  const user = await requireAuth();
+  const user = await getCurrentUser();
+  if (!user) {
+    throw new Error('Unauthorized');
+  }
   if (user.role !== 'admin') {
     throw new Error('Forbidden: Admin access required');
   }
@@ -27,10 +27,26 @@ if (process.env.NODE_ENV === 'production') {
   queryClient = globalThis.__queryClient;
 }
 
+// Query observers (simulations and benchmarks count queries per phase).
+// Only queries issued through drizzle are seen, not raw db.$client calls.
+const queryObservers = new Set<(query: string) => void>();
+
+/** Register a callback for every drizzle query. Returns an unsubscribe function. */
+export function observeQueries(observer: (query: string) => void): () => void {
+  queryObservers.add(observer);
+  return () => queryObservers.delete(observer);
+}
+
+const logger = {
+  logQuery(query: string) {
+    for (const observer of queryObservers) observer(query);
+  },
+};
+
 // Create drizzle instance with schema (reuse in development)
 export const db =
   process.env.NODE_ENV === 'production' || !globalThis.__db
-    ? drizzle(queryClient, { schema })
+    ? drizzle(queryClient, { schema, logger })
     : globalThis.__db;
 
 if (process.env.NODE_ENV !== 'production') {
@@ -30,6 +30,8 @@ export async function getQuestionAnswersWithUsers(gameId: number, questionId: nu
       username: users.username,
       answerIndex: playerAnswers.answerIndex,
       isCorrect: playerAnswers.isCorrect,
+      pointsAwarded: playerAnswers.pointsAwarded,
+      elapsedMs: playerAnswers.elapsedMs,
     })
     .from(playerAnswers)
     .innerJoin(users, eq(playerAnswers.userId, users.id))
@@ -0,0 +1,80 @@
+import { db } from '@/lib/db';
+import { users } from '@/lib/db/schema';
+import { eq, or, sql } from 'drizzle-orm';
+
+export type IdentityField = 'username' | 'email';
+
+const UNIQUE_VIOLATION = '23505';
+
+const CONSTRAINT_FIELDS: Record<string, IdentityField> = {
+  users_username_unique: 'username',
+  users_email_unique: 'email',
+};
+
+/**
+ * Name of the unique constraint a failed query violated, or null.
+ * Drizzle wraps the postgres-js error in `cause`.
+ */
+function violatedConstraint(error: unknown): string | null {
+  const pgError = (error instanceof Error && error.cause ? error.cause : error) as {
+    code?: string;
+    constraint_name?: string;
+  };
+  return pgError?.code === UNIQUE_VIOLATION ? (pgError.constraint_name ?? null) : null;
+}
+
+/**
+ * Which of username/email is already registered (username first), in one query.
+ */
+export async function findTakenIdentity(username: string, email: string): Promise<IdentityField | null> {
+  const rows = await db
+    .select({ username: users.username, email: users.email })
+    .from(users)
+    .where(or(eq(users.username, username), eq(users.email, email)))
+    .limit(2);
+
+  if (rows.some((r) => r.username === username)) return 'username';
+  if (rows.some((r) => r.email === email)) return 'email';
+  return null;
+}
+
+export type CreateUserResult =
+  | { user: typeof users.$inferSelect; taken: null }
+  | { user: null; taken: IdentityField };
+
+/**
+ * Insert a user in a single statement. The first user ever becomes admin.
+ * Two concurrent first signups both try to claim `bootstrap_admin`; its
+ * unique index makes the loser fail and retry, and by then it sees a user
+ * and registers as a candidate. Duplicate usernames/emails come back as
+ * `taken` instead of throwing.
+ */
+export async function createUser(values: {
+  username: string;
+  email: string;
+  passwordHash: string;
+}): Promise<CreateUserResult> {
+  const someoneRegistered = sql`exists (select 1 from ${users})`;
+
+  // Only the first registration can race on bootstrap_admin, so one retry is enough
+  for (let attempt = 1; ; attempt++) {
+    try {
+      const [user] = await db
+        .insert(users)
+        .values({
+          ...values,
+          role: sql`case when ${someoneRegistered} then 'candidate' else 'admin' end`,
+          bootstrapAdmin: sql`not ${someoneRegistered}`,
+        })
+        .returning();
+      return { user, taken: null };
+    } catch (error) {
+      const constraint = violatedConstraint(error);
+      if (constraint === 'user_bootstrap_admin_idx' && attempt === 1) continue;
+      if (constraint && CONSTRAINT_FIELDS[constraint]) {
+        return { user: null, taken: CONSTRAINT_FIELDS[constraint] };
+      }
+      throw error;
+    }
+  }
+}
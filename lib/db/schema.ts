@@ -1,5 +1,6 @@
-import { pgTable, serial, varchar, text, timestamp, boolean, integer, jsonb, index, uniqueIndex } from 'drizzle-orm/pg-core';
-import { relations } from 'drizzle-orm';
+import { pgTable, serial, varchar, text, timestamp, boolean, integer, jsonb, index, uniqueIndex, primaryKey } from 'drizzle-orm/pg-core';
+import { relations, sql } from 'drizzle-orm';
+import type { GameConfigOverride } from '../game/config';
 
 // ============================================
 // USERS TABLE
@@ -10,11 +11,14 @@ export const users = pgTable('users', {
   email: varchar('email', { length: 255 }).notNull().unique(),
   passwordHash: text('password_hash').notNull(),
   role: varchar('role', { length: 20 }).notNull().default('candidate'), // 'candidate' | 'admin'
+  // Set on the first registered user only; its unique index makes concurrent first signups race-free
+  bootstrapAdmin: boolean('bootstrap_admin').notNull().default(false),
   lastActiveAt: timestamp('last_active_at'),
   createdAt: timestamp('created_at').notNull().defaultNow(),
 }, (table) => ({
   usernameIdx: index('username_idx').on(table.username),
   emailIdx: index('email_idx').on(table.email),
+  bootstrapAdminIdx: uniqueIndex('user_bootstrap_admin_idx').on(table.bootstrapAdmin).where(sql`${table.bootstrapAdmin}`),
 }));
 
 // ============================================
@@ -26,6 +30,7 @@ export const sessions = pgTable('sessions', {
   expiresAt: timestamp('expires_at', { withTimezone: true }).notNull(),
 }, (table) => ({
   userIdIdx: index('session_user_id_idx').on(table.userId),
+  expiresAtIdx: index('session_expires_at_idx').on(table.expiresAt),
 }));
 
 // ============================================
@@ -33,7 +38,7 @@ export const sessions = pgTable('sessions', {
 // ============================================
 export const games = pgTable('games', {
   id: serial('id').primaryKey(),
-  status: varchar('status', { length: 20 }).notNull().default('playing'), // 'playing' | 'finished'
+  status: varchar('status', { length: 20 }).notNull().default('playing'), // 'playing' | 'finished' | 'archived'
   createdAt: timestamp('created_at').notNull().defaultNow(),
 }, (table) => ({
   statusIdx: index('game_status_idx').on(table.status),
@@ -61,12 +66,46 @@ export const questions = pgTable('questions', {
   correctIndex: integer('correct_index').notNull(), // 0-3
   difficulty: varchar('difficulty', { length: 20 }).notNull(), // 'easy' | 'medium' | 'hard'
   category: varchar('category', { length: 50 }).notNull(),
+  // sha256 of the content, computed by the DB (see question_content_hash() in drizzle/0007)
+  contentHash: varchar('content_hash', { length: 64 }).generatedAlwaysAs(
+    sql`question_content_hash("question_text", "answers", "correct_index", "difficulty", "category")`
+  ),
+  deletedAt: timestamp('deleted_at'), // Soft delete: kept for historical answers, excluded from new games
   createdAt: timestamp('created_at').notNull().defaultNow(),
 }, (table) => ({
   categoryIdx: index('question_category_idx').on(table.category),
   difficultyIdx: index('question_difficulty_idx').on(table.difficulty),
+  // Hash, not btree: question texts are unbounded and btree entries cap at ~2.7kB
+  textIdx: index('question_text_idx').using('hash', table.questionText),
 }));
 
+// ============================================
+// QUESTION STATS TABLE
+// Incremental per-question aggregates over player_answers (lib/game/question-stats.ts)
+// ============================================
+export const questionStats = pgTable('question_stats', {
+  questionId: integer('question_id').primaryKey().references(() => questions.id, { onDelete: 'cascade' }),
+  attempts: integer('attempts').notNull().default(0),
+  correct: integer('correct').notNull().default(0),
+  timeouts: integer('timeouts').notNull().default(0),
+  // How often each answer was picked, in original DB answer order
+  picks0: integer('picks_0').notNull().default(0),
+  picks1: integer('picks_1').notNull().default(0),
+  picks2: integer('picks_2').notNull().default(0),
+  picks3: integer('picks_3').notNull().default(0),
+  updatedAt: timestamp('updated_at').notNull().defaultNow(),
+});
+
+// ============================================
+// ANALYTICS WATERMARKS TABLE
+// Last processed player_answers.id per incremental job
+// ============================================
+export const analyticsWatermarks = pgTable('analytics_watermarks', {
+  name: varchar('name', { length: 50 }).primaryKey(),
+  lastId: integer('last_id').notNull().default(0),
+  updatedAt: timestamp('updated_at').notNull().defaultNow(),
+});
+
 // ============================================
 // GAME STATE TABLE
 // ============================================
@@ -77,6 +116,8 @@ export const gameStates = pgTable('game_states', {
   questionOrder: jsonb('question_order').notNull().$type<number[]>(), // Array of question IDs
   questionStartTime: timestamp('question_start_time', { withTimezone: true }), // Nullable - set when question starts
   phase: varchar('phase', { length: 20 }).notNull().default('question'), // 'question' | 'summary' | 'finished'
+  version: integer('version').notNull().default(0), // Bumped on every phase transition; answers are tracked by count (see peekGameStateRevision)
+  configOverride: jsonb('config_override').$type<GameConfigOverride>(), // Per-game GAME_CONFIG overrides (simulations)
   updatedAt: timestamp('updated_at').notNull().defaultNow(),
 }, (table) => ({
   gameIdIdx: index('game_state_game_idx').on(table.gameId),
@@ -84,33 +125,87 @@ export const gameStates = pgTable('game_states', {
 
 // ============================================
 // PLAYER ANSWERS TABLE
+// Partitioned by RANGE (game_id), see drizzle/0005_partition_game_tables.sql
 // ============================================
 export const playerAnswers = pgTable('player_answers', {
-  id: serial('id').primaryKey(),
+  id: serial('id').notNull(),
   gameId: integer('game_id').notNull().references(() => games.id, { onDelete: 'cascade' }),
   userId: integer('user_id').notNull().references(() => users.id, { onDelete: 'cascade' }),
   questionId: integer('question_id').notNull().references(() => questions.id, { onDelete: 'cascade' }),
   answerIndex: integer('answer_index'), // null if passed/timed out
   isCorrect: boolean('is_correct').notNull().default(false),
+  elapsedMs: integer('elapsed_ms'), // server-measured time from question start; null if timed out
+  pointsAwarded: integer('points_awarded').notNull().default(0), // stored x10, as in scores
   timestamp: timestamp('timestamp').notNull().defaultNow(),
 }, (table) => ({
+  pk: primaryKey({ columns: [table.id, table.gameId] }),
   gameQuestionIdx: index('answer_game_question_idx').on(table.gameId, table.questionId),
   gameUserQuestionIdx: index('answer_game_user_question_idx').on(table.gameId, table.userId, table.questionId),
 }));
 
 // ============================================
 // SCORES TABLE
+// Partitioned by RANGE (game_id), see drizzle/0005_partition_game_tables.sql
 // ============================================
 export const scores = pgTable('scores', {
-  id: serial('id').primaryKey(),
+  id: serial('id').notNull(),
   gameId: integer('game_id').notNull().references(() => games.id, { onDelete: 'cascade' }),
   userId: integer('user_id').notNull().references(() => users.id, { onDelete: 'cascade' }),
   score: integer('score').notNull().default(0), // Store as integer (multiply by 10, e.g., 3.5 pts = 35)
   updatedAt: timestamp('updated_at').notNull().defaultNow(),
 }, (table) => ({
+  pk: primaryKey({ columns: [table.id, table.gameId] }),
   gameUserScoreIdx: uniqueIndex('score_game_user_idx').on(table.gameId, table.userId),
 }));
 
+// ============================================
+// GAME EVENTS TABLE
+// Append-only log of every change to a game, ordered by id. Rows are written
+// in the same transaction as the change, after the game_states row lock, so
+// id order is commit order. See lib/game/replay.ts.
+// ============================================
+export const gameEvents = pgTable('game_events', {
+  id: serial('id').primaryKey(),
+  gameId: integer('game_id').notNull().references(() => games.id, { onDelete: 'cascade' }),
+  type: varchar('type', { length: 20 }).notNull(), // 'started' | 'answer' | 'phase_changed' | 'finished'
+  payload: jsonb('payload').notNull().$type<Record<string, unknown>>(), // Event fields other than type
+  createdAt: timestamp('created_at', { withTimezone: true }).notNull().defaultNow(),
+}, (table) => ({
+  gameIdx: index('game_event_game_idx').on(table.gameId, table.id),
+}));
+
+// ============================================
+// GAME ARCHIVES TABLE
+// One row per archived game; answers and scores moved out of the hot tables.
+// No FK to games so archives survive question refreshes.
+// ============================================
+export const gameArchives = pgTable('game_archives', {
+  gameId: integer('game_id').primaryKey(),
+  createdAt: timestamp('created_at').notNull(), // games.created_at
+  archivedAt: timestamp('archived_at').notNull().defaultNow(),
+  questionOrder: jsonb('question_order').notNull().$type<number[]>(),
+  scores: jsonb('scores').notNull().$type<ArchivedScore[]>(),
+  answers: jsonb('answers').notNull().$type<ArchivedAnswer[]>(),
+}, (table) => ({
+  archivedAtIdx: index('game_archive_archived_at_idx').on(table.archivedAt),
+}));
+
+// [userId, score]
+export type ArchivedScore = [number, number];
+// [userId, questionId, answerIndex (null = timed out), isCorrect, answeredAt (ISO), elapsedMs, pointsAwarded]
+export type ArchivedAnswer = [number, number, number | null, boolean, string, number | null, number];
+
+// ============================================
+// ARCHIVED SCORE TOTALS TABLE
+// Per-user rollup of archived games, for the global leaderboard
+// ============================================
+export const archivedScoreTotals = pgTable('archived_score_totals', {
+  userId: integer('user_id').primaryKey().references(() => users.id, { onDelete: 'cascade' }),
+  totalScore: integer('total_score').notNull().default(0),
+  gamesPlayed: integer('games_played').notNull().default(0),
+  updatedAt: timestamp('updated_at').notNull().defaultNow(),
+});
+
 // ============================================
 // RELATIONS
 // ============================================
@@ -133,6 +228,7 @@ export const gamesRelations = relations(games, ({ many, one }) => ({
   gameState: one(gameStates),
   answers: many(playerAnswers),
   scores: many(scores),
+  events: many(gameEvents),
 }));
 
 export const gameParticipantsRelations = relations(gameParticipants, ({ one }) => ({
@@ -146,8 +242,16 @@ export const gameParticipantsRelations = relations(gameParticipants, ({ one }) =
   }),
 }));
 
-export const questionsRelations = relations(questions, ({ many }) => ({
+export const questionsRelations = relations(questions, ({ many, one }) => ({
   answers: many(playerAnswers),
+  stats: one(questionStats),
+}));
+
+export const questionStatsRelations = relations(questionStats, ({ one }) => ({
+  question: one(questions, {
+    fields: [questionStats.questionId],
+    references: [questions.id],
+  }),
 }));
 
 export const gameStatesRelations = relations(gameStates, ({ one }) => ({
@@ -157,6 +261,13 @@ export const gameStatesRelations = relations(gameStates, ({ one }) => ({
   }),
 }));
 
+export const gameEventsRelations = relations(gameEvents, ({ one }) => ({
+  game: one(games, {
+    fields: [gameEvents.gameId],
+    references: [games.id],
+  }),
+}));
+
 export const playerAnswersRelations = relations(playerAnswers, ({ one }) => ({
   game: one(games, {
     fields: [playerAnswers.gameId],
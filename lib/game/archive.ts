@@ -0,0 +1,213 @@
+import { db } from '@/lib/db';
+import {
+  games,
+  gameParticipants,
+  gameStates,
+  gameEvents,
+  playerAnswers,
+  scores,
+  gameArchives,
+  archivedScoreTotals,
+  users,
+  type ArchivedAnswer,
+  type ArchivedScore,
+} from '@/lib/db/schema';
+import { eq, and, ne, lt, asc, sql, min, max, inArray } from 'drizzle-orm';
+import type { LeaderboardEntry } from './types';
+
+/**
+ * Archival of finished games. An archived game keeps its `games` and
+ * `game_states` rows (status 'archived'); its answers and scores move into a
+ * single `game_archives` row, its event log is dropped, and its scores are
+ * folded into `archived_score_totals` so the global leaderboard still counts
+ * them. getGameResults() reads archived games back from `game_archives`.
+ *
+ * Once every game in a partition range is archived, the emptied
+ * `player_answers` / `scores` partitions can be dropped.
+ */
+
+export interface GameArchiveRecord {
+  gameId: number;
+  createdAt: string;
+  questionOrder: number[];
+  scores: ArchivedScore[];
+  answers: ArchivedAnswer[];
+}
+
+export interface ArchivedResults {
+  leaderboard: LeaderboardEntry[];
+  answers: {
+    userId: number;
+    username: string;
+    questionId: number;
+    answerIndex: number | null;
+    isCorrect: boolean;
+    pointsAwarded: number;
+    elapsedMs: number | null;
+  }[];
+}
+
+/**
+ * An archived game's leaderboard and answers, in the shapes the live tables
+ * give getGameResults(). Returns null if the game has no archive row. Like
+ * the live queries, entries of since-deleted users are left out.
+ */
+export async function loadArchivedResults(gameId: number): Promise<ArchivedResults | null> {
+  const archive = await db.query.gameArchives.findFirst({
+    where: eq(gameArchives.gameId, gameId),
+    columns: { scores: true, answers: true },
+  });
+  if (!archive) return null;
+
+  const userIds = [...new Set(archive.scores.map(([userId]) => userId))];
+  const userRows = userIds.length > 0
+    ? await db
+        .select({ id: users.id, username: users.username })
+        .from(users)
+        .where(inArray(users.id, userIds))
+    : [];
+  const usernames = new Map(userRows.map((u) => [u.id, u.username]));
+
+  const leaderboard = archive.scores
+    .filter(([userId]) => usernames.has(userId))
+    .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+    .map(([userId, score], i) => ({ userId, username: usernames.get(userId)!, score, rank: i + 1 }));
+
+  const answers = archive.answers
+    .filter(([userId]) => usernames.has(userId))
+    .map(([userId, questionId, answerIndex, isCorrect, , elapsedMs, pointsAwarded]) => ({
+      userId,
+      username: usernames.get(userId)!,
+      questionId,
+      answerIndex,
+      isCorrect,
+      pointsAwarded,
+      elapsedMs,
+    }));
+
+  return { leaderboard, answers };
+}
+
+/** Ids of finished games created more than `olderThanDays` days ago, oldest first. */
+export async function findArchivableGames(olderThanDays: number, limit: number): Promise<number[]> {
+  const cutoff = new Date(Date.now() - olderThanDays * 24 * 60 * 60 * 1000);
+  const rows = await db
+    .select({ id: games.id })
+    .from(games)
+    .where(and(eq(games.status, 'finished'), lt(games.createdAt, cutoff)))
+    .orderBy(asc(games.id))
+    .limit(limit);
+  return rows.map((r) => r.id);
+}
+
+/**
+ * Move one finished game out of the hot tables. Returns null if the game is
+ * not (or no longer) in the 'finished' state.
+ */
+export async function archiveGame(gameId: number): Promise<GameArchiveRecord | null> {
+  return await db.transaction(async (tx) => {
+    const [game] = await tx
+      .select({ id: games.id, createdAt: games.createdAt })
+      .from(games)
+      .where(and(eq(games.id, gameId), eq(games.status, 'finished')))
+      .for('update');
+
+    if (!game) return null;
+
+    const state = await tx.query.gameStates.findFirst({
+      where: eq(gameStates.gameId, gameId),
+      columns: { questionOrder: true },
+    });
+
+    const scoreRows = await tx
+      .select({ userId: scores.userId, score: scores.score })
+      .from(scores)
+      .where(eq(scores.gameId, gameId))
+      .orderBy(asc(scores.userId));
+
+    const answerRows = await tx
+      .select({
+        userId: playerAnswers.userId,
+        questionId: playerAnswers.questionId,
+        answerIndex: playerAnswers.answerIndex,
+        isCorrect: playerAnswers.isCorrect,
+        timestamp: playerAnswers.timestamp,
+        elapsedMs: playerAnswers.elapsedMs,
+        pointsAwarded: playerAnswers.pointsAwarded,
+      })
+      .from(playerAnswers)
+      .where(eq(playerAnswers.gameId, gameId))
+      .orderBy(asc(playerAnswers.id));
+
+    const record: GameArchiveRecord = {
+      gameId,
+      createdAt: game.createdAt.toISOString(),
+      questionOrder: (state?.questionOrder as number[] | undefined) ?? [],
+      scores: scoreRows.map((r): ArchivedScore => [r.userId, r.score]),
+      answers: answerRows.map((r): ArchivedAnswer => [
+        r.userId,
+        r.questionId,
+        r.answerIndex,
+        r.isCorrect,
+        r.timestamp.toISOString(),
+        r.elapsedMs,
+        r.pointsAwarded,
+      ]),
+    };
+
+    await tx.insert(gameArchives).values({
+      gameId,
+      createdAt: game.createdAt,
+      questionOrder: record.questionOrder,
+      scores: record.scores,
+      answers: record.answers,
+    });
+
+    if (scoreRows.length > 0) {
+      await tx
+        .insert(archivedScoreTotals)
+        .values(scoreRows.map((r) => ({ userId: r.userId, totalScore: r.score, gamesPlayed: 1 })))
+        .onConflictDoUpdate({
+          target: archivedScoreTotals.userId,
+          set: {
+            totalScore: sql`${archivedScoreTotals.totalScore} + excluded.total_score`,
+            gamesPlayed: sql`${archivedScoreTotals.gamesPlayed} + excluded.games_played`,
+            updatedAt: new Date(),
+          },
+        });
+    }
+
+    await tx.delete(gameEvents).where(eq(gameEvents.gameId, gameId));
+    await tx.delete(playerAnswers).where(eq(playerAnswers.gameId, gameId));
+    await tx.delete(scores).where(eq(scores.gameId, gameId));
+    await tx.delete(gameParticipants).where(eq(gameParticipants.gameId, gameId));
+    await tx.update(games).set({ status: 'archived' }).where(eq(games.id, gameId));
+
+    return record;
+  });
+}
+
+/**
+ * Drop `player_answers` / `scores` partitions that only cover archived games.
+ * Returns the number of partition tables dropped.
+ */
+export async function dropArchivedPartitions(): Promise<number> {
+  const [live] = await db
+    .select({ minId: min(games.id) })
+    .from(games)
+    .where(ne(games.status, 'archived'));
+
+  // Nothing left to protect: every remaining game is archived
+  const below = live?.minId ?? (await nextGameId());
+  if (below === null) return 0;
+
+  const rows = await db.execute<{ dropped: number }>(
+    sql`select drop_archived_game_partitions(${below}) as dropped`
+  );
+  return Number(rows[0]?.dropped ?? 0);
+}
+
+async function nextGameId(): Promise<number | null> {
+  const [row] = await db.select({ maxId: max(games.id) }).from(games);
+  return row?.maxId != null ? row.maxId + 1 : null;
+}
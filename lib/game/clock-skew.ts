@@ -0,0 +1,65 @@
+import { GAME_CONFIG } from './config';
+import type { ClockReportInput } from '@/lib/utils/validation';
+
+/**
+ * Clock offsets reported by clients after each /api/time sync, kept in
+ * memory per process. Timers correct for the offset, but a large one means
+ * an uncorrected client (or one that failed to sync) would expire answers
+ * early (clock ahead of the server) or late (clock behind).
+ */
+
+const REPORT_TTL_MS = 60 * 60 * 1000;
+
+interface StoredReport extends ClockReportInput {
+  reportedAt: number;
+}
+
+export interface ClockSkewMetrics {
+  clients: number;
+  medianOffsetMs: number | null;
+  maxAbsOffsetMs: number | null;
+  aheadCount: number; // clock ahead of the server by more than CLOCK_SKEW_WARN_MS
+  behindCount: number; // clock behind the server by more than CLOCK_SKEW_WARN_MS
+  skewed: { userId: number; offsetMs: number; rttMs: number; reportedAt: string }[];
+}
+
+const reports = new Map<number, StoredReport>();
+
+export function recordClockReport(userId: number, report: ClockReportInput): void {
+  const now = Date.now();
+  reports.set(userId, { ...report, reportedAt: now });
+
+  for (const [id, stored] of reports) {
+    if (now - stored.reportedAt > REPORT_TTL_MS) reports.delete(id);
+  }
+
+  if (Math.abs(report.offsetMs) > GAME_CONFIG.CLOCK_SKEW_WARN_MS) {
+    console.warn(
+      `[Clock] User ${userId} clock is ${Math.round(-report.offsetMs)}ms off the server (rtt ${Math.round(report.rttMs)}ms)`
+    );
+  }
+}
+
+export function getClockSkewMetrics(): ClockSkewMetrics {
+  const entries = [...reports.entries()];
+  const offsets = entries.map(([, r]) => r.offsetMs).sort((a, b) => a - b);
+
+  // offsetMs = server - client, so a negative offset is a client running ahead
+  const skewed = entries
+    .filter(([, r]) => Math.abs(r.offsetMs) > GAME_CONFIG.CLOCK_SKEW_WARN_MS)
+    .map(([userId, r]) => ({
+      userId,
+      offsetMs: r.offsetMs,
+      rttMs: r.rttMs,
+      reportedAt: new Date(r.reportedAt).toISOString(),
+    }));
+
+  return {
+    clients: entries.length,
+    medianOffsetMs: offsets.length > 0 ? offsets[Math.floor(offsets.length / 2)] : null,
+    maxAbsOffsetMs: offsets.length > 0 ? Math.max(...offsets.map(Math.abs)) : null,
+    aheadCount: skewed.filter((r) => r.offsetMs < 0).length,
+    behindCount: skewed.filter((r) => r.offsetMs > 0).length,
+    skewed,
+  };
+}
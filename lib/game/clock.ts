@@ -0,0 +1,53 @@
+/**
+ * Time source for game timing. The engine reads the time only through this
+ * module, so a simulation can swap in a VirtualClock and play whole games
+ * without waiting for question and summary timers.
+ *
+ * The clock is process-wide; only swap it in a dedicated process (see
+ * scripts/simulate-games.ts), never in the app server.
+ */
+
+export interface Clock {
+  now(): number; // Epoch ms
+}
+
+export const systemClock: Clock = {
+  now: () => Date.now(),
+};
+
+/** Manually advanced clock for simulations. */
+export class VirtualClock implements Clock {
+  private current: number;
+
+  constructor(start: number = Date.now()) {
+    this.current = start;
+  }
+
+  now(): number {
+    return this.current;
+  }
+
+  advance(ms: number): void {
+    this.current += ms;
+  }
+}
+
+let activeClock: Clock = systemClock;
+
+export function setClock(clock: Clock): void {
+  activeClock = clock;
+}
+
+export function resetClock(): void {
+  activeClock = systemClock;
+}
+
+/** Current engine time in epoch ms. */
+export function now(): number {
+  return activeClock.now();
+}
+
+/** Current engine time as a Date, for timestamp columns. */
+export function nowDate(): Date {
+  return new Date(activeClock.now());
+}
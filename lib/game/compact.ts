@@ -0,0 +1,194 @@
+import type {
+  GameStateResponse,
+  LeaderboardEntry,
+  PlayerQuestionResult,
+} from './types';
+
+/**
+ * Compact wire encoding for GameStateResponse frames.
+ *
+ * Leaderboards and player results are sent as flat positional number arrays
+ * instead of arrays of keyed objects, and usernames travel in a dictionary
+ * that only carries entries the receiver hasn't seen yet on this connection.
+ * Used by useGameSSE; other clients keep getting plain JSON by default.
+ */
+
+export const COMPACT_MEDIA_TYPE = 'application/vnd.quiz.compact+json';
+
+const LEADERBOARD_STRIDE = 3; // userId, score, rank
+const RESULT_STRIDE = 5; // userId, answerIndex (-1 = timed out), isCorrect (0/1), pointsAwarded, elapsedMs (-1 = timed out)
+
+interface CompactBase {
+  g: number; // gameId
+  i: number; // currentQuestionIndex
+  n: number; // totalQuestions
+  lb: number[]; // leaderboard, flat triples
+  ls: number; // leaderboardSize
+  p: 0 | 1; // isParticipant
+  u?: (number | string)[]; // new dictionary entries: userId, username, ...
+}
+
+export type CompactGameState =
+  | { ph: 'idle' }
+  | (CompactBase & {
+      ph: 'question';
+      d: number; // deadline
+      q: [id: number, text: string, answers: string[], difficulty: string, category: string];
+      a: 0 | 1; // hasAnswered
+      s: number; // selectedAnswerIndex, -1 = none
+      ac: number; // answeredCount
+      tp: number; // totalPlayers
+    })
+  | (CompactBase & {
+      ph: 'summary';
+      d: number; // deadline
+      sm: [questionText: string, answers: string[], correctIndex: number, results: number[]];
+    })
+  | (CompactBase & { ph: 'finished' });
+
+/** Whether the request asked for the compact encoding (query param or Accept). */
+export function wantsCompactEncoding(request: Request): boolean {
+  if (new URL(request.url).searchParams.get('encoding') === 'compact') return true;
+  return request.headers.get('accept')?.includes(COMPACT_MEDIA_TYPE) ?? false;
+}
+
+/**
+ * Returns a stateful encoder for one connection. Each username is only sent
+ * the first time its user appears (or when it changes).
+ */
+export function createStateEncoder(): (state: GameStateResponse) => CompactGameState {
+  const sentUsernames = new Map<number, string>();
+
+  return (state) => {
+    if (state.phase === 'idle') return { ph: 'idle' };
+
+    const dictionary: (number | string)[] = [];
+    const remember = (userId: number, username: string) => {
+      if (sentUsernames.get(userId) !== username) {
+        sentUsernames.set(userId, username);
+        dictionary.push(userId, username);
+      }
+    };
+
+    const lb: number[] = [];
+    for (const entry of state.leaderboard) {
+      remember(entry.userId, entry.username);
+      lb.push(entry.userId, entry.score, entry.rank);
+    }
+
+    const base: CompactBase = {
+      g: state.gameId,
+      i: state.currentQuestionIndex,
+      n: state.totalQuestions,
+      lb,
+      ls: state.leaderboardSize,
+      p: state.isParticipant ? 1 : 0,
+    };
+
+    if (state.phase === 'summary') {
+      const results: number[] = [];
+      for (const r of state.summary.playerResults) {
+        remember(r.userId, r.username);
+        results.push(r.userId, r.answerIndex ?? -1, r.isCorrect ? 1 : 0, r.pointsAwarded, r.elapsedMs ?? -1);
+      }
+      if (dictionary.length > 0) base.u = dictionary;
+      return {
+        ...base,
+        ph: 'summary',
+        d: state.deadline,
+        sm: [state.summary.questionText, state.summary.answers, state.summary.correctIndex, results],
+      };
+    }
+
+    if (dictionary.length > 0) base.u = dictionary;
+
+    if (state.phase === 'question') {
+      const q = state.question;
+      return {
+        ...base,
+        ph: 'question',
+        d: state.deadline,
+        q: [q.id, q.text, q.answers, q.difficulty, q.category],
+        a: state.hasAnswered ? 1 : 0,
+        s: state.selectedAnswerIndex ?? -1,
+        ac: state.answeredCount,
+        tp: state.totalPlayers,
+      };
+    }
+
+    return { ...base, ph: 'finished' };
+  };
+}
+
+/** Returns a stateful decoder that accumulates the username dictionary. */
+export function createStateDecoder(): (frame: CompactGameState) => GameStateResponse {
+  const usernames = new Map<number, string>();
+
+  return (frame) => {
+    if (frame.ph === 'idle') return { phase: 'idle' };
+
+    if (frame.u) {
+      for (let i = 0; i < frame.u.length; i += 2) {
+        usernames.set(frame.u[i] as number, frame.u[i + 1] as string);
+      }
+    }
+
+    const leaderboard: LeaderboardEntry[] = [];
+    for (let i = 0; i < frame.lb.length; i += LEADERBOARD_STRIDE) {
+      const userId = frame.lb[i];
+      leaderboard.push({
+        userId,
+        username: usernames.get(userId) ?? '',
+        score: frame.lb[i + 1],
+        rank: frame.lb[i + 2],
+      });
+    }
+
+    const shared = {
+      gameId: frame.g,
+      currentQuestionIndex: frame.i,
+      totalQuestions: frame.n,
+      leaderboard,
+      leaderboardSize: frame.ls,
+      isParticipant: frame.p === 1,
+    };
+
+    if (frame.ph === 'question') {
+      const [id, text, answers, difficulty, category] = frame.q;
+      return {
+        ...shared,
+        phase: 'question',
+        deadline: frame.d,
+        question: { id, text, answers, difficulty, category },
+        hasAnswered: frame.a === 1,
+        selectedAnswerIndex: frame.s === -1 ? null : frame.s,
+        answeredCount: frame.ac,
+        totalPlayers: frame.tp,
+      };
+    }
+
+    if (frame.ph === 'summary') {
+      const [questionText, answers, correctIndex, results] = frame.sm;
+      const playerResults: PlayerQuestionResult[] = [];
+      for (let i = 0; i < results.length; i += RESULT_STRIDE) {
+        const userId = results[i];
+        playerResults.push({
+          userId,
+          username: usernames.get(userId) ?? '',
+          answerIndex: results[i + 1] === -1 ? null : results[i + 1],
+          isCorrect: results[i + 2] === 1,
+          pointsAwarded: results[i + 3],
+          elapsedMs: results[i + 4] === -1 ? null : results[i + 4],
+        });
+      }
+      return {
+        ...shared,
+        phase: 'summary',
+        deadline: frame.d,
+        summary: { questionText, answers, correctIndex, playerResults },
+      };
+    }
+
+    return { ...shared, phase: 'finished' };
+  };
+}
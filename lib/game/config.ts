@@ -4,9 +4,43 @@ export const GAME_CONFIG = {
   SUMMARY_DISPLAY_SECONDS: 8,
   POLL_INTERVAL_MS: 2000,
   SSE_POLL_INTERVAL_MS: 2000,
-  HEARTBEAT_INTERVAL_MS: 10000,       // client sends heartbeat every 10s
+  HEARTBEAT_INTERVAL_MS: 10000,       // presence refresh every 10s (heartbeat POST or open stream)
   HEARTBEAT_TIMEOUT_SECONDS: 30,      // user is "online" if lastActiveAt within 30s
   PRESENCE_POLL_INTERVAL_MS: 5000,    // admin refreshes online player list every 5s
+  LEADERBOARD_TOP_N: 10,              // in-game frames carry the top N entries...
+  LEADERBOARD_NEIGHBORS: 2,           // ...plus the player's own entry and N neighbors each side
+  LEADERBOARD_PAGE_SIZE: 50,          // default page size of the full-board endpoint
+  CLOCK_SYNC_SAMPLES: 5,              // /api/time round trips per sync; the lowest-RTT one wins
+  CLOCK_SYNC_INTERVAL_MS: 300000,     // re-sync the client clock every 5 min while connected
+  CLOCK_SKEW_WARN_MS: 1000,           // clients off by more than this are listed as skewed
+  DIFFICULTY_MIX: { easy: 0.4, medium: 0.4, hard: 0.2 }, // share of each game's questions
+  CALIBRATION_MIN_ATTEMPTS: 20,       // below this, a question keeps its static difficulty tag
+  CALIBRATION_EASY_MIN_RATE: 0.7,     // correct rate >= 70% counts as easy...
+  CALIBRATION_MEDIUM_MIN_RATE: 0.4,   // ...>= 40% as medium, anything lower as hard
   POINTS_CORRECT: 10, // stored x10 = 100
   POINTS_SPEED_BONUS_MAX: 5, // stored x10 = 50
 } as const;
+
+// Settings a single game can override (game_states.config_override), e.g. to
+// run short simulated games
+export interface GameRules {
+  QUESTIONS_PER_GAME: number;
+  QUESTION_TIME_LIMIT_SECONDS: number;
+  SUMMARY_DISPLAY_SECONDS: number;
+  POINTS_CORRECT: number;
+  POINTS_SPEED_BONUS_MAX: number;
+}
+
+export type GameConfigOverride = Partial<GameRules>;
+
+export const DEFAULT_GAME_RULES: GameRules = {
+  QUESTIONS_PER_GAME: GAME_CONFIG.QUESTIONS_PER_GAME,
+  QUESTION_TIME_LIMIT_SECONDS: GAME_CONFIG.QUESTION_TIME_LIMIT_SECONDS,
+  SUMMARY_DISPLAY_SECONDS: GAME_CONFIG.SUMMARY_DISPLAY_SECONDS,
+  POINTS_CORRECT: GAME_CONFIG.POINTS_CORRECT,
+  POINTS_SPEED_BONUS_MAX: GAME_CONFIG.POINTS_SPEED_BONUS_MAX,
+};
+
+export function resolveGameRules(override?: GameConfigOverride | null): GameRules {
+  return override ? { ...DEFAULT_GAME_RULES, ...override } : DEFAULT_GAME_RULES;
+}
@@ -7,11 +7,17 @@ import {
   playerAnswers,
   scores,
   users,
+  archivedScoreTotals,
+  questionStats,
 } from '@/lib/db/schema';
-import { eq, and, sql, inArray, gt } from 'drizzle-orm';
+import { eq, and, or, sql, inArray, gt, lte, ne, isNull } from 'drizzle-orm';
 import { getParticipantCount } from '@/lib/db/repositories/participants';
 import { findPlayerAnswer, getAnswerCount, getQuestionAnswersWithUsers } from '@/lib/db/repositories/answers';
-import { GAME_CONFIG } from './config';
+import { GAME_CONFIG, resolveGameRules, type GameConfigOverride, type GameRules } from './config';
+import * as clock from './clock';
+import { effectiveDifficulty } from './question-stats';
+import { appendGameEvents } from './events';
+import { loadArchivedResults, type ArchivedResults } from './archive';
 import {
   getShufflePermutation,
   shuffleAnswers,
@@ -23,8 +29,11 @@ import type {
   QuestionState,
   SummaryState,
   LeaderboardEntry,
+  LeaderboardPage,
   PlayerQuestionResult,
   GlobalLeaderboardEntry,
+  ScoreAuditResult,
+  GameEvent,
 } from './types';
 
 // ============================================
@@ -35,18 +44,45 @@ export async function selectQuestionsForGame(
   count: number = GAME_CONFIG.QUESTIONS_PER_GAME
 ): Promise<number[]> {
   const allQuestions = await db
-    .select({ id: questions.id })
-    .from(questions);
+    .select({
+      id: questions.id,
+      difficulty: questions.difficulty,
+      attempts: questionStats.attempts,
+      correct: questionStats.correct,
+    })
+    .from(questions)
+    .leftJoin(questionStats, eq(questionStats.questionId, questions.id))
+    .where(isNull(questions.deletedAt));
+
+  // Bucket by observed difficulty (static tag until enough answers exist)
+  const buckets = new Map<string, number[]>();
+  for (const q of allQuestions) {
+    const difficulty = effectiveDifficulty(q.difficulty, q.attempts, q.correct);
+    const bucket = buckets.get(difficulty) ?? [];
+    bucket.push(q.id);
+    buckets.set(difficulty, bucket);
+  }
+  for (const ids of buckets.values()) shuffleInPlace(ids);
 
-  const ids = allQuestions.map((q) => q.id);
+  // Take each difficulty's share, then fill any shortfall from what's left
+  const selected: number[] = [];
+  for (const [difficulty, share] of Object.entries(GAME_CONFIG.DIFFICULTY_MIX)) {
+    const bucket = buckets.get(difficulty) ?? [];
+    selected.push(...bucket.splice(0, Math.round(count * share)));
+  }
+  const rest = shuffleInPlace([...buckets.values()].flat());
+  selected.push(...rest.slice(0, Math.max(0, count - selected.length)));
 
-  // Fisher-Yates shuffle
-  for (let i = ids.length - 1; i > 0; i--) {
+  return shuffleInPlace(selected).slice(0, Math.min(count, allQuestions.length));
+}
+
+// Fisher-Yates shuffle
+function shuffleInPlace<T>(items: T[]): T[] {
+  for (let i = items.length - 1; i > 0; i--) {
     const j = Math.floor(Math.random() * (i + 1));
-    [ids[i], ids[j]] = [ids[j], ids[i]];
+    [items[i], items[j]] = [items[j], items[i]];
   }
-
-  return ids.slice(0, Math.min(count, ids.length));
+  return items;
 }
 
 // ============================================
@@ -66,7 +102,7 @@ export async function getActiveGame(): Promise<{ id: number } | null> {
 // ============================================
 
 export async function getOnlinePlayers(): Promise<{ id: number; username: string }[]> {
-  const threshold = new Date(Date.now() - GAME_CONFIG.HEARTBEAT_TIMEOUT_SECONDS * 1000);
+  const threshold = new Date(clock.now() - GAME_CONFIG.HEARTBEAT_TIMEOUT_SECONDS * 1000);
   return db
     .select({ id: users.id, username: users.username })
     .from(users)
@@ -76,20 +112,51 @@ export async function getOnlinePlayers(): Promise<{ id: number; username: string
     ));
 }
 
+/** Mark a user as online (refreshes users.lastActiveAt). Returns the time written. */
+export async function touchPresence(userId: number): Promise<Date> {
+  const now = clock.nowDate();
+  await db
+    .update(users)
+    .set({ lastActiveAt: now })
+    .where(eq(users.id, userId));
+  return now;
+}
+
+/**
+ * Mark a user as offline immediately instead of waiting for the timeout.
+ * Skipped if presence was refreshed after `lastTouchedAt` (another tab or a
+ * reconnected stream is still active).
+ */
+export async function clearPresence(userId: number, lastTouchedAt: Date): Promise<void> {
+  await db
+    .update(users)
+    .set({ lastActiveAt: null })
+    .where(and(eq(users.id, userId), lte(users.lastActiveAt, lastTouchedAt)));
+}
+
 // ============================================
 // GAME INITIALIZATION
 // ============================================
 
-export async function initializeGame(playerIds: number[]): Promise<number> {
+export interface InitializeGameOptions {
+  // Per-game GAME_CONFIG overrides, stored with the game state
+  config?: GameConfigOverride;
+}
+
+export async function initializeGame(
+  playerIds: number[],
+  { config }: InitializeGameOptions = {}
+): Promise<number> {
   const uniquePlayerIds = [...new Set(playerIds)];
   if (uniquePlayerIds.length < 2) {
     throw new Error('Se necesitan al menos 2 participantes para iniciar');
   }
 
-  const questionOrder = await selectQuestionsForGame();
+  const questionOrder = await selectQuestionsForGame(resolveGameRules(config).QUESTIONS_PER_GAME);
 
   return await db.transaction(async (tx) => {
     const [game] = await tx.insert(games).values({ status: 'playing' }).returning();
+    const startedAt = clock.nowDate();
 
     await tx.insert(gameParticipants).values(
       uniquePlayerIds.map((userId) => ({ gameId: game.id, userId }))
@@ -99,14 +166,19 @@ export async function initializeGame(playerIds: number[]): Promise<number> {
       gameId: game.id,
       currentQuestionIndex: 0,
       questionOrder,
-      questionStartTime: new Date(),
+      questionStartTime: startedAt,
       phase: 'question',
+      configOverride: config ?? null,
     });
 
     await tx.insert(scores).values(
       uniquePlayerIds.map((userId) => ({ gameId: game.id, userId, score: 0 }))
     );
 
+    await appendGameEvents(tx, game.id, [
+      { type: 'started', questionOrder, playerIds: uniquePlayerIds, ...(config ? { config } : {}) },
+    ], startedAt);
+
     return game.id;
   });
 }
@@ -117,10 +189,15 @@ export async function initializeGame(playerIds: number[]): Promise<number> {
 
 export async function finishGame(gameId: number): Promise<void> {
   await db.transaction(async (tx) => {
-    await tx
+    const finished = await tx
       .update(gameStates)
-      .set({ phase: 'finished', updatedAt: new Date() })
-      .where(eq(gameStates.gameId, gameId));
+      .set({ phase: 'finished', version: nextVersion(), updatedAt: clock.nowDate() })
+      .where(and(eq(gameStates.gameId, gameId), ne(gameStates.phase, 'finished')))
+      .returning({ id: gameStates.id });
+
+    if (finished.length > 0) {
+      await appendGameEvents(tx, gameId, [{ type: 'finished' }]);
+    }
 
     await tx
       .update(games)
@@ -135,16 +212,17 @@ export async function finishGame(gameId: number): Promise<void> {
 
 export function calculatePoints(
   isCorrect: boolean,
-  elapsedSeconds: number
+  elapsedSeconds: number,
+  rules: GameRules = resolveGameRules()
 ): number {
   if (!isCorrect) return 0;
-  const base = GAME_CONFIG.POINTS_CORRECT * 10;
+  const base = rules.POINTS_CORRECT * 10;
   const bonusFraction = Math.max(
     0,
-    1 - elapsedSeconds / GAME_CONFIG.QUESTION_TIME_LIMIT_SECONDS
+    1 - elapsedSeconds / rules.QUESTION_TIME_LIMIT_SECONDS
   );
   const bonus = Math.round(
-    GAME_CONFIG.POINTS_SPEED_BONUS_MAX * 10 * bonusFraction
+    rules.POINTS_SPEED_BONUS_MAX * 10 * bonusFraction
   );
   return base + bonus;
 }
@@ -153,6 +231,13 @@ export function calculatePoints(
 // ANSWER SUBMISSION
 // ============================================
 
+/** Errors from submitAnswer() that are the client's fault (mapped to 409). */
+export const ANSWER_CONFLICT_ERRORS: ReadonlySet<string> = new Set([
+  'Ya respondiste esta pregunta',
+  'Tiempo agotado',
+  'No está en fase de pregunta',
+]);
+
 export async function submitAnswer(
   gameId: number,
   userId: number,
@@ -177,9 +262,9 @@ export async function submitAnswer(
   }
 
   // Check time limit
-  const elapsed =
-    (Date.now() - new Date(gameState.questionStartTime!).getTime()) / 1000;
-  if (elapsed > GAME_CONFIG.QUESTION_TIME_LIMIT_SECONDS) {
+  const rules = resolveGameRules(gameState.configOverride);
+  const elapsedMs = clock.now() - new Date(gameState.questionStartTime!).getTime();
+  if (elapsedMs > rules.QUESTION_TIME_LIMIT_SECONDS * 1000) {
     throw new Error('Tiempo agotado');
   }
 
@@ -197,23 +282,49 @@ export async function submitAnswer(
   const originalAnswerIndex = shuffledToOriginal(answerIndex, permutation);
 
   const isCorrect = originalAnswerIndex === question.correctIndex;
-  const pointsAwarded = calculatePoints(isCorrect, elapsed);
+  const pointsAwarded = calculatePoints(isCorrect, elapsedMs / 1000, rules);
 
   await db.transaction(async (tx) => {
+    // Shared row lock: concurrent answers don't wait for each other, but a
+    // phase transition (an UPDATE of this row) waits for them, so the answer
+    // is logged before the event that closes its question.
+    const [locked] = await tx
+      .select({ phase: gameStates.phase, currentQuestionIndex: gameStates.currentQuestionIndex })
+      .from(gameStates)
+      .where(eq(gameStates.gameId, gameId))
+      .for('share');
+
+    if (locked?.phase !== 'question' || locked.currentQuestionIndex !== gameState.currentQuestionIndex) {
+      throw new Error('Tiempo agotado');
+    }
+
     await tx.insert(playerAnswers).values({
       gameId,
       userId,
       questionId: currentQuestionId,
       answerIndex: originalAnswerIndex,
       isCorrect,
+      elapsedMs,
+      pointsAwarded,
     });
 
     if (pointsAwarded > 0) {
       await tx
         .update(scores)
-        .set({ score: sql`${scores.score} + ${pointsAwarded}`, updatedAt: new Date() })
+        .set({ score: sql`${scores.score} + ${pointsAwarded}`, updatedAt: clock.nowDate() })
         .where(and(eq(scores.gameId, gameId), eq(scores.userId, userId)));
     }
+
+    await appendGameEvents(tx, gameId, [{
+      type: 'answer',
+      userId,
+      questionIndex: gameState.currentQuestionIndex,
+      questionId: currentQuestionId,
+      answerIndex: originalAnswerIndex,
+      isCorrect,
+      elapsedMs,
+      pointsAwarded,
+    }]);
   });
 
   // Check if all players answered — if so, transition to summary
@@ -226,6 +337,74 @@ export async function submitAnswer(
 // STATE RESOLUTION (LAZY EVALUATION)
 // ============================================
 
+/** SQL expression that bumps game_states.version inside an update. */
+function nextVersion() {
+  return sql`${gameStates.version} + 1`;
+}
+
+/** Matches the game_states row only while it is still in `phase` at `questionIndex`. */
+function inPhase(gameId: number, phase: string, questionIndex: number) {
+  return and(
+    eq(gameStates.gameId, gameId),
+    eq(gameStates.phase, phase),
+    eq(gameStates.currentQuestionIndex, questionIndex)
+  );
+}
+
+function elapsedSeconds(questionStartTime: Date | null): number {
+  return (clock.now() - new Date(questionStartTime!).getTime()) / 1000;
+}
+
+/** Whether a lazy time-based transition would fire on the next resolve. */
+function isTransitionDue(gameState: {
+  phase: string;
+  questionStartTime: Date | null;
+  configOverride: GameConfigOverride | null;
+}): boolean {
+  const rules = resolveGameRules(gameState.configOverride);
+  if (gameState.phase === 'question') {
+    return elapsedSeconds(gameState.questionStartTime) > rules.QUESTION_TIME_LIMIT_SECONDS;
+  }
+  if (gameState.phase === 'summary') {
+    return elapsedSeconds(gameState.questionStartTime) > rules.SUMMARY_DISPLAY_SECONDS;
+  }
+  return false;
+}
+
+/**
+ * Revision of the state a game's responses are built from: game_states.version
+ * (bumped on phase transitions) plus the game's answer count, since answers
+ * change the counters and scores without touching game_states.
+ */
+function stateRevision(version: number, answerCount: number): string {
+  return `${version}.${answerCount}`;
+}
+
+function gameAnswerCount(gameId: number) {
+  return sql<number>`(select count(*)::int from ${playerAnswers} where ${playerAnswers.gameId} = ${gameId})`;
+}
+
+/**
+ * Cheap single-row read of the game's state revision.
+ * Returns null when the game doesn't exist or a time-based transition is
+ * pending, in which case the caller must run a full resolveGameState().
+ */
+export async function peekGameStateRevision(gameId: number): Promise<string | null> {
+  const [gameState] = await db
+    .select({
+      phase: gameStates.phase,
+      version: gameStates.version,
+      questionStartTime: gameStates.questionStartTime,
+      configOverride: gameStates.configOverride,
+      answerCount: gameAnswerCount(gameId),
+    })
+    .from(gameStates)
+    .where(eq(gameStates.gameId, gameId));
+
+  if (!gameState || isTransitionDue(gameState)) return null;
+  return stateRevision(gameState.version, gameState.answerCount);
+}
+
 async function checkAndTransitionToSummary(gameId: number): Promise<void> {
   const gameState = await db.query.gameStates.findFirst({
     where: eq(gameStates.gameId, gameId),
@@ -240,14 +419,25 @@ async function checkAndTransitionToSummary(gameId: number): Promise<void> {
   const answerTotal = await getAnswerCount(gameId, currentQuestionId);
 
   if (answerTotal >= participantTotal) {
-    await db
-      .update(gameStates)
-      .set({
-        phase: 'summary',
-        questionStartTime: new Date(),
-        updatedAt: new Date(),
-      })
-      .where(eq(gameStates.gameId, gameId));
+    await db.transaction(async (tx) => {
+      const changedAt = clock.nowDate();
+      const changed = await tx
+        .update(gameStates)
+        .set({
+          phase: 'summary',
+          questionStartTime: changedAt,
+          version: nextVersion(),
+          updatedAt: changedAt,
+        })
+        .where(inPhase(gameId, 'question', gameState.currentQuestionIndex))
+        .returning({ id: gameStates.id });
+
+      if (changed.length > 0) {
+        await appendGameEvents(tx, gameId, [
+          { type: 'phase_changed', phase: 'summary', questionIndex: gameState.currentQuestionIndex },
+        ], changedAt);
+      }
+    });
   }
 }
 
@@ -258,9 +448,8 @@ async function handleTimeExpiry(gameId: number): Promise<void> {
 
   if (!gameState || gameState.phase !== 'question') return;
 
-  const elapsed =
-    (Date.now() - new Date(gameState.questionStartTime!).getTime()) / 1000;
-  if (elapsed <= GAME_CONFIG.QUESTION_TIME_LIMIT_SECONDS) return;
+  const rules = resolveGameRules(gameState.configOverride);
+  if (elapsedSeconds(gameState.questionStartTime) <= rules.QUESTION_TIME_LIMIT_SECONDS) return;
 
   const questionOrder = gameState.questionOrder as number[];
   const currentQuestionId = questionOrder[gameState.currentQuestionIndex];
@@ -291,6 +480,21 @@ async function handleTimeExpiry(gameId: number): Promise<void> {
   const unanswered = participants.filter((p) => !answeredUserIds.has(p.userId));
 
   await db.transaction(async (tx) => {
+    // Transition to summary (once, if another request hasn't already)
+    const changedAt = clock.nowDate();
+    const changed = await tx
+      .update(gameStates)
+      .set({
+        phase: 'summary',
+        questionStartTime: changedAt,
+        version: nextVersion(),
+        updatedAt: changedAt,
+      })
+      .where(inPhase(gameId, 'question', gameState.currentQuestionIndex))
+      .returning({ id: gameStates.id });
+
+    if (changed.length === 0) return;
+
     // Insert timeout answers for non-responders
     if (unanswered.length > 0) {
       await tx.insert(playerAnswers).values(
@@ -304,15 +508,19 @@ async function handleTimeExpiry(gameId: number): Promise<void> {
       );
     }
 
-    // Transition to summary
-    await tx
-      .update(gameStates)
-      .set({
-        phase: 'summary',
-        questionStartTime: new Date(),
-        updatedAt: new Date(),
-      })
-      .where(eq(gameStates.gameId, gameId));
+    await appendGameEvents(tx, gameId, [
+      ...unanswered.map((p): GameEvent => ({
+        type: 'answer',
+        userId: p.userId,
+        questionIndex: gameState.currentQuestionIndex,
+        questionId: currentQuestionId,
+        answerIndex: null,
+        isCorrect: false,
+        elapsedMs: null,
+        pointsAwarded: 0,
+      })),
+      { type: 'phase_changed', phase: 'summary', questionIndex: gameState.currentQuestionIndex },
+    ], changedAt);
   });
 }
 
@@ -323,9 +531,8 @@ async function handleSummaryExpiry(gameId: number): Promise<void> {
 
   if (!gameState || gameState.phase !== 'summary') return;
 
-  const elapsed =
-    (Date.now() - new Date(gameState.questionStartTime!).getTime()) / 1000;
-  if (elapsed <= GAME_CONFIG.SUMMARY_DISPLAY_SECONDS) return;
+  const rules = resolveGameRules(gameState.configOverride);
+  if (elapsedSeconds(gameState.questionStartTime) <= rules.SUMMARY_DISPLAY_SECONDS) return;
 
   const questionOrder = gameState.questionOrder as number[];
   const nextIndex = gameState.currentQuestionIndex + 1;
@@ -335,15 +542,26 @@ async function handleSummaryExpiry(gameId: number): Promise<void> {
     await finishGame(gameId);
   } else {
     // Next question
-    await db
-      .update(gameStates)
-      .set({
-        currentQuestionIndex: nextIndex,
-        phase: 'question',
-        questionStartTime: new Date(),
-        updatedAt: new Date(),
-      })
-      .where(eq(gameStates.gameId, gameId));
+    await db.transaction(async (tx) => {
+      const changedAt = clock.nowDate();
+      const changed = await tx
+        .update(gameStates)
+        .set({
+          currentQuestionIndex: nextIndex,
+          phase: 'question',
+          questionStartTime: changedAt,
+          version: nextVersion(),
+          updatedAt: changedAt,
+        })
+        .where(inPhase(gameId, 'summary', gameState.currentQuestionIndex))
+        .returning({ id: gameStates.id });
+
+      if (changed.length > 0) {
+        await appendGameEvents(tx, gameId, [
+          { type: 'phase_changed', phase: 'question', questionIndex: nextIndex },
+        ], changedAt);
+      }
+    });
   }
 }
 
@@ -355,12 +573,25 @@ export async function resolveGameState(
   gameId: number,
   userId: number
 ): Promise<GameStateResponse> {
+  const { state } = await resolveVersionedGameState(gameId, userId);
+  return state;
+}
+
+/**
+ * Same as resolveGameState(), also returning the state revision the response
+ * was built from. The body is never older than that revision.
+ */
+export async function resolveVersionedGameState(
+  gameId: number,
+  userId: number
+): Promise<{ state: GameStateResponse; version: string }> {
   // Trigger any pending transitions
   await handleTimeExpiry(gameId);
   await handleSummaryExpiry(gameId);
 
   const gameState = await db.query.gameStates.findFirst({
     where: eq(gameStates.gameId, gameId),
+    extras: { answerCount: gameAnswerCount(gameId).as('answer_count') },
   });
 
   if (!gameState) {
@@ -368,7 +599,18 @@ export async function resolveGameState(
   }
 
   const questionOrder = gameState.questionOrder as number[];
-  const leaderboard = await getLeaderboard(gameId);
+  const version = stateRevision(gameState.version, gameState.answerCount);
+  const rules = resolveGameRules(gameState.configOverride);
+
+  // In-game frames only carry a window of the board; the final frame has all of it
+  let leaderboard: LeaderboardEntry[];
+  let leaderboardSize: number;
+  if (gameState.phase === 'finished') {
+    leaderboard = await getLeaderboard(gameId);
+    leaderboardSize = leaderboard.length;
+  } else {
+    ({ entries: leaderboard, total: leaderboardSize } = await getLeaderboardWindow(gameId, userId));
+  }
 
   // Check if user is a participant
   const participant = await db.query.gameParticipants.findFirst({
@@ -384,6 +626,7 @@ export async function resolveGameState(
     currentQuestionIndex: gameState.currentQuestionIndex,
     totalQuestions: questionOrder.length,
     leaderboard,
+    leaderboardSize,
     isParticipant,
   };
 
@@ -397,12 +640,10 @@ export async function resolveGameState(
 
     const permutation = getShufflePermutation(currentQuestionId, gameId);
 
-    const elapsed =
-      (Date.now() - new Date(gameState.questionStartTime!).getTime()) / 1000;
-    const timeRemainingMs = Math.max(
-      0,
-      (GAME_CONFIG.QUESTION_TIME_LIMIT_SECONDS - elapsed) * 1000
-    );
+    // Absolute, so the frame doesn't change while the clock runs
+    const deadline =
+      new Date(gameState.questionStartTime!).getTime() +
+      rules.QUESTION_TIME_LIMIT_SECONDS * 1000;
 
     const totalPlayers = await getParticipantCount(gameId);
     const answeredCount = await getAnswerCount(gameId, currentQuestionId);
@@ -423,10 +664,10 @@ export async function resolveGameState(
       selectedAnswerIndex = null;
     }
 
-    return {
+    const state = {
       ...shared,
       phase: 'question',
-      timeRemainingMs,
+      deadline,
       question: {
         id: question.id,
         text: question.questionText,
@@ -439,6 +680,8 @@ export async function resolveGameState(
       answeredCount,
       totalPlayers,
     } satisfies QuestionState;
+
+    return { state, version };
   }
 
   if (gameState.phase === 'summary') {
@@ -451,12 +694,9 @@ export async function resolveGameState(
 
     const permutation = getShufflePermutation(currentQuestionId, gameId);
 
-    const elapsed =
-      (Date.now() - new Date(gameState.questionStartTime!).getTime()) / 1000;
-    const timeRemainingMs = Math.max(
-      0,
-      (GAME_CONFIG.SUMMARY_DISPLAY_SECONDS - elapsed) * 1000
-    );
+    const deadline =
+      new Date(gameState.questionStartTime!).getTime() +
+      rules.SUMMARY_DISPLAY_SECONDS * 1000;
 
     const answers = await getQuestionAnswersWithUsers(gameId, currentQuestionId);
 
@@ -467,13 +707,14 @@ export async function resolveGameState(
         ? originalToShuffled(a.answerIndex, permutation)
         : null,
       isCorrect: a.isCorrect,
-      pointsAwarded: 0,
+      pointsAwarded: a.pointsAwarded,
+      elapsedMs: a.elapsedMs,
     }));
 
-    return {
+    const state = {
       ...shared,
       phase: 'summary',
-      timeRemainingMs,
+      deadline,
       summary: {
         questionText: question.questionText,
         answers: shuffleAnswers(question.answers as string[], permutation),
@@ -481,14 +722,16 @@ export async function resolveGameState(
         playerResults,
       },
     } satisfies SummaryState;
+
+    return { state, version };
   }
 
   if (gameState.phase === 'finished') {
-    return { ...shared, phase: 'finished' };
+    return { state: { ...shared, phase: 'finished' }, version };
   }
 
   // Fallback (should not reach here)
-  return { ...shared, phase: 'finished' };
+  return { state: { ...shared, phase: 'finished' }, version };
 }
 
 // ============================================
@@ -507,7 +750,7 @@ export async function getLeaderboard(
     .from(scores)
     .innerJoin(users, eq(scores.userId, users.id))
     .where(eq(scores.gameId, gameId))
-    .orderBy(sql`${scores.score} DESC`);
+    .orderBy(sql`${scores.score} DESC, ${scores.userId} ASC`);
 
   return results.map((r, i) => ({
     userId: r.userId,
@@ -517,24 +760,137 @@ export async function getLeaderboard(
   }));
 }
 
+// Scores of one game ranked in SQL, same order as getLeaderboard()
+function rankedScores(gameId: number) {
+  return db.$with('ranked').as(
+    db
+      .select({
+        userId: scores.userId,
+        score: scores.score,
+        rank: sql<number>`(row_number() over (order by ${scores.score} desc, ${scores.userId} asc))::int`.as('rank'),
+        total: sql<number>`(count(*) over ())::int`.as('total'),
+      })
+      .from(scores)
+      .where(eq(scores.gameId, gameId))
+  );
+}
+
+/**
+ * Leaderboard projection for in-game frames: the top LEADERBOARD_TOP_N
+ * entries plus the user's own entry and LEADERBOARD_NEIGHBORS on each side.
+ * Ranking happens in Postgres, so only the window is transferred.
+ */
+export async function getLeaderboardWindow(
+  gameId: number,
+  userId: number
+): Promise<{ entries: LeaderboardEntry[]; total: number }> {
+  const ranked = rankedScores(gameId);
+  const ownRank = db.select({ rank: ranked.rank }).from(ranked).where(eq(ranked.userId, userId));
+
+  const rows = await db
+    .with(ranked)
+    .select({
+      userId: ranked.userId,
+      username: users.username,
+      score: ranked.score,
+      rank: ranked.rank,
+      total: ranked.total,
+    })
+    .from(ranked)
+    .innerJoin(users, eq(ranked.userId, users.id))
+    .where(or(
+      lte(ranked.rank, GAME_CONFIG.LEADERBOARD_TOP_N),
+      sql`abs(${ranked.rank} - (${ownRank})) <= ${GAME_CONFIG.LEADERBOARD_NEIGHBORS}`
+    ))
+    .orderBy(ranked.rank);
+
+  return {
+    entries: rows.map((r) => ({
+      userId: r.userId,
+      username: r.username,
+      score: r.score,
+      rank: r.rank,
+    })),
+    total: rows[0]?.total ?? 0,
+  };
+}
+
+/** One page of the full leaderboard, for on-demand browsing. */
+export async function getLeaderboardPage(
+  gameId: number,
+  offset: number,
+  limit: number
+): Promise<LeaderboardPage> {
+  const ranked = rankedScores(gameId);
+
+  const rows = await db
+    .with(ranked)
+    .select({
+      userId: ranked.userId,
+      username: users.username,
+      score: ranked.score,
+      rank: ranked.rank,
+      total: ranked.total,
+    })
+    .from(ranked)
+    .innerJoin(users, eq(ranked.userId, users.id))
+    .where(and(gt(ranked.rank, offset), lte(ranked.rank, offset + limit)))
+    .orderBy(ranked.rank);
+
+  // Past the last page there are no rows to read the total from
+  const total = rows[0]?.total ?? await getParticipantCount(gameId);
+
+  return {
+    entries: rows.map((r) => ({
+      userId: r.userId,
+      username: r.username,
+      score: r.score,
+      rank: r.rank,
+    })),
+    total,
+    offset,
+    limit,
+  };
+}
+
 // ============================================
 // GLOBAL LEADERBOARD
 // ============================================
 
 export async function getGlobalLeaderboard(): Promise<GlobalLeaderboardEntry[]> {
-  const results = await db
+  // Finished games still in the hot tables plus the rollup of archived ones
+  const liveScores = db
     .select({
       userId: scores.userId,
-      username: users.username,
-      totalScore: sql<number>`sum(${scores.score})`.as('total_score'),
-      gamesPlayed: sql<number>`count(distinct ${scores.gameId})`.as('games_played'),
+      totalScore: sql<number>`${scores.score}`.as('total_score'),
+      gamesPlayed: sql<number>`1`.as('games_played'),
     })
     .from(scores)
-    .innerJoin(users, eq(scores.userId, users.id))
     .innerJoin(games, eq(scores.gameId, games.id))
-    .where(eq(games.status, 'finished'))
-    .groupBy(scores.userId, users.username)
-    .orderBy(sql`sum(${scores.score}) DESC`);
+    .where(eq(games.status, 'finished'));
+
+  const archivedScores = db
+    .select({
+      userId: archivedScoreTotals.userId,
+      totalScore: archivedScoreTotals.totalScore,
+      gamesPlayed: archivedScoreTotals.gamesPlayed,
+    })
+    .from(archivedScoreTotals);
+
+  const combined = db.$with('combined').as(liveScores.unionAll(archivedScores));
+
+  const results = await db
+    .with(combined)
+    .select({
+      userId: combined.userId,
+      username: users.username,
+      totalScore: sql<number>`sum(${combined.totalScore})::int`,
+      gamesPlayed: sql<number>`sum(${combined.gamesPlayed})::int`,
+    })
+    .from(combined)
+    .innerJoin(users, eq(combined.userId, users.id))
+    .groupBy(combined.userId, users.username)
+    .orderBy(sql`sum(${combined.totalScore}) DESC`);
 
   return results.map((r, i) => ({
     userId: r.userId,
@@ -545,6 +901,43 @@ export async function getGlobalLeaderboard(): Promise<GlobalLeaderboardEntry[]>
   }));
 }
 
+// ============================================
+// SCORE AUDIT
+// ============================================
+
+/**
+ * Recompute each player's score as sum(player_answers.points_awarded) and
+ * return the players whose stored score disagrees. Answers recorded before
+ * points were persisted carry 0 points, so older games will show mismatches.
+ */
+export async function auditGameScores(gameId: number): Promise<ScoreAuditResult> {
+  const answerPoints = db
+    .select({
+      userId: playerAnswers.userId,
+      points: sql<number>`sum(${playerAnswers.pointsAwarded})::int`.as('points'),
+    })
+    .from(playerAnswers)
+    .where(eq(playerAnswers.gameId, gameId))
+    .groupBy(playerAnswers.userId)
+    .as('answer_points');
+
+  const rows = await db
+    .select({
+      userId: scores.userId,
+      storedScore: scores.score,
+      recomputedScore: sql<number>`coalesce(${answerPoints.points}, 0)`,
+    })
+    .from(scores)
+    .leftJoin(answerPoints, eq(answerPoints.userId, scores.userId))
+    .where(eq(scores.gameId, gameId));
+
+  return {
+    gameId,
+    checked: rows.length,
+    mismatches: rows.filter((r) => r.storedScore !== r.recomputedScore),
+  };
+}
+
 // ============================================
 // GAME RESULTS
 // ============================================
@@ -557,7 +950,19 @@ export async function getGameResults(gameId: number) {
   if (!gameState) throw new Error('Juego no encontrado');
 
   const questionOrder = gameState.questionOrder as number[];
-  const leaderboard = await getLeaderboard(gameId);
+  const game = await db.query.games.findFirst({
+    where: eq(games.id, gameId),
+    columns: { status: true },
+  });
+
+  // Archived games no longer have answer/score rows
+  let archived: ArchivedResults | null = null;
+  if (game?.status === 'archived') {
+    archived = await loadArchivedResults(gameId);
+    if (!archived) throw new Error('Juego no encontrado');
+  }
+
+  const leaderboard = archived?.leaderboard ?? await getLeaderboard(gameId);
 
   // Get all questions for this game
   const gameQuestions = questionOrder.length > 0
@@ -568,13 +973,15 @@ export async function getGameResults(gameId: number) {
     : [];
 
   // Get all answers for this game
-  const allAnswers = await db
+  const allAnswers = archived?.answers ?? await db
     .select({
       userId: playerAnswers.userId,
       username: users.username,
       questionId: playerAnswers.questionId,
       answerIndex: playerAnswers.answerIndex,
       isCorrect: playerAnswers.isCorrect,
+      pointsAwarded: playerAnswers.pointsAwarded,
+      elapsedMs: playerAnswers.elapsedMs,
     })
     .from(playerAnswers)
     .innerJoin(users, eq(playerAnswers.userId, users.id))
@@ -601,6 +1008,8 @@ export async function getGameResults(gameId: number) {
           ? originalToShuffled(a.answerIndex, permutation)
           : null,
         isCorrect: a.isCorrect,
+        pointsAwarded: a.pointsAwarded,
+        elapsedMs: a.elapsedMs,
       })),
     };
   });
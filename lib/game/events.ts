@@ -0,0 +1,83 @@
+import { db } from '@/lib/db';
+import { gameEvents, gameParticipants, questions, users } from '@/lib/db/schema';
+import { asc, eq, inArray } from 'drizzle-orm';
+import { nowDate } from './clock';
+import { foldGameEvents, type ReplayedGame, type ReplayReferences } from './replay';
+import type { GameEvent, GameEventType, RecordedGameEvent } from './types';
+
+/**
+ * Read/write side of the `game_events` log. The engine appends events in the
+ * same transaction as each change, after it has updated (and so locked) the
+ * game_states row; replaying a game is one range scan of
+ * `game_event_game_idx`.
+ */
+
+type Transaction = Parameters<Parameters<typeof db.transaction>[0]>[0];
+
+/** Append events for one game. Call after the game_states update in `tx`. */
+export async function appendGameEvents(
+  tx: Transaction,
+  gameId: number,
+  events: GameEvent[],
+  at: Date = nowDate()
+): Promise<void> {
+  if (events.length === 0) return;
+  await tx.insert(gameEvents).values(
+    events.map(({ type, ...payload }) => ({ gameId, type, payload, createdAt: at }))
+  );
+}
+
+/** A game's full log, in order. */
+export async function loadGameEvents(gameId: number): Promise<RecordedGameEvent[]> {
+  const rows = await db
+    .select({ type: gameEvents.type, payload: gameEvents.payload, createdAt: gameEvents.createdAt })
+    .from(gameEvents)
+    .where(eq(gameEvents.gameId, gameId))
+    .orderBy(asc(gameEvents.id));
+
+  return rows.map((r) => ({
+    ...r.payload,
+    type: r.type as GameEventType,
+    at: r.createdAt.getTime(),
+  }) as RecordedGameEvent);
+}
+
+/**
+ * Rebuild a game from its log, plus the question texts and usernames that
+ * projectGameState() needs. Returns null when the game has no events
+ * (started before the log existed, or archived).
+ */
+export async function loadGameReplay(
+  gameId: number
+): Promise<{ game: ReplayedGame; refs: ReplayReferences } | null> {
+  const game = foldGameEvents(gameId, await loadGameEvents(gameId));
+  if (!game) return null;
+
+  const questionRows = game.questionOrder.length > 0
+    ? await db
+        .select({
+          id: questions.id,
+          text: questions.questionText,
+          answers: questions.answers,
+          correctIndex: questions.correctIndex,
+          difficulty: questions.difficulty,
+          category: questions.category,
+        })
+        .from(questions)
+        .where(inArray(questions.id, game.questionOrder))
+    : [];
+
+  const userRows = await db
+    .select({ id: users.id, username: users.username })
+    .from(gameParticipants)
+    .innerJoin(users, eq(gameParticipants.userId, users.id))
+    .where(eq(gameParticipants.gameId, gameId));
+
+  return {
+    game,
+    refs: {
+      questions: new Map(questionRows.map((q) => [q.id, { ...q, answers: q.answers as string[] }])),
+      usernames: new Map(userRows.map((u) => [u.id, u.username])),
+    },
+  };
+}
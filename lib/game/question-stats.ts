@@ -0,0 +1,137 @@
+import { db } from '@/lib/db';
+import { analyticsWatermarks } from '@/lib/db/schema';
+import { eq, sql } from 'drizzle-orm';
+import { GAME_CONFIG } from './config';
+
+/**
+ * Incremental per-question analytics. Each run folds the player_answers rows
+ * added since the last watermark (by id) into `question_stats`, so the cost
+ * is proportional to new answers, never to the whole history.
+ *
+ * selectQuestionsForGame() uses the aggregates to replace the static
+ * difficulty tag once a question has enough attempts.
+ */
+
+const WATERMARK_NAME = 'question_stats';
+const BATCH_SIZE = 5000;
+const MAX_BATCHES_PER_RUN = 20;
+const RUN_INTERVAL_MS = 5 * 60 * 1000;
+// Answer inserts commit within milliseconds; skipping the newest rows keeps a
+// slow in-flight transaction with a lower id from landing behind the watermark
+const SETTLE_SECONDS = 30;
+
+declare global {
+  // eslint-disable-next-line no-var
+  var __questionStatsJob: ReturnType<typeof setInterval> | undefined;
+}
+
+/** Difficulty from observed accuracy, or the static tag until there's enough data. */
+export function effectiveDifficulty(
+  tag: string,
+  attempts: number | null,
+  correct: number | null
+): string {
+  if (!attempts || attempts < GAME_CONFIG.CALIBRATION_MIN_ATTEMPTS) return tag;
+  const rate = (correct ?? 0) / attempts;
+  if (rate >= GAME_CONFIG.CALIBRATION_EASY_MIN_RATE) return 'easy';
+  if (rate >= GAME_CONFIG.CALIBRATION_MEDIUM_MIN_RATE) return 'medium';
+  return 'hard';
+}
+
+/**
+ * Fold one batch of new answers into question_stats and advance the
+ * watermark, atomically. Returns the number of answers processed.
+ */
+async function processBatch(): Promise<number> {
+  return await db.transaction(async (tx) => {
+    await tx
+      .insert(analyticsWatermarks)
+      .values({ name: WATERMARK_NAME, lastId: 0 })
+      .onConflictDoNothing();
+
+    // Row lock serializes concurrent runs (several app instances)
+    const [watermark] = await tx
+      .select({ lastId: analyticsWatermarks.lastId })
+      .from(analyticsWatermarks)
+      .where(eq(analyticsWatermarks.name, WATERMARK_NAME))
+      .for('update');
+
+    const rows = await tx.execute<{ last_id: number | null; processed: number }>(sql`
+      with batch as (
+        select id, question_id, answer_index, is_correct
+        from player_answers
+        where id > ${watermark.lastId}
+          and "timestamp" < now() - make_interval(secs => ${SETTLE_SECONDS})
+        order by id
+        limit ${BATCH_SIZE}
+      ),
+      agg as (
+        select question_id,
+               count(*)::int as attempts,
+               count(*) filter (where is_correct)::int as correct,
+               count(*) filter (where answer_index is null)::int as timeouts,
+               count(*) filter (where answer_index = 0)::int as picks_0,
+               count(*) filter (where answer_index = 1)::int as picks_1,
+               count(*) filter (where answer_index = 2)::int as picks_2,
+               count(*) filter (where answer_index = 3)::int as picks_3
+        from batch
+        group by question_id
+      ),
+      upsert as (
+        insert into question_stats as s
+          (question_id, attempts, correct, timeouts, picks_0, picks_1, picks_2, picks_3)
+        select question_id, attempts, correct, timeouts, picks_0, picks_1, picks_2, picks_3 from agg
+        on conflict (question_id) do update set
+          attempts = s.attempts + excluded.attempts,
+          correct = s.correct + excluded.correct,
+          timeouts = s.timeouts + excluded.timeouts,
+          picks_0 = s.picks_0 + excluded.picks_0,
+          picks_1 = s.picks_1 + excluded.picks_1,
+          picks_2 = s.picks_2 + excluded.picks_2,
+          picks_3 = s.picks_3 + excluded.picks_3,
+          updated_at = now()
+      )
+      select max(id)::int as last_id, count(*)::int as processed from batch
+    `);
+
+    const { last_id: lastId, processed } = rows[0];
+    if (processed > 0 && lastId !== null) {
+      await tx
+        .update(analyticsWatermarks)
+        .set({ lastId, updatedAt: new Date() })
+        .where(eq(analyticsWatermarks.name, WATERMARK_NAME));
+    }
+    return processed;
+  });
+}
+
+/** Catch question_stats up with new answers (bounded per run). */
+export async function updateQuestionStats(): Promise<number> {
+  let processed = 0;
+  for (let batch = 0; batch < MAX_BATCHES_PER_RUN; batch++) {
+    const n = await processBatch();
+    processed += n;
+    if (n < BATCH_SIZE) break;
+  }
+  return processed;
+}
+
+async function runJob(): Promise<void> {
+  try {
+    const processed = await updateQuestionStats();
+    if (processed > 0) {
+      console.log(`[QuestionStats] Folded ${processed} answer(s) into question_stats`);
+    }
+  } catch (error) {
+    console.error('[QuestionStats] Update error:', error);
+  }
+}
+
+/** Start the periodic stats job once per process (called from instrumentation.ts). */
+export function startQuestionStatsJob(): void {
+  if (globalThis.__questionStatsJob) return;
+
+  globalThis.__questionStatsJob = setInterval(runJob, RUN_INTERVAL_MS);
+  globalThis.__questionStatsJob.unref?.();
+  void runJob();
+}
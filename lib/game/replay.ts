@@ -0,0 +1,227 @@
+import { GAME_CONFIG, resolveGameRules, type GameRules } from './config';
+import {
+  getShufflePermutation,
+  shuffleAnswers,
+  originalToShuffled,
+} from './shuffle';
+import type {
+  GamePhase,
+  GameStateResponse,
+  LeaderboardEntry,
+  PlayerQuestionResult,
+  QuestionState,
+  RecordedGameEvent,
+  SummaryState,
+} from './types';
+
+/**
+ * Pure reducer over the `game_events` log. Folding a game's events yields
+ * the same data the engine spreads over game_states, player_answers and
+ * scores, and projectGameState() turns it into the GameStateResponse a
+ * user would get from resolveGameState().
+ *
+ * No database access here: lib/game/events.ts loads the log, and benchmarks
+ * can replay recorded logs directly.
+ */
+
+export interface ReplayedAnswer {
+  answerIndex: number | null; // Original DB space
+  isCorrect: boolean;
+  elapsedMs: number | null;
+  pointsAwarded: number;
+}
+
+export interface ReplayedGame {
+  gameId: number;
+  phase: GamePhase;
+  questionOrder: number[];
+  currentQuestionIndex: number;
+  phaseStartedAt: number; // game_states.question_start_time, epoch ms
+  playerIds: number[];
+  rules: GameRules; // GAME_CONFIG plus the game's overrides
+  scores: Map<number, number>;
+  answers: Map<number, ReplayedAnswer>[]; // Per question index, in answer order
+  eventCount: number;
+}
+
+// Static data the projection needs besides the log
+export interface ReplayQuestion {
+  id: number;
+  text: string;
+  answers: string[];
+  correctIndex: number;
+  difficulty: string;
+  category: string;
+}
+
+export interface ReplayReferences {
+  questions: Map<number, ReplayQuestion>;
+  usernames: Map<number, string>;
+}
+
+/** Apply one event. Mutates and returns `game` (creates it on 'started'). */
+export function applyGameEvent(
+  gameId: number,
+  game: ReplayedGame | null,
+  event: RecordedGameEvent
+): ReplayedGame {
+  if (event.type === 'started') {
+    return {
+      gameId,
+      phase: 'question',
+      questionOrder: event.questionOrder,
+      currentQuestionIndex: 0,
+      phaseStartedAt: event.at,
+      playerIds: event.playerIds,
+      rules: resolveGameRules(event.config),
+      scores: new Map(event.playerIds.map((userId) => [userId, 0])),
+      answers: event.questionOrder.map(() => new Map()),
+      eventCount: 1,
+    };
+  }
+
+  if (!game) {
+    throw new Error(`Game ${gameId}: event log does not start with 'started'`);
+  }
+
+  switch (event.type) {
+    case 'answer':
+      game.answers[event.questionIndex]?.set(event.userId, {
+        answerIndex: event.answerIndex,
+        isCorrect: event.isCorrect,
+        elapsedMs: event.elapsedMs,
+        pointsAwarded: event.pointsAwarded,
+      });
+      game.scores.set(event.userId, (game.scores.get(event.userId) ?? 0) + event.pointsAwarded);
+      break;
+    case 'phase_changed':
+      game.phase = event.phase;
+      game.currentQuestionIndex = event.questionIndex;
+      game.phaseStartedAt = event.at;
+      break;
+    case 'finished':
+      game.phase = 'finished';
+      break;
+  }
+
+  game.eventCount++;
+  return game;
+}
+
+/** Fold a game's events, in id order. Returns null for an empty log. */
+export function foldGameEvents(
+  gameId: number,
+  events: Iterable<RecordedGameEvent>
+): ReplayedGame | null {
+  let game: ReplayedGame | null = null;
+  for (const event of events) {
+    game = applyGameEvent(gameId, game, event);
+  }
+  return game;
+}
+
+/** Full board, ordered like getLeaderboard(): score desc, then userId. */
+export function replayedLeaderboard(
+  game: ReplayedGame,
+  usernames: Map<number, string>
+): LeaderboardEntry[] {
+  return [...game.scores.entries()]
+    .sort(([userA, scoreA], [userB, scoreB]) => scoreB - scoreA || userA - userB)
+    .map(([userId, score], i) => ({
+      userId,
+      username: usernames.get(userId) ?? '',
+      score,
+      rank: i + 1,
+    }));
+}
+
+/**
+ * The GameStateResponse `userId` would get for the replayed game. Pending
+ * time-based transitions are not applied: the projection shows the log as
+ * recorded.
+ */
+export function projectGameState(
+  game: ReplayedGame,
+  userId: number,
+  { questions, usernames }: ReplayReferences
+): GameStateResponse {
+  const board = replayedLeaderboard(game, usernames);
+  const isParticipant = game.playerIds.includes(userId);
+
+  // Same window as getLeaderboardWindow(): top N plus the user's neighborhood
+  let leaderboard = board;
+  if (game.phase !== 'finished') {
+    const ownRank = board.find((e) => e.userId === userId)?.rank;
+    leaderboard = board.filter((e) =>
+      e.rank <= GAME_CONFIG.LEADERBOARD_TOP_N ||
+      (ownRank !== undefined && Math.abs(e.rank - ownRank) <= GAME_CONFIG.LEADERBOARD_NEIGHBORS)
+    );
+  }
+
+  const shared = {
+    gameId: game.gameId,
+    currentQuestionIndex: game.currentQuestionIndex,
+    totalQuestions: game.questionOrder.length,
+    leaderboard,
+    leaderboardSize: board.length,
+    isParticipant,
+  };
+
+  if (game.phase === 'finished') {
+    return { ...shared, phase: 'finished' };
+  }
+
+  const questionId = game.questionOrder[game.currentQuestionIndex];
+  const question = questions.get(questionId);
+  if (!question) throw new Error('Pregunta no encontrada');
+
+  const permutation = getShufflePermutation(questionId, game.gameId);
+  const answers = game.answers[game.currentQuestionIndex];
+
+  if (game.phase === 'question') {
+    const own = answers.get(userId);
+    return {
+      ...shared,
+      phase: 'question',
+      deadline: game.phaseStartedAt + game.rules.QUESTION_TIME_LIMIT_SECONDS * 1000,
+      question: {
+        id: question.id,
+        text: question.text,
+        answers: shuffleAnswers(question.answers, permutation),
+        difficulty: question.difficulty,
+        category: question.category,
+      },
+      // Non-participants see read-only (buttons disabled)
+      hasAnswered: isParticipant ? !!own : true,
+      selectedAnswerIndex: own?.answerIndex != null
+        ? originalToShuffled(own.answerIndex, permutation)
+        : null,
+      answeredCount: answers.size,
+      totalPlayers: game.playerIds.length,
+    } satisfies QuestionState;
+  }
+
+  const playerResults: PlayerQuestionResult[] = [];
+  for (const [answerUserId, a] of answers) {
+    playerResults.push({
+      userId: answerUserId,
+      username: usernames.get(answerUserId) ?? '',
+      answerIndex: a.answerIndex != null ? originalToShuffled(a.answerIndex, permutation) : null,
+      isCorrect: a.isCorrect,
+      pointsAwarded: a.pointsAwarded,
+      elapsedMs: a.elapsedMs,
+    });
+  }
+
+  return {
+    ...shared,
+    phase: 'summary',
+    deadline: game.phaseStartedAt + game.rules.SUMMARY_DISPLAY_SECONDS * 1000,
+    summary: {
+      questionText: question.text,
+      answers: shuffleAnswers(question.answers, permutation),
+      correctIndex: originalToShuffled(question.correctIndex, permutation),
+      playerResults,
+    },
+  } satisfies SummaryState;
+}
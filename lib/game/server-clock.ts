@@ -0,0 +1,75 @@
+import { GAME_CONFIG } from './config';
+
+/**
+ * Client-side estimate of the server clock. Game states carry absolute phase
+ * deadlines in server time, and timers count down against serverNow() locally
+ * between frames.
+ *
+ * syncServerClock() runs an NTP-style exchange against `GET /api/time`:
+ * offset = serverTime - (sent + received) / 2, keeping the sample with the
+ * lowest round trip. The `serverTime` carried by each frame is a one-way
+ * sample, so it only bounds the offset from below.
+ */
+
+export interface ClockEstimate {
+  offsetMs: number; // serverNow() - Date.now()
+  rttMs: number | null; // round trip of the best sample, null until synced
+  syncedAt: number | null;
+}
+
+let estimate: ClockEstimate = { offsetMs: 0, rttMs: null, syncedAt: null };
+let hasSample = false;
+
+/** Record a server timestamp received at local time `receivedAt`. */
+export function recordServerTime(serverTime: number, receivedAt: number = Date.now()): void {
+  // The server sent this before we received it, so its clock reads at least this much now
+  const lowerBound = serverTime - receivedAt;
+  if (!hasSample || lowerBound > estimate.offsetMs) {
+    estimate = { ...estimate, offsetMs: lowerBound };
+    hasSample = true;
+  }
+}
+
+async function sampleServerClock(): Promise<{ offsetMs: number; rttMs: number }> {
+  const sentAt = Date.now();
+  const res = await fetch('/api/time', { cache: 'no-store' });
+  const { serverTime } = (await res.json()) as { serverTime: number };
+  const receivedAt = Date.now();
+  return {
+    offsetMs: serverTime - (sentAt + receivedAt) / 2,
+    rttMs: receivedAt - sentAt,
+  };
+}
+
+/**
+ * Re-estimate the offset from `samples` round trips. Keeps the previous
+ * estimate if every request fails.
+ */
+export async function syncServerClock(
+  samples: number = GAME_CONFIG.CLOCK_SYNC_SAMPLES
+): Promise<ClockEstimate> {
+  let best: { offsetMs: number; rttMs: number } | null = null;
+  for (let i = 0; i < samples; i++) {
+    try {
+      const sample = await sampleServerClock();
+      if (!best || sample.rttMs < best.rttMs) best = sample;
+    } catch {
+      // Offline or server restarting; try the next sample
+    }
+  }
+
+  if (best) {
+    estimate = { offsetMs: Math.round(best.offsetMs), rttMs: best.rttMs, syncedAt: Date.now() };
+    hasSample = true;
+  }
+  return estimate;
+}
+
+export function getClockEstimate(): ClockEstimate {
+  return estimate;
+}
+
+/** Current time on the server's clock, in epoch ms. */
+export function serverNow(): number {
+  return Date.now() + estimate.offsetMs;
+}
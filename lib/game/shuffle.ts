@@ -2,8 +2,47 @@
  * Deterministic answer shuffling using a seeded PRNG.
  * Given the same (questionId, gameId), always produces the same permutation.
  * This ensures all players in a game see the same answer order.
+ *
+ * A permutation is represented compactly as its index (0–23) into the
+ * lexicographic table of all 4-element permutations. Forward and inverse
+ * mappings are precomputed, so index translation is a single table lookup.
  */
 
+const ANSWER_COUNT = 4;
+
+/** Index (0–23) into PERMUTATION_TABLE. Always fits in a Uint8. */
+export type Permutation = number;
+
+// All 24 permutations of [0, 1, 2, 3] in lexicographic order, flattened.
+// PERMUTATION_TABLE[p * 4 + newIndex] = originalIndex
+const PERMUTATION_TABLE = new Uint8Array(24 * ANSWER_COUNT);
+
+// INVERSE_TABLE[p * 4 + originalIndex] = newIndex
+const INVERSE_TABLE = new Uint8Array(24 * ANSWER_COUNT);
+
+// Packed permutation (base-4 digits, 8 bits) → permutation index
+const PACKED_TO_INDEX = new Uint8Array(256);
+
+(function buildTables() {
+  let p = 0;
+  for (let a = 0; a < ANSWER_COUNT; a++) {
+    for (let b = 0; b < ANSWER_COUNT; b++) {
+      if (b === a) continue;
+      for (let c = 0; c < ANSWER_COUNT; c++) {
+        if (c === a || c === b) continue;
+        const d = 6 - a - b - c;
+        const perm = [a, b, c, d];
+        for (let i = 0; i < ANSWER_COUNT; i++) {
+          PERMUTATION_TABLE[p * ANSWER_COUNT + i] = perm[i];
+          INVERSE_TABLE[p * ANSWER_COUNT + perm[i]] = i;
+        }
+        PACKED_TO_INDEX[(a << 6) | (b << 4) | (c << 2) | d] = p;
+        p++;
+      }
+    }
+  }
+})();
+
 // djb2 string hash → unsigned 32-bit integer
 function hashSeed(questionId: number, gameId: number): number {
   const str = `${questionId}:${gameId}`;
@@ -25,13 +64,8 @@ function mulberry32(seed: number): () => number {
   };
 }
 
-/**
- * Returns a permutation array for shuffling 4 answers.
- * permutation[newIndex] = originalIndex
- *
- * Example: [2, 0, 3, 1] means new position 0 shows original answer 2, etc.
- */
-export function getShufflePermutation(questionId: number, gameId: number): number[] {
+// Seeded Fisher-Yates on [0, 1, 2, 3], encoded as a permutation index
+function computePermutation(questionId: number, gameId: number): Permutation {
   const rng = mulberry32(hashSeed(questionId, gameId));
 
   const indices = [0, 1, 2, 3];
@@ -39,20 +73,72 @@ export function getShufflePermutation(questionId: number, gameId: number): numbe
     const j = Math.floor(rng() * (i + 1));
     [indices[i], indices[j]] = [indices[j], indices[i]];
   }
-  return indices;
+  return PACKED_TO_INDEX[
+    (indices[0] << 6) | (indices[1] << 4) | (indices[2] << 2) | indices[3]
+  ];
+}
+
+// Memoized permutations: gameId → (questionId → permutation index).
+// Only the most recently used games are kept.
+const MAX_CACHED_GAMES = 32;
+const permutationCache = new Map<number, Map<number, Permutation>>();
+
+/**
+ * Returns the permutation used to shuffle a question's 4 answers in a game.
+ * Memoized per game, so repeated lookups skip the PRNG entirely.
+ */
+export function getShufflePermutation(questionId: number, gameId: number): Permutation {
+  let gamePermutations = permutationCache.get(gameId);
+  if (gamePermutations) {
+    // Refresh recency
+    permutationCache.delete(gameId);
+    permutationCache.set(gameId, gamePermutations);
+  } else {
+    gamePermutations = new Map();
+    permutationCache.set(gameId, gamePermutations);
+    if (permutationCache.size > MAX_CACHED_GAMES) {
+      const oldest = permutationCache.keys().next().value!;
+      permutationCache.delete(oldest);
+    }
+  }
+
+  let permutation = gamePermutations.get(questionId);
+  if (permutation === undefined) {
+    permutation = computePermutation(questionId, gameId);
+    gamePermutations.set(questionId, permutation);
+  }
+  return permutation;
+}
+
+/**
+ * Expands a permutation into an array where array[newIndex] = originalIndex.
+ *
+ * Example: [2, 0, 3, 1] means new position 0 shows original answer 2, etc.
+ */
+export function permutationToArray(permutation: Permutation): number[] {
+  const offset = permutation * ANSWER_COUNT;
+  return Array.from(PERMUTATION_TABLE.subarray(offset, offset + ANSWER_COUNT));
 }
 
 /** Reorder answers according to a permutation. */
-export function shuffleAnswers(answers: string[], permutation: number[]): string[] {
-  return permutation.map((origIdx) => answers[origIdx]);
+export function shuffleAnswers(answers: string[], permutation: Permutation): string[] {
+  const offset = permutation * ANSWER_COUNT;
+  const shuffled = new Array<string>(ANSWER_COUNT);
+  for (let i = 0; i < ANSWER_COUNT; i++) {
+    shuffled[i] = answers[PERMUTATION_TABLE[offset + i]];
+  }
+  return shuffled;
 }
 
-/** Map an original (DB) index to its shuffled (display) position. */
-export function originalToShuffled(originalIndex: number, permutation: number[]): number {
-  return permutation.indexOf(originalIndex);
+/** Map an original (DB) index to its shuffled (display) position, or -1 if out of range. */
+export function originalToShuffled(originalIndex: number, permutation: Permutation): number {
+  if (!Number.isInteger(originalIndex) || originalIndex < 0 || originalIndex >= ANSWER_COUNT) {
+    return -1;
+  }
+  return INVERSE_TABLE[permutation * ANSWER_COUNT + originalIndex];
 }
 
 /** Map a shuffled (display) index back to the original (DB) position. */
-export function shuffledToOriginal(shuffledIndex: number, permutation: number[]): number {
-  return permutation[shuffledIndex];
+export function shuffledToOriginal(shuffledIndex: number, permutation: Permutation): number {
+  return PERMUTATION_TABLE[permutation * ANSWER_COUNT + shuffledIndex];
 }
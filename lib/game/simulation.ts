@@ -0,0 +1,66 @@
+import { resolveGameState, submitAnswer } from './engine';
+import type { VirtualClock } from './clock';
+import type { GameRules } from './config';
+
+/**
+ * Plays one game to the end on a virtual clock: players answer at random
+ * moments before each deadline, and timers are skipped by advancing the
+ * clock. Used by scripts/simulate-games.ts and the bench suite's seeding.
+ */
+
+export type SimulationPhase = 'question' | 'summary';
+
+export interface SimulatedGameOptions {
+  rules: GameRules; // The game's resolved rules (for phase durations)
+  answerRate?: number; // Chance that each player answers a given question
+  // Also issue the reads live clients would: each answerer's refetch and
+  // every player's summary frame
+  clientReads?: boolean;
+  onPhase?: (phase: SimulationPhase) => void;
+}
+
+export async function playSimulatedGame(
+  gameId: number,
+  playerIds: number[],
+  clock: VirtualClock,
+  { rules, answerRate = 0.9, clientReads = false, onPhase }: SimulatedGameOptions
+): Promise<{ questions: number; answers: number }> {
+  const questionMs = rules.QUESTION_TIME_LIMIT_SECONDS * 1000;
+  const summaryMs = rules.SUMMARY_DISPLAY_SECONDS * 1000;
+  let questions = 0;
+  let answers = 0;
+
+  for (;;) {
+    onPhase?.('question');
+    const state = await resolveGameState(gameId, playerIds[0]);
+    if (state.phase === 'finished') break;
+    questions++;
+
+    const answerAt = playerIds
+      .filter(() => Math.random() < answerRate)
+      .map((userId) => ({ userId, at: Math.floor(Math.random() * questionMs) }))
+      .sort((a, b) => a.at - b.at);
+
+    let elapsed = 0;
+    for (const { userId, at } of answerAt) {
+      clock.advance(at - elapsed);
+      elapsed = at;
+      await submitAnswer(gameId, userId, Math.floor(Math.random() * 4));
+      answers++;
+      if (clientReads) await resolveGameState(gameId, userId);
+    }
+    if (answerAt.length < playerIds.length) clock.advance(questionMs - elapsed + 1);
+
+    onPhase?.('summary');
+    if (clientReads) {
+      for (const userId of playerIds) {
+        await resolveGameState(gameId, userId);
+      }
+    } else {
+      await resolveGameState(gameId, playerIds[0]);
+    }
+    clock.advance(summaryMs + 1);
+  }
+
+  return { questions, answers };
+}
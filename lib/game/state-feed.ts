@@ -0,0 +1,97 @@
+import { getActiveGame, resolveGameState, touchPresence, clearPresence } from './engine';
+import { GAME_CONFIG } from './config';
+import type { GameStateResponse, IdleState } from './types';
+
+export interface WatchGameStateOptions {
+  signal: AbortSignal;
+  // Dispatching a 'nudge' event skips the rest of the current poll interval
+  nudge?: EventTarget;
+}
+
+/**
+ * Polls the active game for one user and yields each state that differs from
+ * the previous one. Shared by the SSE stream and the WebSocket gateway.
+ *
+ * An open feed also counts as presence: the user is marked online on
+ * connect, refreshed every HEARTBEAT_INTERVAL_MS and marked offline when the
+ * feed ends, so connected clients don't need the heartbeat route.
+ */
+export async function* watchGameState(
+  userId: number,
+  { signal, nudge }: WatchGameStateOptions
+): AsyncGenerator<GameStateResponse> {
+  const presence = { lastTouchedAt: null as Date | null };
+
+  try {
+    yield* pollGameState(userId, signal, presence, nudge);
+  } finally {
+    if (presence.lastTouchedAt) {
+      await clearPresence(userId, presence.lastTouchedAt).catch((error) => {
+        console.error('[Presence] Failed to clear presence:', error);
+      });
+    }
+  }
+}
+
+async function* pollGameState(
+  userId: number,
+  signal: AbortSignal,
+  presence: { lastTouchedAt: Date | null },
+  nudge?: EventTarget
+): AsyncGenerator<GameStateResponse> {
+  let lastJson = '';
+  let lastGameId: number | null = null;
+
+  while (!signal.aborted) {
+    const lastTouch = presence.lastTouchedAt?.getTime() ?? 0;
+    if (Date.now() - lastTouch >= GAME_CONFIG.HEARTBEAT_INTERVAL_MS) {
+      presence.lastTouchedAt = await touchPresence(userId);
+    }
+
+    const activeGame = await getActiveGame();
+    let state: GameStateResponse;
+
+    if (!activeGame) {
+      if (lastGameId) {
+        // Game we were tracking just ended — send its final (finished) state
+        // before transitioning to idle, so the client sees the scoreboard
+        state = await resolveGameState(lastGameId, userId);
+        lastGameId = null;
+      } else {
+        // No active game and final state already sent — send idle
+        const idle: IdleState = { phase: 'idle' };
+        state = idle;
+      }
+    } else {
+      lastGameId = activeGame.id;
+      // Active game — resolve state for this user
+      state = await resolveGameState(activeGame.id, userId);
+    }
+
+    const json = JSON.stringify(state);
+    if (json !== lastJson) {
+      lastJson = json;
+      yield state;
+    }
+
+    await waitForNextPoll(signal, nudge);
+  }
+}
+
+// Wait for next poll interval, but check for abort (and nudges) frequently
+async function waitForNextPoll(signal: AbortSignal, nudge?: EventTarget): Promise<void> {
+  let nudged = false;
+  const onNudge = () => {
+    nudged = true;
+  };
+  nudge?.addEventListener('nudge', onNudge);
+
+  try {
+    const deadline = Date.now() + GAME_CONFIG.SSE_POLL_INTERVAL_MS;
+    while (Date.now() < deadline && !signal.aborted && !nudged) {
+      await new Promise((r) => setTimeout(r, 200));
+    }
+  } finally {
+    nudge?.removeEventListener('nudge', onNudge);
+  }
+}
@@ -1,3 +1,6 @@
+import type { CompactGameState } from './compact';
+import type { GameConfigOverride } from './config';
+
 export type GamePhase = 'question' | 'summary' | 'finished';
 
 // ============================================
@@ -25,6 +28,7 @@ export interface PlayerQuestionResult {
   answerIndex: number | null;
   isCorrect: boolean;
   pointsAwarded: number;
+  elapsedMs: number | null; // null when timed out
 }
 
 export interface LeaderboardEntry {
@@ -34,6 +38,19 @@ export interface LeaderboardEntry {
   rank: number;
 }
 
+export interface LeaderboardPage {
+  entries: LeaderboardEntry[];
+  total: number;
+  offset: number;
+  limit: number;
+}
+
+export interface ScoreAuditResult {
+  gameId: number;
+  checked: number;
+  mismatches: { userId: number; storedScore: number; recomputedScore: number }[];
+}
+
 export interface GlobalLeaderboardEntry {
   userId: number;
   username: string;
@@ -50,7 +67,10 @@ interface GameStateBase {
   gameId: number;
   currentQuestionIndex: number;
   totalQuestions: number;
+  // Question/summary: top N plus the user's neighborhood (ranks may have gaps).
+  // Finished: the full board.
   leaderboard: LeaderboardEntry[];
+  leaderboardSize: number; // Entries on the full board
   isParticipant: boolean;
 }
 
@@ -60,7 +80,7 @@ export interface IdleState {
 
 export interface QuestionState extends GameStateBase {
   phase: 'question';
-  timeRemainingMs: number;
+  deadline: number; // Epoch ms (server clock) when the phase ends
   question: QuestionData;
   hasAnswered: boolean;
   selectedAnswerIndex: number | null;
@@ -70,7 +90,7 @@ export interface QuestionState extends GameStateBase {
 
 export interface SummaryState extends GameStateBase {
   phase: 'summary';
-  timeRemainingMs: number;
+  deadline: number; // Epoch ms (server clock) when the phase ends
   summary: SummaryData;
 }
 
@@ -84,14 +104,55 @@ export type GameStateResponse =
   | SummaryState
   | FinishedState;
 
+// ============================================
+// Game events — append-only log, see lib/game/replay.ts
+// ============================================
+
+export type GameEvent =
+  | { type: 'started'; questionOrder: number[]; playerIds: number[]; config?: GameConfigOverride }
+  | {
+      type: 'answer';
+      userId: number;
+      questionIndex: number;
+      questionId: number;
+      answerIndex: number | null; // Original DB space; null = timed out
+      isCorrect: boolean;
+      elapsedMs: number | null;
+      pointsAwarded: number;
+    }
+  | { type: 'phase_changed'; phase: 'question' | 'summary'; questionIndex: number }
+  | { type: 'finished' };
+
+export type GameEventType = GameEvent['type'];
+
+// An event as read back from game_events
+export type RecordedGameEvent = GameEvent & { at: number }; // at: epoch ms (server clock)
+
 // ============================================
 // SSE message envelope
 // ============================================
 
+// serverTime (epoch ms at send) is a clock sample for counting down to `deadline`;
+// it lives outside `data` so unchanged states still dedupe
 export type SSEMessage =
-  | { type: 'state'; data: GameStateResponse }
+  | { type: 'state'; data: GameStateResponse; serverTime?: number }
+  | { type: 'compact'; data: CompactGameState; serverTime?: number } // when requested, see lib/game/compact.ts
   | { type: 'error'; error: string };
 
+// ============================================
+// WebSocket messages (optional transport, see lib/game/ws-gateway.ts)
+// ============================================
+
+export type WSClientMessage =
+  | { type: 'answer'; requestId: number; answerIndex: number }
+  | { type: 'ping' };
+
+export type WSServerMessage =
+  | SSEMessage
+  | { type: 'answer'; requestId: number; result: SubmitAnswerResponse }
+  | { type: 'answer-error'; requestId: number; error: string }
+  | { type: 'pong' };
+
 // ============================================
 // API response types
 // ============================================
@@ -0,0 +1,240 @@
+import type { IncomingMessage } from 'http';
+import type { Duplex } from 'stream';
+import { validateSessionById, SESSION_COOKIE_NAME } from '@/lib/auth/simple-session';
+import { findParticipant } from '@/lib/db/repositories/participants';
+import { submitAnswerSchema } from '@/lib/utils/validation';
+import { WebSocket, WebSocketServer } from 'ws';
+import {
+  getActiveGame,
+  submitAnswer,
+  touchPresence,
+  ANSWER_CONFLICT_ERRORS,
+} from './engine';
+import { watchGameState } from './state-feed';
+import { createStateEncoder } from './compact';
+import type { SubmitAnswerResponse, WSClientMessage, WSServerMessage } from './types';
+
+/**
+ * Optional WebSocket transport for gameplay. One authenticated socket carries
+ * state pushes, answer submissions and presence pings, using the same engine
+ * functions as the SSE stream and the answer/heartbeat routes.
+ *
+ * Next.js route handlers cannot accept upgrades, so this is mounted by the
+ * custom server in `server.ts`. Framing is handled by the `ws` package.
+ */
+
+export const GAME_WS_PATH = '/api/game/ws';
+
+// setTimeout() overflows above ~24.8 days
+const MAX_TIMEOUT_MS = 2 ** 31 - 1;
+
+// Clients don't have to send anything, so sessions are also re-checked on a timer
+const SESSION_CHECK_INTERVAL_MS = 30_000;
+
+const CLOSE_POLICY_VIOLATION = 1008;
+const CLOSE_UNSUPPORTED_DATA = 1003;
+
+// Game messages are small JSON objects
+const wss = new WebSocketServer({ noServer: true, maxPayload: 64 * 1024 });
+
+/** Answer an upgrade request with a plain HTTP error and drop the socket. */
+function rejectUpgrade(socket: Duplex, status: number, message: string): void {
+  socket.end(
+    `HTTP/1.1 ${status} ${message}\r\n` +
+      'Connection: close\r\n' +
+      'Content-Length: 0\r\n\r\n'
+  );
+}
+
+function readSessionCookie(req: IncomingMessage): string | null {
+  for (const part of (req.headers.cookie ?? '').split(';')) {
+    const [name, ...rest] = part.trim().split('=');
+    if (name === SESSION_COOKIE_NAME) {
+      return decodeURIComponent(rest.join('='));
+    }
+  }
+  return null;
+}
+
+// Browsers always send Origin on WebSocket handshakes; only accept our own host
+function isSameOrigin(req: IncomingMessage): boolean {
+  const origin = req.headers.origin;
+  if (!origin) return true;
+  try {
+    return new URL(origin).host === req.headers.host;
+  } catch {
+    return false;
+  }
+}
+
+function send(ws: WebSocket, message: WSServerMessage): void {
+  if (ws.readyState === WebSocket.OPEN) ws.send(JSON.stringify(message));
+}
+
+/** Whether the socket's session still exists (not logged out, deleted or expired). */
+async function isSessionValid(sessionId: string, userId: number): Promise<boolean> {
+  const { user } = await validateSessionById(sessionId);
+  return user?.id === userId;
+}
+
+async function handleAnswer(
+  userId: number,
+  requestId: number,
+  answerIndex: unknown
+): Promise<WSServerMessage> {
+  try {
+    const parsed = submitAnswerSchema.safeParse({ answerIndex });
+    if (!parsed.success) {
+      return { type: 'answer-error', requestId, error: 'Error de validación' };
+    }
+
+    const activeGame = await getActiveGame();
+    if (!activeGame) {
+      return { type: 'answer-error', requestId, error: 'No hay juego en curso' };
+    }
+
+    const participant = await findParticipant(activeGame.id, userId);
+    if (!participant) {
+      return { type: 'answer-error', requestId, error: 'No eres participante de este juego' };
+    }
+
+    const result = await submitAnswer(activeGame.id, userId, parsed.data.answerIndex);
+    const response: SubmitAnswerResponse = {
+      success: true,
+      isCorrect: result.isCorrect,
+      pointsAwarded: result.pointsAwarded,
+    };
+    return { type: 'answer', requestId, result: response };
+  } catch (error) {
+    if (error instanceof Error && ANSWER_CONFLICT_ERRORS.has(error.message)) {
+      return { type: 'answer-error', requestId, error: error.message };
+    }
+    console.error('[WS] Answer error:', error);
+    return { type: 'answer-error', requestId, error: 'Error interno del servidor' };
+  }
+}
+
+/**
+ * Handle an HTTP upgrade for GAME_WS_PATH. The session cookie is validated
+ * on upgrade, again before every client message and every
+ * SESSION_CHECK_INTERVAL_MS; the socket is closed once it is no longer valid.
+ */
+export async function handleGameUpgrade(
+  req: IncomingMessage,
+  socket: Duplex,
+  head: Buffer
+): Promise<void> {
+  if (!isSameOrigin(req)) {
+    rejectUpgrade(socket, 403, 'Forbidden');
+    return;
+  }
+
+  const sessionId = readSessionCookie(req);
+  const { user, session } = sessionId
+    ? await validateSessionById(sessionId)
+    : { user: null, session: null };
+
+  if (!sessionId || !user || !session) {
+    rejectUpgrade(socket, 401, 'Unauthorized');
+    return;
+  }
+
+  const { searchParams } = new URL(req.url ?? '/', 'http://localhost');
+  const compact = searchParams.get('encoding') === 'compact';
+
+  // Invalid handshakes are answered with a 400 by `ws` itself
+  wss.handleUpgrade(req, socket, head, (ws) => {
+    serveGameSocket(ws, sessionId, user.id, session.expiresAt, compact).catch((error) => {
+      console.error('[WS] Connection error:', error);
+      ws.terminate();
+    });
+  });
+}
+
+async function serveGameSocket(
+  ws: WebSocket,
+  sessionId: string,
+  userId: number,
+  expiresAt: Date,
+  compact: boolean
+): Promise<void> {
+  const encode = compact ? createStateEncoder() : null;
+  const abort = new AbortController();
+  const nudge = new EventTarget();
+
+  const closeRevoked = () => ws.close(CLOSE_POLICY_VIOLATION, 'Session expired');
+
+  const handleMessage = async (message: WSClientMessage) => {
+    if (message.type !== 'ping' && message.type !== 'answer') return;
+
+    if (!(await isSessionValid(sessionId, userId))) {
+      if (message.type === 'answer') {
+        send(ws, { type: 'answer-error', requestId: message.requestId, error: 'No autorizado' });
+      }
+      closeRevoked();
+      return;
+    }
+
+    if (message.type === 'ping') {
+      await touchPresence(userId);
+      send(ws, { type: 'pong' });
+    } else {
+      const reply = await handleAnswer(userId, message.requestId, message.answerIndex);
+      send(ws, reply);
+      // Push the post-answer state right away instead of on the next tick
+      if (reply.type === 'answer') nudge.dispatchEvent(new Event('nudge'));
+    }
+  };
+
+  ws.on('message', (data, isBinary) => {
+    if (isBinary) {
+      ws.close(CLOSE_UNSUPPORTED_DATA, 'Only text messages are supported');
+      return;
+    }
+
+    let message: WSClientMessage;
+    try {
+      message = JSON.parse(data.toString());
+    } catch {
+      return; // Ignore malformed messages
+    }
+
+    handleMessage(message).catch((error) => {
+      console.error('[WS] Message error:', error);
+      if (message.type === 'answer') {
+        send(ws, { type: 'answer-error', requestId: message.requestId, error: 'Error interno del servidor' });
+      }
+    });
+  });
+  ws.on('close', () => abort.abort());
+  ws.on('error', () => abort.abort());
+
+  const expiry = setTimeout(
+    closeRevoked,
+    Math.min(MAX_TIMEOUT_MS, expiresAt.getTime() - Date.now())
+  );
+  const sessionCheck = setInterval(() => {
+    isSessionValid(sessionId, userId)
+      .then((valid) => { if (!valid) closeRevoked(); })
+      .catch((error) => console.error('[WS] Session check error:', error));
+  }, SESSION_CHECK_INTERVAL_MS);
+  abort.signal.addEventListener('abort', () => {
+    clearTimeout(expiry);
+    clearInterval(sessionCheck);
+  });
+
+  try {
+    for await (const gameState of watchGameState(userId, { signal: abort.signal, nudge })) {
+      const serverTime = Date.now();
+      send(ws, encode
+        ? { type: 'compact', data: encode(gameState), serverTime }
+        : { type: 'state', data: gameState, serverTime });
+    }
+  } catch (error) {
+    if (!abort.signal.aborted) {
+      const errMsg = error instanceof Error ? error.message : 'Internal error';
+      send(ws, { type: 'error', error: errMsg });
+      ws.close(1011, 'Internal error');
+    }
+  }
+}
@@ -0,0 +1,274 @@
+import { createReadStream } from 'fs';
+import { Readable } from 'stream';
+import { createGunzip } from 'zlib';
+import { pipeline } from 'stream/promises';
+import type { TransactionSql } from 'postgres';
+import { db } from '@/lib/db';
+
+/**
+ * Streaming question-bank loader used by the import/refresh/sync scripts.
+ *
+ * Files are read incrementally (a JSON array or JSONL, one object per line,
+ * optionally gzipped), each record is validated as it is parsed, and rows are
+ * loaded with `COPY ... FROM STDIN` in fixed-size chunks into a temporary
+ * staging table.
+ * The final insert into `questions` runs in the same transaction, so an
+ * invalid record anywhere in the file leaves the database untouched.
+ */
+
+export interface QuestionData {
+  question: string;
+  answers: string[];
+  correctIndex: number;
+  difficulty: string;
+  category: string;
+}
+
+export interface ImportProgress {
+  rows: number;
+  elapsedMs: number;
+  rowsPerSecond: number;
+}
+
+export interface ImportStats extends ImportProgress {
+  inserted: number;
+  skipped: number;
+  byCategory: Record<string, number>;
+  byDifficulty: Record<string, number>;
+}
+
+const DEFAULT_CHUNK_SIZE = 5000;
+
+/** Returns an error message for an invalid record, or null. */
+export function validateQuestion(q: unknown, index: number): string | null {
+  const r = q as Partial<QuestionData> | null;
+  if (!r || typeof r !== 'object' || !r.question || !Array.isArray(r.answers) || r.answers.length !== 4) {
+    return `Invalid question at index ${index}: missing fields or wrong answer count`;
+  }
+  if (r.answers.some((a) => typeof a !== 'string')) {
+    return `Invalid answers at index ${index}: answers must be strings`;
+  }
+  if (typeof r.correctIndex !== 'number' || r.correctIndex < 0 || r.correctIndex > 3) {
+    return `Invalid correctIndex at index ${index}: ${r.correctIndex}`;
+  }
+  if (!r.difficulty || !r.category) {
+    return `Missing difficulty or category at index ${index}`;
+  }
+  return null;
+}
+
+/**
+ * Yield the top-level objects of a JSON array or JSONL file one at a time,
+ * without holding the whole file in memory.
+ */
+export async function* readJsonRecords(filePath: string): AsyncGenerator<unknown> {
+  let base = -1; // depth at which records live: 1 inside a top-level array, 0 for JSONL
+  let depth = 0;
+  let inString = false;
+  let escaped = false;
+  let capturing = false;
+  let pending = '';
+
+  const file = createReadStream(filePath);
+  // Exports can be gzipped (*.gz); decompress on the fly
+  const input = filePath.endsWith('.gz') ? file.pipe(createGunzip()) : file;
+  input.setEncoding('utf-8');
+
+  for await (const chunk of input) {
+    const text = chunk as string;
+    let segmentStart = capturing ? 0 : -1;
+
+    for (let i = 0; i < text.length; i++) {
+      const c = text[i];
+
+      if (inString) {
+        if (escaped) escaped = false;
+        else if (c === '\\') escaped = true;
+        else if (c === '"') inString = false;
+        continue;
+      }
+
+      if (c === '{' || c === '[') {
+        if (base === -1) {
+          base = c === '[' ? 1 : 0;
+          if (c === '[') {
+            depth = 1;
+            continue;
+          }
+        }
+        if (depth === base && !capturing) {
+          if (c !== '{') throw new Error('Expected an object for each question');
+          capturing = true;
+          segmentStart = i;
+        }
+        depth++;
+      } else if (c === '}' || c === ']') {
+        depth--;
+        if (capturing && depth === base) {
+          const json = pending + text.slice(segmentStart, i + 1);
+          pending = '';
+          capturing = false;
+          segmentStart = -1;
+          yield JSON.parse(json);
+        }
+      } else if (c === '"') {
+        if (!capturing) throw new Error('Expected an object for each question');
+        inString = true;
+      } else if (!capturing && !/[\s,]/.test(c)) {
+        throw new Error(`Unexpected '${c}' between questions`);
+      }
+    }
+
+    if (capturing) pending += text.slice(segmentStart);
+  }
+
+  if (capturing || inString) throw new Error('Unexpected end of file');
+}
+
+/** Validate every record of a file without loading it. Returns the record count. */
+export async function validateQuestionFile(filePath: string): Promise<number> {
+  let index = 0;
+  for await (const record of readJsonRecords(filePath)) {
+    const error = validateQuestion(record, index);
+    if (error) throw new Error(error);
+    index++;
+  }
+  return index;
+}
+
+// COPY text format: escape backslash and the row/column delimiters
+function copyField(value: string): string {
+  return value
+    .replace(/\\/g, '\\\\')
+    .replace(/\t/g, '\\t')
+    .replace(/\n/g, '\\n')
+    .replace(/\r/g, '\\r');
+}
+
+function copyRow(q: QuestionData): string {
+  return [
+    copyField(q.question),
+    copyField(JSON.stringify(q.answers)),
+    String(q.correctIndex),
+    copyField(q.difficulty),
+    copyField(q.category),
+  ].join('\t') + '\n';
+}
+
+export interface StageOptions {
+  chunkSize?: number;
+  onProgress?: (progress: ImportProgress) => void;
+}
+
+export interface StagedFile extends ImportProgress {
+  byCategory: Record<string, number>;
+  byDifficulty: Record<string, number>;
+}
+
+export interface BulkImportOptions extends StageOptions {
+  // Skip questions whose text already exists (in the DB or earlier in the file)
+  skipExisting?: boolean;
+}
+
+/**
+ * Validate a question file and COPY it into the temporary table
+ * `question_import` (dropped on commit). Must run inside a transaction.
+ * Rows keep file order in `seq`.
+ */
+export async function stageQuestionFile(
+  tx: TransactionSql,
+  filePath: string,
+  { chunkSize = DEFAULT_CHUNK_SIZE, onProgress }: StageOptions = {}
+): Promise<StagedFile> {
+  const startedAt = Date.now();
+  const byCategory: Record<string, number> = {};
+  const byDifficulty: Record<string, number> = {};
+  let rows = 0;
+
+  const progress = (): ImportProgress => {
+    const elapsedMs = Date.now() - startedAt;
+    return { rows, elapsedMs, rowsPerSecond: elapsedMs > 0 ? Math.round((rows * 1000) / elapsedMs) : rows };
+  };
+
+  await tx`
+    create temp table question_import (
+      seq serial,
+      question_text text not null,
+      answers jsonb not null,
+      correct_index integer not null,
+      difficulty varchar(20) not null,
+      category varchar(50) not null
+    ) on commit drop
+  `;
+
+  const copyChunk = async (lines: string[]) => {
+    const writable = await tx`
+      copy question_import (question_text, answers, correct_index, difficulty, category) from stdin
+    `.writable();
+    await pipeline(Readable.from([lines.join('')]), writable);
+  };
+
+  let chunk: string[] = [];
+  for await (const record of readJsonRecords(filePath)) {
+    const error = validateQuestion(record, rows);
+    if (error) throw new Error(error);
+
+    const q = record as QuestionData;
+    chunk.push(copyRow(q));
+    byCategory[q.category] = (byCategory[q.category] || 0) + 1;
+    byDifficulty[q.difficulty] = (byDifficulty[q.difficulty] || 0) + 1;
+    rows++;
+
+    if (chunk.length >= chunkSize) {
+      await copyChunk(chunk);
+      chunk = [];
+      onProgress?.(progress());
+    }
+  }
+  if (chunk.length > 0) {
+    await copyChunk(chunk);
+    onProgress?.(progress());
+  }
+
+  return { ...progress(), byCategory, byDifficulty };
+}
+
+/**
+ * Stream a question file into `questions` via COPY. Throws (and rolls back
+ * everything) on the first invalid record.
+ */
+export async function bulkImportQuestions(
+  filePath: string,
+  { skipExisting = false, ...stageOptions }: BulkImportOptions = {}
+): Promise<ImportStats> {
+  const startedAt = Date.now();
+
+  const { staged, inserted } = await db.$client.begin(async (tx) => {
+    const staged = await stageQuestionFile(tx, filePath, stageOptions);
+
+    const result = skipExisting
+      ? await tx`
+          insert into questions (question_text, answers, correct_index, difficulty, category)
+          select distinct on (s.question_text) s.question_text, s.answers, s.correct_index, s.difficulty, s.category
+          from question_import s
+          where not exists (select 1 from questions q where q.question_text = s.question_text)
+          order by s.question_text, s.seq
+        `
+      : await tx`
+          insert into questions (question_text, answers, correct_index, difficulty, category)
+          select question_text, answers, correct_index, difficulty, category
+          from question_import
+          order by seq
+        `;
+    return { staged, inserted: result.count };
+  });
+
+  const elapsedMs = Date.now() - startedAt;
+  return {
+    ...staged,
+    elapsedMs,
+    rowsPerSecond: elapsedMs > 0 ? Math.round((staged.rows * 1000) / elapsedMs) : staged.rows,
+    inserted,
+    skipped: staged.rows - inserted,
+  };
+}
@@ -0,0 +1,140 @@
+import { db } from '@/lib/db';
+import { stageQuestionFile, type StageOptions, type StagedFile } from './bulk-import';
+
+/**
+ * Incremental question-bank sync. The file is staged with COPY, then diffed
+ * against `questions` by question text using `content_hash` (a generated
+ * column, see drizzle/0007):
+ *
+ * - text not in the DB                      → insert
+ * - same text, new answers or correct index  → soft delete the old row, insert a new one
+ * - same text, other fields changed          → update in place (id is kept)
+ * - soft-deleted text back in file           → restore (and update if changed)
+ * - live text missing from the file          → soft delete (`deleted_at`)
+ *
+ * A row's answers and correct index never change and rows are never
+ * hard-deleted, so historical `player_answers.answer_index` / `is_correct`
+ * keep meaning what they meant when they were recorded. Everything runs in
+ * one transaction.
+ */
+
+export interface SyncStats extends StagedFile {
+  inserted: number;
+  replaced: number;
+  updated: number;
+  deleted: number;
+  unchanged: number;
+  dryRun: boolean;
+}
+
+export interface SyncOptions extends StageOptions {
+  // Compute the diff but roll back instead of committing
+  dryRun?: boolean;
+}
+
+class DryRunRollback extends Error {
+  constructor(public stats: SyncStats) {
+    super('Dry run');
+  }
+}
+
+export async function syncQuestions(
+  filePath: string,
+  { dryRun = false, ...stageOptions }: SyncOptions = {}
+): Promise<SyncStats> {
+  try {
+    return await db.$client.begin(async (tx) => {
+      const staged = await stageQuestionFile(tx, filePath, stageOptions);
+
+      // One row per question text; the first occurrence in the file wins
+      await tx`
+        create temp table question_sync on commit drop as
+        select distinct on (question_text)
+          question_text, answers, correct_index, difficulty, category,
+          question_content_hash(question_text, answers, correct_index, difficulty, category) as content_hash
+        from question_import
+        order by question_text, seq
+      `;
+      await tx`create index on question_sync using hash (question_text)`;
+      await tx`analyze question_sync`;
+
+      const [{ total }] = await tx<{ total: number }[]>`
+        select count(*)::int as total from question_sync
+      `;
+
+      // The row each text maps to: the live one, else the latest soft-deleted one
+      await tx`
+        create temp table question_current on commit drop as
+        select distinct on (q.question_text) q.id, q.question_text, q.answers, q.correct_index
+        from questions q
+        join question_sync s on s.question_text = q.question_text
+        order by q.question_text, q.deleted_at is null desc, q.id desc
+      `;
+
+      // Past answers index into these, so a changed answer set gets a new row
+      await tx`
+        create temp table question_replaced on commit drop as
+        select c.id, c.question_text
+        from question_current c
+        join question_sync s on s.question_text = c.question_text
+        where c.answers is distinct from s.answers
+          or c.correct_index is distinct from s.correct_index
+      `;
+
+      await tx`
+        update questions q
+        set deleted_at = now()
+        from question_replaced r
+        where q.id = r.id and q.deleted_at is null
+      `;
+
+      // Cosmetic changes (difficulty, category) and restores keep the id
+      const updated = await tx`
+        update questions q
+        set difficulty = s.difficulty,
+            category = s.category,
+            deleted_at = null
+        from question_current c
+        join question_sync s on s.question_text = c.question_text
+        where q.id = c.id
+          and not exists (select 1 from question_replaced r where r.id = c.id)
+          and (q.content_hash is distinct from s.content_hash or q.deleted_at is not null)
+      `;
+
+      const deleted = await tx`
+        update questions q
+        set deleted_at = now()
+        where q.deleted_at is null
+          and not exists (select 1 from question_sync s where s.question_text = q.question_text)
+      `;
+
+      const inserted = await tx`
+        insert into questions (question_text, answers, correct_index, difficulty, category)
+        select s.question_text, s.answers, s.correct_index, s.difficulty, s.category
+        from question_sync s
+        where not exists (select 1 from question_current c where c.question_text = s.question_text)
+          or exists (select 1 from question_replaced r where r.question_text = s.question_text)
+      `;
+
+      const [{ replaced }] = await tx<{ replaced: number }[]>`
+        select count(*)::int as replaced from question_replaced
+      `;
+
+      const stats: SyncStats = {
+        ...staged,
+        inserted: inserted.count - replaced,
+        replaced,
+        updated: updated.count,
+        deleted: deleted.count,
+        unchanged: total - inserted.count - updated.count,
+        dryRun,
+      };
+
+      if (dryRun) throw new DryRunRollback(stats);
+      return stats;
+    });
+  } catch (error) {
+    if (error instanceof DryRunRollback) return error.stats;
+    throw error;
+  }
+}
@@ -1,4 +1,5 @@
 import { z } from 'zod';
+import { GAME_CONFIG } from '@/lib/game/config';
 
 /**
  * Registration form validation schema
@@ -38,6 +39,18 @@ export const submitAnswerSchema = z.object({
   answerIndex: z.number().int().min(0).max(3),
 });
 
+export const leaderboardPageSchema = z.object({
+  offset: z.coerce.number().int().min(0).default(0),
+  limit: z.coerce.number().int().min(1).max(100).default(GAME_CONFIG.LEADERBOARD_PAGE_SIZE),
+});
+
+export const clockReportSchema = z.object({
+  offsetMs: z.number(),
+  rttMs: z.number().min(0),
+});
+
 export type RegisterInput = z.infer<typeof registerSchema>;
 export type LoginInput = z.infer<typeof loginSchema>;
 export type SubmitAnswerInput = z.infer<typeof submitAnswerSchema>;
+export type LeaderboardPageInput = z.infer<typeof leaderboardPageSchema>;
+export type ClockReportInput = z.infer<typeof clockReportSchema>;
@@ -0,0 +1,286 @@
+"""
+API latency budget gate.
+
+Replays perf/scenario.json against a local server, measures each route's
+latency and fails when a p95 exceeds its target in perf/budget.json:
+
+    python perf/check_budget.py                      # check, diff against the baseline
+    python perf/check_budget.py --update-baseline    # ...and store this run as the new baseline
+
+Scenario users are provisioned in the database (testsprite_tests/provisioning.py)
+and deleted afterwards. Steps run in order. Within a route step, every user
+sends `perUser` requests one after another, and users run concurrently.
+`"action"` steps start or finish the game as the admin (TEST_ADMIN_SESSION, or
+ADMIN_USERNAME / ADMIN_PASSWORD). "[gameId]" in a route is the game the scenario
+started. With `"conditional": true`, each request sends the ETag the user last
+received.
+
+Each run is written to perf/results/latest.json. When perf/baselines/latest.json
+exists, the report shows every route's p95 change against it. Changes above the
+budget's `baselineThresholdPercent` are flagged, and they fail the run with
+--fail-on-regression. Exit code 1 = budget exceeded (or regression).
+
+Requires `aiohttp`, `psycopg` and `argon2-cffi`.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import aiohttp
+import psycopg
+
+PERF_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(PERF_DIR.parent / "testsprite_tests"))
+from provisioning import database_url, delete_provisioned_users, provision_users, random_prefix  # noqa: E402
+
+BASE_URL = os.environ.get("BASE_URL", "http://localhost:3000")
+SESSION_COOKIE_NAME = "auth_session"
+PASSWORD = "Password123!"
+
+
+class ScenarioError(Exception):
+    pass
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class Replay:
+    def __init__(self, http, users, admin_session):
+        self.http = http
+        self.users = users  # ProvisionedUser, session_id replaced on login
+        self.admin_session = admin_session
+        self.game_id = None
+        self.etags = {}
+        self.samples = {}  # route -> [ms]
+        self.errors = {}  # route -> [str]
+
+    def record(self, route, ms, error=None):
+        self.samples.setdefault(route, []).append(ms)
+        if error:
+            self.errors.setdefault(route, []).append(error)
+
+    async def request(self, route, user, body=None, conditional=False, measure=True):
+        method, path = route.split(" ", 1)
+        if "[gameId]" in path:
+            path = path.replace("[gameId]", str(self.game_id))
+        headers = {"Cookie": f"{SESSION_COOKIE_NAME}={user.session_id}"}
+        if conditional and user.id in self.etags:
+            headers["If-None-Match"] = self.etags[user.id]
+        if route == "POST /api/auth/login":
+            body = {"username": user.username, "password": PASSWORD}
+
+        started = time.perf_counter()
+        error = None
+        try:
+            async with self.http.request(method, f"{BASE_URL}{path}", json=body, headers=headers) as resp:
+                await resp.read()
+                if resp.status >= 400:
+                    error = f"{resp.status}"
+                if "ETag" in resp.headers:
+                    self.etags[user.id] = resp.headers["ETag"]
+                if route == "POST /api/auth/login" and resp.status == 200:
+                    user.session_id = resp.cookies[SESSION_COOKIE_NAME].value
+        except aiohttp.ClientError as exc:
+            error = repr(exc)
+        if measure:
+            self.record(route, (time.perf_counter() - started) * 1000, error)
+
+    async def admin(self, path):
+        async with self.http.post(
+            f"{BASE_URL}{path}",
+            headers={"Cookie": f"{SESSION_COOKIE_NAME}={self.admin_session}"},
+        ) as resp:
+            return resp.status, await resp.json(content_type=None)
+
+    async def run_step(self, step, concurrency):
+        action = step.get("action")
+        if action == "start_game":
+            status, body = await self.admin("/api/game/start")
+            if status != 201:
+                raise ScenarioError(f"Could not start a game ({status}): {body.get('error')}")
+            self.game_id = body["gameId"]
+            return
+        if action == "finish_game":
+            status, body = await self.admin("/api/game/finish")
+            if status != 200:
+                raise ScenarioError(f"Could not finish the game ({status}): {body.get('error')}")
+            return
+        if action:
+            raise ScenarioError(f"Unknown action '{action}'")
+
+        limit = asyncio.Semaphore(concurrency)
+
+        async def user_requests(user):
+            async with limit:
+                for _ in range(step.get("perUser", 1)):
+                    await self.request(
+                        step["route"], user, step.get("body"),
+                        conditional=step.get("conditional", False),
+                        measure=step.get("measure", True),
+                    )
+
+        await asyncio.gather(*(user_requests(user) for user in self.users))
+
+    def summary(self):
+        routes = {}
+        for route, samples in sorted(self.samples.items()):
+            ordered = sorted(samples)
+            routes[route] = {
+                "count": len(ordered),
+                "errors": len(self.errors.get(route, [])),
+                "p50Ms": round(percentile(ordered, 50), 2),
+                "p95Ms": round(percentile(ordered, 95), 2),
+                "p99Ms": round(percentile(ordered, 99), 2),
+            }
+        return routes
+
+
+async def admin_login(http):
+    if os.environ.get("TEST_ADMIN_SESSION"):
+        return os.environ["TEST_ADMIN_SESSION"]
+    async with http.post(
+        f"{BASE_URL}/api/auth/login",
+        json={"username": os.environ.get("ADMIN_USERNAME", "admin"), "password": os.environ.get("ADMIN_PASSWORD", "changeme")},
+    ) as resp:
+        if resp.status != 200:
+            raise ScenarioError(f"Admin login failed ({resp.status})")
+        return resp.cookies[SESSION_COOKIE_NAME].value
+
+
+async def replay(scenario, users, concurrency):
+    connector = aiohttp.TCPConnector(limit=0)
+    async with aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar()) as http:
+        run = Replay(http, users, await admin_login(http))
+        finished = True
+        try:
+            for step in scenario["steps"]:
+                await run.run_step(step, concurrency)
+                if step.get("action") in ("start_game", "finish_game"):
+                    finished = step["action"] == "finish_game"
+        finally:
+            if not finished:
+                await run.admin("/api/game/finish")  # Never leave the scenario's game running
+        return run.summary()
+
+
+def check_budget(budget, routes):
+    failures = []
+    for route, target in budget["routes"].items():
+        result = routes.get(route)
+        if result is None:
+            failures.append(f"{route}: not exercised by the scenario")
+            continue
+        if result["p95Ms"] > target["p95Ms"]:
+            failures.append(f"{route}: p95 {result['p95Ms']:.1f}ms over the {target['p95Ms']}ms budget")
+        if result["errors"] > budget["maxErrorRate"] * result["count"]:
+            failures.append(f"{route}: {result['errors']}/{result['count']} requests failed")
+    return failures
+
+
+def diff_against_baseline(baseline, routes, threshold):
+    """Rows of (route, base p95, current p95, change %, regressed)."""
+    rows = []
+    for route, result in routes.items():
+        base = baseline["routes"].get(route)
+        if base is None:
+            rows.append((route, None, result["p95Ms"], None, False))
+            continue
+        change = (result["p95Ms"] - base["p95Ms"]) / base["p95Ms"] * 100 if base["p95Ms"] else 0.0
+        rows.append((route, base["p95Ms"], result["p95Ms"], change, change > threshold))
+    return rows
+
+
+def print_report(budget, routes, diff):
+    print(f"\n  {'route':<36} {'count':>6} {'err':>4} {'p50':>8} {'p95':>8} {'budget':>8} {'vs base':>9}")
+    changes = {row[0]: row for row in diff}
+    for route, result in routes.items():
+        target = budget["routes"].get(route, {}).get("p95Ms")
+        row = changes.get(route)
+        change = "" if row is None else "new" if row[3] is None else f"{row[3]:+.1f}%"
+        flag = "✗" if (target is not None and result["p95Ms"] > target) or (row and row[4]) else " "
+        print(
+            f"{flag} {route:<36} {result['count']:>6} {result['errors']:>4} {result['p50Ms']:>6.1f}ms"
+            f" {result['p95Ms']:>6.1f}ms {(f'{target}ms' if target else '-'):>8} {change:>9}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check API latencies against perf/budget.json")
+    parser.add_argument("--budget", default=str(PERF_DIR / "budget.json"))
+    parser.add_argument("--scenario", default=str(PERF_DIR / "scenario.json"))
+    parser.add_argument("--baseline", default=str(PERF_DIR / "baselines" / "latest.json"))
+    parser.add_argument("--out", default=str(PERF_DIR / "results" / "latest.json"))
+    parser.add_argument("--concurrency", type=int, help="max users in flight per step (default: all)")
+    parser.add_argument("--update-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--fail-on-regression", action="store_true", help="also fail on p95 regressions vs the baseline")
+    args = parser.parse_args()
+
+    budget = json.loads(Path(args.budget).read_text())
+    scenario = json.loads(Path(args.scenario).read_text())
+    users_count = scenario["users"]
+
+    prefix = random_prefix()
+    with psycopg.connect(database_url()) as conn:
+        users = provision_users(conn, users_count, prefix=prefix, password=PASSWORD)
+        try:
+            routes = asyncio.run(replay(scenario, users, args.concurrency or users_count))
+        except ScenarioError as error:
+            print(f"Scenario failed: {error}")
+            return 1
+        finally:
+            conn.rollback()
+            delete_provisioned_users(conn, prefix)
+
+    report = {
+        "createdAt": datetime.now(timezone.utc).isoformat(),
+        "scenario": scenario.get("description", ""),
+        "users": users_count,
+        "routes": routes,
+    }
+
+    baseline_path = Path(args.baseline)
+    diff = []
+    if baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text())
+        diff = diff_against_baseline(baseline, routes, budget["baselineThresholdPercent"])
+        print(f"Baseline: {baseline['createdAt']}")
+        report["baseline"] = {
+            "createdAt": baseline["createdAt"],
+            "p95ChangePercent": {route: change and round(change, 1) for route, _, _, change, _ in diff},
+        }
+    print_report(budget, routes, diff)
+
+    out = Path(args.out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2) + "\n")
+    if args.update_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nBaseline updated: {baseline_path}")
+
+    failures = check_budget(budget, routes)
+    regressions = [f"{route}: p95 {base:.1f}ms -> {cur:.1f}ms ({change:+.1f}%)" for route, base, cur, change, bad in diff if bad]
+    for line in failures:
+        print(f"  ✗ {line}")
+    for line in regressions:
+        print(f"  {'✗' if args.fail_on_regression else '!'} regression {line}")
+
+    failed = bool(failures) or (args.fail_on_regression and bool(regressions))
+    print("\nBudget exceeded" if failed else "\nWithin budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+import { createWriteStream, type WriteStream } from 'fs';
+import { resolve } from 'path';
+import { findArchivableGames, archiveGame, dropArchivedPartitions } from '../lib/game/archive';
+
+const DEFAULT_OLDER_THAN_DAYS = 30;
+const BATCH_SIZE = 100;
+
+// Usage: db:archive-games [days] [out.jsonl]
+async function archiveGames() {
+  const olderThanDays = process.argv[2] ? Number(process.argv[2]) : DEFAULT_OLDER_THAN_DAYS;
+  if (!Number.isFinite(olderThanDays) || olderThanDays < 0) {
+    console.error(`Invalid number of days: ${process.argv[2]}`);
+    process.exit(1);
+  }
+
+  // Optional JSONL copy of every archived game (appended, one game per line)
+  const outPath = process.argv[3] ? resolve(process.argv[3]) : null;
+  const out: WriteStream | null = outPath ? createWriteStream(outPath, { flags: 'a' }) : null;
+
+  console.log(`Archiving finished games older than ${olderThanDays} day(s)`);
+
+  // ── Step 1: Archive in batches ──────────────────────────────────
+  let archived = 0;
+  let answers = 0;
+  for (;;) {
+    const ids = await findArchivableGames(olderThanDays, BATCH_SIZE);
+    if (ids.length === 0) break;
+
+    for (const gameId of ids) {
+      const record = await archiveGame(gameId);
+      if (!record) continue;
+      archived++;
+      answers += record.answers.length;
+      if (out && !out.write(JSON.stringify(record) + '\n')) {
+        await new Promise((r) => out.once('drain', r));
+      }
+    }
+
+    console.log(`  Archived ${archived} game(s) so far`);
+  }
+
+  if (out) {
+    await new Promise((r) => out.end(r));
+    console.log(`Wrote archived games to ${outPath}`);
+  }
+
+  // ── Step 2: Drop partitions that only held archived games ───────
+  const dropped = await dropArchivedPartitions();
+
+  console.log('\n--- Summary ---');
+  console.log(`  Games archived:     ${archived}`);
+  console.log(`  Answers moved:      ${answers}`);
+  console.log(`  Partitions dropped: ${dropped}`);
+  process.exit(0);
+}
+
+archiveGames().catch((err) => {
+  console.error('Archival failed:', err);
+  process.exit(1);
+});
@@ -1,58 +1,159 @@
-import { db, questions } from '../lib/db';
-import { asc } from 'drizzle-orm';
-import { writeFileSync } from 'fs';
+import { db } from '../lib/db';
+import { createWriteStream } from 'fs';
+import { rename, rm } from 'fs/promises';
+import { createGzip } from 'zlib';
+import { Readable } from 'stream';
+import { pipeline } from 'stream/promises';
 import { resolve, dirname } from 'path';
 import { fileURLToPath } from 'url';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = dirname(__filename);
 
+const CURSOR_BATCH_SIZE = 1000;
+
+interface ExportRow {
+  question_text: string;
+  answers: string[];
+  correct_index: number;
+  difficulty: string;
+  category: string;
+  attempts: number | null;
+  correct: number | null;
+  timeouts: number | null;
+  avg_elapsed_ms: number | null;
+}
+
+// Usage: db:export-questions [out.json|out.jsonl][.gz] [--category=X] [--difficulty=Y] [--since=YYYY-MM-DD] [--stats]
+function parseArgs(argv: string[]) {
+  const flags = new Map<string, string | true>();
+  let outArg: string | undefined;
+  for (const arg of argv) {
+    if (arg.startsWith('--')) {
+      const [key, ...value] = arg.slice(2).split('=');
+      flags.set(key, value.length > 0 ? value.join('=') : true);
+    } else {
+      outArg = arg;
+    }
+  }
+  const str = (key: string) => (typeof flags.get(key) === 'string' ? (flags.get(key) as string) : undefined);
+  return {
+    outPath: outArg ? resolve(outArg) : resolve(__dirname, '../data/questions.json'),
+    category: str('category'),
+    difficulty: str('difficulty'),
+    since: str('since'),
+    withStats: flags.has('stats'),
+  };
+}
+
 async function exportQuestions() {
-  const outPath = process.argv[2]
-    ? resolve(process.argv[2])
-    : resolve(__dirname, '../data/questions.json');
-
-  // ── Query all questions ───────────────────────────────────────
-  const rows = await db
-    .select({
-      questionText: questions.questionText,
-      answers: questions.answers,
-      correctIndex: questions.correctIndex,
-      difficulty: questions.difficulty,
-      category: questions.category,
-    })
-    .from(questions)
-    .orderBy(asc(questions.id));
-
-  if (rows.length === 0) {
-    console.error('No questions found in the database');
+  const { outPath, category, difficulty, since, withStats } = parseArgs(process.argv.slice(2));
+
+  const gzip = outPath.endsWith('.gz');
+  const jsonl = /\.(jsonl|ndjson)(\.gz)?$/.test(outPath);
+
+  if (since && Number.isNaN(Date.parse(since))) {
+    console.error(`Invalid --since date: ${since}`);
     process.exit(1);
   }
 
-  // ── Map to JSON format ────────────────────────────────────────
-  const data = rows.map((r) => ({
-    question: r.questionText,
-    answers: r.answers,
-    correctIndex: r.correctIndex,
-    difficulty: r.difficulty,
-    category: r.category,
-  }));
+  const sql = db.$client;
 
-  // ── Write file ────────────────────────────────────────────────
-  writeFileSync(outPath, JSON.stringify(data, null, 2) + '\n', 'utf-8');
-  console.log(`Wrote ${data.length} questions to ${outPath}`);
+  // ── One streaming query: filters + optional per-question answer aggregate ──
+  const query = sql<ExportRow[]>`
+    select q.question_text, q.answers, q.correct_index, q.difficulty, q.category,
+           ${withStats
+             ? sql`s.attempts, s.correct, s.timeouts, s.avg_elapsed_ms`
+             : sql`null::int as attempts, null::int as correct, null::int as timeouts, null::int as avg_elapsed_ms`}
+    from questions q
+    ${withStats
+      ? sql`left join (
+          select question_id,
+                 count(*)::int as attempts,
+                 count(*) filter (where is_correct)::int as correct,
+                 count(*) filter (where answer_index is null)::int as timeouts,
+                 round(avg(elapsed_ms))::int as avg_elapsed_ms
+          from player_answers
+          group by question_id
+        ) s on s.question_id = q.id`
+      : sql``}
+    where q.deleted_at is null
+      ${category ? sql`and q.category = ${category}` : sql``}
+      ${difficulty ? sql`and q.difficulty = ${difficulty}` : sql``}
+      ${since ? sql`and q.created_at >= ${new Date(since)}` : sql``}
+    order by q.id
+  `;
 
-  // ── Summary ───────────────────────────────────────────────────
-  const categoryCounts = data.reduce((acc, q) => {
-    acc[q.category] = (acc[q.category] || 0) + 1;
-    return acc;
-  }, {} as Record<string, number>);
+  const categoryCounts: Record<string, number> = {};
+  const difficultyCounts: Record<string, number> = {};
+  let total = 0;
+  const startedAt = Date.now();
+
+  // ── Cursor → records (constant memory) ───────────────────────
+  async function* records(): AsyncGenerator<string> {
+    if (!jsonl) yield '[\n';
+    for await (const rows of query.cursor(CURSOR_BATCH_SIZE)) {
+      for (const r of rows) {
+        const record: Record<string, unknown> = {
+          question: r.question_text,
+          answers: r.answers,
+          correctIndex: r.correct_index,
+          difficulty: r.difficulty,
+          category: r.category,
+        };
+        if (withStats) {
+          const attempts = r.attempts ?? 0;
+          record.stats = {
+            attempts,
+            accuracy: attempts > 0 ? Number(((r.correct ?? 0) / attempts).toFixed(4)) : null,
+            timeoutRate: attempts > 0 ? Number(((r.timeouts ?? 0) / attempts).toFixed(4)) : null,
+            avgAnswerMs: r.avg_elapsed_ms,
+          };
+        }
 
-  const difficultyCounts = data.reduce((acc, q) => {
-    acc[q.difficulty] = (acc[q.difficulty] || 0) + 1;
-    return acc;
-  }, {} as Record<string, number>);
+        categoryCounts[r.category] = (categoryCounts[r.category] || 0) + 1;
+        difficultyCounts[r.difficulty] = (difficultyCounts[r.difficulty] || 0) + 1;
 
+        if (jsonl) {
+          yield JSON.stringify(record) + '\n';
+        } else {
+          const json = JSON.stringify(record, null, 2).replace(/^/gm, '  ');
+          yield (total > 0 ? ',\n' : '') + json;
+        }
+        total++;
+      }
+    }
+    if (!jsonl) yield total > 0 ? '\n]\n' : ']\n';
+  }
+
+  // ── Write (optionally gzipped) to a temp file, then swap it in ──
+  // The target is only replaced by a complete, non-empty export
+  const tmpPath = `${outPath}.tmp`;
+  const source = Readable.from(records());
+  const out = createWriteStream(tmpPath);
+  try {
+    if (gzip) {
+      await pipeline(source, createGzip(), out);
+    } else {
+      await pipeline(source, out);
+    }
+  } catch (err) {
+    await rm(tmpPath, { force: true });
+    throw err;
+  }
+
+  if (total === 0) {
+    await rm(tmpPath, { force: true });
+    console.error('No questions matched');
+    process.exit(1);
+  }
+
+  await rename(tmpPath, outPath);
+
+  const elapsed = (Date.now() - startedAt) / 1000;
+  console.log(`Wrote ${total} questions to ${outPath} in ${elapsed.toFixed(1)}s`);
+
+  // ── Summary ───────────────────────────────────────────────────
   console.log('\n  By category:');
   for (const [cat, count] of Object.entries(categoryCounts).sort()) {
     console.log(`    ${cat}: ${count}`);
@@ -60,7 +161,7 @@ async function exportQuestions() {
 
   console.log('\n  By difficulty:');
   for (const [diff, count] of Object.entries(difficultyCounts).sort()) {
-    const pct = ((count / data.length) * 100).toFixed(1);
+    const pct = ((count / total) * 100).toFixed(1);
     console.log(`    ${diff}: ${count} (${pct}%)`);
   }
 
@@ -1,18 +1,11 @@
 import { db, questions } from '../lib/db';
 import { games } from '../lib/db/schema';
-import { eq, sql } from 'drizzle-orm';
-import { readFileSync } from 'fs';
+import { eq, ne, sql } from 'drizzle-orm';
+import { findArchivableGames, archiveGame } from '../lib/game/archive';
+import { bulkImportQuestions, validateQuestionFile } from '../lib/questions/bulk-import';
 import { resolve, dirname } from 'path';
 import { fileURLToPath } from 'url';
 
-interface QuestionData {
-  question: string;
-  answers: string[];
-  correctIndex: number;
-  difficulty: string;
-  category: string;
-}
-
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = dirname(__filename);
 
@@ -23,37 +16,16 @@ async function refreshQuestions() {
 
   console.log(`Reading questions from: ${filePath}`);
 
-  // ── Step 1: Read and validate JSON ──────────────────────────────
-  let questionsData: QuestionData[];
+  // ── Step 1: Stream and validate the file (JSON array or JSONL) ──
+  let fileCount: number;
   try {
-    const raw = readFileSync(filePath, 'utf-8');
-    questionsData = JSON.parse(raw);
+    fileCount = await validateQuestionFile(filePath);
   } catch (err) {
-    console.error(`Failed to read ${filePath}:`, err);
+    console.error(`Failed to read ${filePath}:`, err instanceof Error ? err.message : err);
     process.exit(1);
   }
 
-  if (!Array.isArray(questionsData)) {
-    console.error('JSON file must contain an array of questions');
-    process.exit(1);
-  }
-
-  for (const [i, q] of questionsData.entries()) {
-    if (!q.question || !Array.isArray(q.answers) || q.answers.length !== 4) {
-      console.error(`Invalid question at index ${i}: missing fields or wrong answer count`);
-      process.exit(1);
-    }
-    if (typeof q.correctIndex !== 'number' || q.correctIndex < 0 || q.correctIndex > 3) {
-      console.error(`Invalid correctIndex at index ${i}: ${q.correctIndex}`);
-      process.exit(1);
-    }
-    if (!q.difficulty || !q.category) {
-      console.error(`Missing difficulty or category at index ${i}`);
-      process.exit(1);
-    }
-  }
-
-  console.log(`Validated ${questionsData.length} questions from file`);
+  console.log(`Validated ${fileCount} questions from file`);
 
   // ── Step 2: Warn about active games ─────────────────────────────
   const activeGames = await db.select().from(games).where(eq(games.status, 'playing'));
@@ -66,61 +38,62 @@ async function refreshQuestions() {
     console.warn('Deleting questions will affect these in-progress games!\n');
   }
 
-  // ── Step 3: Delete all games (cascades to participants, states, answers, scores) ──
-  const gameCount = await db.select({ count: sql<number>`count(*)` }).from(games);
-  const deletedGames = Number(gameCount[0].count);
+  // ── Step 3: Archive finished games so the global leaderboard keeps them ──
+  let archivedGames = 0;
+  for (;;) {
+    const ids = await findArchivableGames(0, 100);
+    if (ids.length === 0) break;
+    for (const gameId of ids) {
+      if (await archiveGame(gameId)) archivedGames++;
+    }
+  }
+  console.log(`Archived ${archivedGames} finished game(s)`);
+
+  // ── Step 4: Delete unarchived games (cascades to participants, states, answers, scores) ──
+  // Archived games keep their game_archives row, which holds no question references
+  const deleted = await db
+    .delete(games)
+    .where(ne(games.status, 'archived'))
+    .returning({ id: games.id });
+  const deletedGames = deleted.length;
 
-  await db.delete(games);
   console.log(`Deleted ${deletedGames} game(s) and all related data (participants, scores, answers, states)`);
 
-  // ── Step 4: Delete all existing questions ───────────────────────
+  // ── Step 5: Delete all existing questions ───────────────────────
   const existingCount = await db.select({ count: sql<number>`count(*)` }).from(questions);
   const deletedCount = Number(existingCount[0].count);
 
   await db.delete(questions);
   console.log(`Deleted ${deletedCount} existing questions`);
 
-  // ── Step 5: Insert all questions from JSON ──────────────────────
-  const inserted = await db.insert(questions).values(
-    questionsData.map((q) => ({
-      questionText: q.question,
-      answers: q.answers,
-      correctIndex: q.correctIndex,
-      difficulty: q.difficulty,
-      category: q.category,
-    }))
-  ).returning();
+  // ── Step 6: COPY all questions from the file ────────────────────
+  const stats = await bulkImportQuestions(filePath, {
+    onProgress: ({ rows, rowsPerSecond }) => {
+      console.log(`  ... ${rows} rows loaded (${rowsPerSecond} rows/s)`);
+    },
+  });
 
-  console.log(`Inserted ${inserted.length} new questions`);
+  console.log(`Inserted ${stats.inserted} new questions in ${(stats.elapsedMs / 1000).toFixed(1)}s (${stats.rowsPerSecond} rows/s)`);
 
-  // ── Step 6: Print summary ───────────────────────────────────────
+  // ── Step 7: Print summary ───────────────────────────────────────
   console.log('\n--- Summary ---');
+  console.log(`  Games archived:    ${archivedGames}`);
   console.log(`  Games deleted:     ${deletedGames}`);
   console.log(`  Questions deleted: ${deletedCount}`);
-  console.log(`  Questions added:   ${inserted.length}`);
-
-  const categoryCounts = questionsData.reduce((acc, q) => {
-    acc[q.category] = (acc[q.category] || 0) + 1;
-    return acc;
-  }, {} as Record<string, number>);
+  console.log(`  Questions added:   ${stats.inserted}`);
 
   console.log('\n  By category:');
-  for (const [cat, count] of Object.entries(categoryCounts).sort()) {
+  for (const [cat, count] of Object.entries(stats.byCategory).sort()) {
     console.log(`    ${cat}: ${count}`);
   }
 
-  const difficultyCounts = questionsData.reduce((acc, q) => {
-    acc[q.difficulty] = (acc[q.difficulty] || 0) + 1;
-    return acc;
-  }, {} as Record<string, number>);
-
   console.log('\n  By difficulty:');
-  for (const [diff, count] of Object.entries(difficultyCounts).sort()) {
-    const pct = ((count / questionsData.length) * 100).toFixed(1);
+  for (const [diff, count] of Object.entries(stats.byDifficulty).sort()) {
+    const pct = ((count / stats.rows) * 100).toFixed(1);
     console.log(`    ${diff}: ${count} (${pct}%)`);
   }
 
-  console.log(`\n  Total questions in database: ${inserted.length}`);
+  console.log(`\n  Total questions in database: ${stats.inserted}`);
   process.exit(0);
 }
 
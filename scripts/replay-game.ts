@@ -0,0 +1,90 @@
+import { writeFileSync } from 'fs';
+import { resolve } from 'path';
+import { eq } from 'drizzle-orm';
+import { db, gameStates, scores } from '../lib/db';
+import { loadGameEvents, loadGameReplay } from '../lib/game/events';
+import { foldGameEvents, projectGameState } from '../lib/game/replay';
+
+// Usage: db:replay-game <gameId> [--user=ID] [--out=events.jsonl]
+//   Rebuilds the game from game_events and checks it against game_states/scores.
+//   --user prints the state that user would see; --out saves the log for benchmarks.
+function parseArgs(argv: string[]) {
+  const flags = new Map<string, string>();
+  const positional: string[] = [];
+  for (const arg of argv) {
+    if (arg.startsWith('--')) {
+      const [key, ...value] = arg.slice(2).split('=');
+      flags.set(key, value.join('='));
+    } else {
+      positional.push(arg);
+    }
+  }
+  return {
+    gameId: Number(positional[0]),
+    userId: flags.has('user') ? Number(flags.get('user')) : null,
+    outPath: flags.get('out') ? resolve(flags.get('out')!) : null,
+  };
+}
+
+async function replayGame() {
+  const { gameId, userId, outPath } = parseArgs(process.argv.slice(2));
+  if (!Number.isInteger(gameId)) {
+    console.error('Usage: db:replay-game <gameId> [--user=ID] [--out=events.jsonl]');
+    process.exit(1);
+  }
+
+  // ── Step 1: Load and fold ───────────────────────────────────────
+  let startedAt = performance.now();
+  const events = await loadGameEvents(gameId);
+  const loadMs = performance.now() - startedAt;
+
+  if (events.length === 0) {
+    console.error(`Game ${gameId} has no events (started before the log existed, or archived)`);
+    process.exit(1);
+  }
+
+  startedAt = performance.now();
+  const game = foldGameEvents(gameId, events)!;
+  const foldMs = performance.now() - startedAt;
+
+  console.log(`Game ${gameId}: ${events.length} events, loaded in ${loadMs.toFixed(1)}ms, folded in ${foldMs.toFixed(2)}ms`);
+  console.log(`  Phase: ${game.phase}, question ${game.currentQuestionIndex + 1}/${game.questionOrder.length}`);
+
+  if (outPath) {
+    writeFileSync(outPath, events.map((e) => JSON.stringify(e)).join('\n') + '\n');
+    console.log(`  Wrote log to ${outPath}`);
+  }
+
+  // ── Step 2: Compare with the mutable tables ─────────────────────
+  let mismatches = 0;
+
+  const state = await db.query.gameStates.findFirst({ where: eq(gameStates.gameId, gameId) });
+  if (state && (state.phase !== game.phase || state.currentQuestionIndex !== game.currentQuestionIndex)) {
+    mismatches++;
+    console.log(`  ✗ game_states is ${state.phase} @ ${state.currentQuestionIndex}, log says ${game.phase} @ ${game.currentQuestionIndex}`);
+  }
+
+  const storedScores = await db
+    .select({ userId: scores.userId, score: scores.score })
+    .from(scores)
+    .where(eq(scores.gameId, gameId));
+  for (const { userId: scoreUserId, score } of storedScores) {
+    const replayed = game.scores.get(scoreUserId) ?? 0;
+    if (replayed !== score) {
+      mismatches++;
+      console.log(`  ✗ User ${scoreUserId}: scores has ${score}, log says ${replayed}`);
+    }
+  }
+
+  console.log(mismatches === 0 ? '  ✓ Log matches game_states and scores' : `  ${mismatches} mismatch(es)`);
+
+  // ── Step 3: Projection for one user ─────────────────────────────
+  if (userId !== null) {
+    const replay = await loadGameReplay(gameId);
+    console.log(JSON.stringify(projectGameState(replay!.game, userId, replay!.refs), null, 2));
+  }
+
+  process.exit(mismatches === 0 ? 0 : 1);
+}
+
+replayGame();
@@ -0,0 +1,107 @@
+import { inArray } from 'drizzle-orm';
+import { db, users, observeQueries } from '../lib/db';
+import { VirtualClock, setClock } from '../lib/game/clock';
+import { initializeGame } from '../lib/game/engine';
+import { resolveGameRules, type GameConfigOverride } from '../lib/game/config';
+import { playSimulatedGame, type SimulationPhase } from '../lib/game/simulation';
+
+// Usage: db:simulate-games [--games=100] [--players=6] [--questions=10] [--answer-rate=0.9]
+//   Plays complete games against the configured database with a virtual clock,
+//   so timers cost no wall time. Writes bot users (sim_bot_N) and games: use a
+//   local database.
+
+type Phase = 'start' | SimulationPhase;
+
+function parseArgs(argv: string[]) {
+  const flags = new Map<string, string>();
+  for (const arg of argv) {
+    const [key, ...value] = arg.replace(/^--/, '').split('=');
+    flags.set(key, value.join('='));
+  }
+  const num = (key: string, fallback: number) => (flags.has(key) ? Number(flags.get(key)) : fallback);
+  return {
+    games: num('games', 100),
+    players: num('players', 6),
+    questions: num('questions', resolveGameRules().QUESTIONS_PER_GAME),
+    answerRate: num('answer-rate', 0.9),
+  };
+}
+
+async function ensureBots(count: number): Promise<number[]> {
+  const usernames = Array.from({ length: count }, (_, i) => `sim_bot_${i + 1}`);
+  await db
+    .insert(users)
+    .values(usernames.map((username) => ({
+      username,
+      email: `${username}@simulation.invalid`,
+      passwordHash: '!', // Not a valid hash: bots cannot log in
+    })))
+    .onConflictDoNothing();
+
+  const rows = await db.select({ id: users.id }).from(users).where(inArray(users.username, usernames));
+  return rows.map((r) => r.id);
+}
+
+async function simulateGames() {
+  if (process.env.NODE_ENV === 'production') {
+    console.error('Refusing to simulate against a production database');
+    process.exit(1);
+  }
+
+  const { games, players, questions, answerRate } = parseArgs(process.argv.slice(2));
+  if (![games, players, questions, answerRate].every(Number.isFinite) || players < 2) {
+    console.error('Invalid arguments (need --players >= 2)');
+    process.exit(1);
+  }
+
+  const config: GameConfigOverride = { QUESTIONS_PER_GAME: questions };
+  const rules = resolveGameRules(config);
+
+  const botIds = await ensureBots(players);
+
+  const clock = new VirtualClock();
+  const simulatedFrom = clock.now();
+  setClock(clock);
+
+  let phase: Phase = 'start';
+  const queryCounts: Record<Phase, number> = { start: 0, question: 0, summary: 0 };
+  observeQueries(() => {
+    queryCounts[phase]++;
+  });
+
+  console.log(`Simulating ${games} game(s): ${players} players, ${questions} questions, answer rate ${answerRate}`);
+
+  let answers = 0;
+  let playedQuestions = 0;
+  const startedAt = performance.now();
+
+  for (let g = 0; g < games; g++) {
+    phase = 'start';
+    const gameId = await initializeGame(botIds, { config });
+
+    const played = await playSimulatedGame(gameId, botIds, clock, {
+      rules,
+      answerRate,
+      clientReads: true,
+      onPhase: (p) => {
+        phase = p;
+      },
+    });
+    playedQuestions += played.questions;
+    answers += played.answers;
+  }
+
+  const seconds = (performance.now() - startedAt) / 1000;
+  console.log(`\nPlayed ${games} game(s) in ${seconds.toFixed(1)}s`);
+  console.log(`  ${(games / seconds).toFixed(2)} games/s, ${(answers / seconds).toFixed(1)} answers/s`);
+  console.log(`  ${((clock.now() - simulatedFrom) / 60000).toFixed(0)} min of game time simulated`);
+
+  console.log('\n  Queries per game by phase:');
+  console.log(`    start:    ${(queryCounts.start / games).toFixed(1)}`);
+  console.log(`    question: ${(queryCounts.question / games).toFixed(1)} (${(queryCounts.question / Math.max(1, playedQuestions)).toFixed(1)} per question)`);
+  console.log(`    summary:  ${(queryCounts.summary / games).toFixed(1)} (${(queryCounts.summary / Math.max(1, playedQuestions)).toFixed(1)} per question)`);
+
+  process.exit(0);
+}
+
+simulateGames();
@@ -0,0 +1,42 @@
+import { resolve, dirname } from 'path';
+import { fileURLToPath } from 'url';
+import { syncQuestions, type SyncStats } from '../lib/questions/sync';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+
+// Usage: db:sync-questions [file] [--dry-run]
+async function syncQuestionBank() {
+  const args = process.argv.slice(2);
+  const dryRun = args.includes('--dry-run');
+  const fileArg = args.find((a) => !a.startsWith('--'));
+  const filePath = fileArg
+    ? resolve(fileArg)
+    : resolve(__dirname, '../data/questions.json');
+
+  console.log(`Syncing questions from: ${filePath}${dryRun ? ' (dry run)' : ''}`);
+
+  let stats: SyncStats;
+  try {
+    stats = await syncQuestions(filePath, {
+      dryRun,
+      onProgress: ({ rows, rowsPerSecond }) => {
+        console.log(`  ... ${rows} rows staged (${rowsPerSecond} rows/s)`);
+      },
+    });
+  } catch (err) {
+    console.error(`Sync failed:`, err instanceof Error ? err.message : err);
+    process.exit(1);
+  }
+
+  console.log(`\n--- ${dryRun ? 'Dry run (nothing committed)' : 'Summary'} ---`);
+  console.log(`  Questions in file: ${stats.rows}`);
+  console.log(`  Inserted:          ${stats.inserted}`);
+  console.log(`  Replaced:          ${stats.replaced}`);
+  console.log(`  Updated/restored:  ${stats.updated}`);
+  console.log(`  Soft-deleted:      ${stats.deleted}`);
+  console.log(`  Unchanged:         ${stats.unchanged}`);
+  process.exit(0);
+}
+
+syncQuestionBank();
@@ -0,0 +1,42 @@
+import { createServer } from 'http';
+import next from 'next';
+import { GAME_WS_PATH, handleGameUpgrade } from '@/lib/game/ws-gateway';
+
+/**
+ * Optional custom server: serves the Next.js app and additionally accepts
+ * WebSocket upgrades on GAME_WS_PATH. `next dev` / `next start` keep working
+ * without it — clients then fall back to SSE.
+ */
+
+const dev = process.env.NODE_ENV !== 'production';
+const port = Number(process.env.PORT ?? 3000);
+
+const app = next({ dev });
+const handle = app.getRequestHandler();
+
+app.prepare().then(() => {
+  const handleNextUpgrade = app.getUpgradeHandler();
+
+  const server = createServer((req, res) => {
+    handle(req, res);
+  });
+
+  server.on('upgrade', (req, socket, head) => {
+    const { pathname } = new URL(req.url ?? '/', 'http://localhost');
+
+    if (pathname === GAME_WS_PATH) {
+      handleGameUpgrade(req, socket, head).catch((error) => {
+        console.error('[WS] Upgrade error:', error);
+        socket.destroy();
+      });
+      return;
+    }
+
+    // Everything else (e.g. dev HMR) goes to Next.js
+    handleNextUpgrade(req, socket, head);
+  });
+
+  server.listen(port, () => {
+    console.log(`> Ready on http://localhost:${port} (WebSocket on ${GAME_WS_PATH})`);
+  });
+});
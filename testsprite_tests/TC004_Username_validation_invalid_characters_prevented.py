@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from browser_session import launch_browser, new_context
 
 async def run_test():
     pw = None
@@ -11,20 +12,11 @@ async def run_test():
         # Start a Playwright session in asynchronous mode
         pw = await async_api.async_playwright().start()
 
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
+        # Reuse the runner's browser when there is one
+        browser = await launch_browser(pw)
+
+        # Fresh context, logged out
+        context = await new_context(browser)
 
         # Open a new page in the browser context
         page = await context.new_page()
@@ -40,7 +32,6 @@ async def run_test():
         frame = context.pages[-1]
         await expect(frame.locator('text=Creando cuenta...').first).not_to_be_visible(timeout=3000)
         assert '/register' in frame.url
-        await asyncio.sleep(5)
 
     finally:
         if context:
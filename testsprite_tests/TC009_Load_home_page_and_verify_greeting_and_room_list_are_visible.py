@@ -1,6 +1,11 @@
 import asyncio
+import re
 from playwright import async_api
 from playwright.async_api import expect
+from browser_session import launch_browser, new_context
+
+BASE_URL = "http://localhost:3000"
+
 
 async def run_test():
     pw = None
@@ -11,63 +16,23 @@ async def run_test():
         # Start a Playwright session in asynchronous mode
         pw = await async_api.async_playwright().start()
 
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
+        # Reuse the runner's browser when there is one
+        browser = await launch_browser(pw)
 
-        # Open a new page in the browser context
+        # Context already logged in as admin (no login form)
+        context = await new_context(browser, role="admin")
         page = await context.new_page()
 
-        # Interact with the page elements to simulate user flow
-        # -> Navigate to http://localhost:3000/login
-        await page.goto("http://localhost:3000/login", wait_until="commit", timeout=10000)
-        
-        # -> Click the 'Reload' button (index 74) to retry loading the login page and recover the site.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[1]/div[1]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the 'Reload' button again (index 201) to retry loading the login page.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[1]/div[1]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Type the username 'admin' into the 'Nombre de usuario' field (interactive element index 83). Then enter the password and submit the form.
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin')
-        
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('changeme')
-        
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        assert '/' in frame.url
-        await expect(frame.locator('text=Bienvenido').first).to_be_visible(timeout=3000)
-        await expect(frame.locator('xpath=//button[contains(., "+ Crear Sala")]').first).to_be_visible(timeout=3000)
-        await asyncio.sleep(5)
+        # -> Open the home page
+        await page.goto(f"{BASE_URL}/")
 
+        # --> Assertions: greeting, game control with connected players, global leaderboard
+        await expect(page.get_by_role("heading", name="Panel de Control")).to_be_visible(timeout=10000)
+        await expect(page.get_by_text("Bienvenido,")).to_be_visible()
+        await expect(page.get_by_role("heading", name="Control de Juego")).to_be_visible()
+        await expect(page.get_by_role("heading", name=re.compile(r"^Jugadores Conectados \(\d+\)$"))).to_be_visible()
+        await expect(page.get_by_role("heading", name="Clasificación General")).to_be_visible()
+        assert page.url == f"{BASE_URL}/"
     finally:
         if context:
             await context.close()
@@ -77,4 +42,3 @@ async def run_test():
             await pw.stop()
 
 asyncio.run(run_test())
-    
\ No newline at end of file
@@ -1,6 +1,12 @@
 import asyncio
+import re
 from playwright import async_api
 from playwright.async_api import expect
+from browser_session import launch_browser, new_context
+from game_events import cookies_for, game_sessions, running_game, wait_for_game_state
+
+BASE_URL = "http://localhost:3000"
+
 
 async def run_test():
     pw = None
@@ -8,82 +14,34 @@ async def run_test():
     context = None
 
     try:
+        # The worker's admin and two of its candidates
+        admin, (player, other) = game_sessions(2)
+
         # Start a Playwright session in asynchronous mode
         pw = await async_api.async_playwright().start()
 
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
+        # Reuse the runner's browser when there is one
+        browser = await launch_browser(pw)
 
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-
-        # Open a new page in the browser context
+        # Context logged in as one of the players (no login form)
+        context = await new_context(browser, session_id=player)
         page = await context.new_page()
 
-        # Interact with the page elements to simulate user flow
-        # -> Navigate to http://localhost:3000/login
-        await page.goto("http://localhost:3000/login", wait_until="commit", timeout=10000)
-        
-        # -> Fill the login form with admin credentials and submit ('Nombre de usuario' = 'admin', 'Contraseña' = 'changeme').
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin')
-        
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('changeme')
-        
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the Reload button on the error page to attempt reloading the app and recover the login/home page.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[2]/div[1]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Fill the login form with admin credentials ('admin' / 'changeme') and submit the form by clicking 'Iniciar Sesión' (use interactive indexes 86, 90, 95).
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin')
-        
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('changeme')
-        
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the Reload button (index 75) to attempt to recover the app and reveal the login/home UI so next steps can be inspected.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[2]/div[1]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        assert '/rooms/' in frame.url
-        assert '/play' in frame.url
-        await expect(frame.locator('text=game play').first).to_be_visible(timeout=3000)
-        await asyncio.sleep(5)
-
+        # -> The player waits on the home page
+        await page.goto(f"{BASE_URL}/")
+        await expect(page.get_by_role("heading", name=re.compile(r"^Hola, "))).to_be_visible(timeout=15000)
+        await expect(page.get_by_text("Esperando que el administrador inicie el juego")).to_be_visible()
+
+        with running_game(admin, [player, other]):
+            state = await asyncio.to_thread(
+                wait_for_game_state, cookies_for(player), lambda s: s["phase"] == "question"
+            )
+
+            # --> Assertions: the same page switches to the game as a participant
+            await expect(page.get_by_text(f"Pregunta 1 de {state['totalQuestions']}")).to_be_visible(timeout=10000)
+            await expect(page.get_by_text("Selecciona tu respuesta")).to_be_visible()
+            await expect(page.get_by_text("ESPECTADOR")).to_have_count(0)
+            assert page.url == f"{BASE_URL}/"
     finally:
         if context:
             await context.close()
@@ -93,4 +51,3 @@ async def run_test():
             await pw.stop()
 
 asyncio.run(run_test())
-    
\ No newline at end of file
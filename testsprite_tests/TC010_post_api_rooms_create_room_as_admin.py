@@ -1,3 +1,4 @@
+import os
 import requests
 import string
 import random
@@ -38,8 +39,9 @@ def test_post_api_rooms_create_room_as_admin():
     room_id = None
 
     try:
-        # Register new user (will become admin)
-        auth_session = register_admin_get_cookie(admin_username, admin_email)
+        # The parallel runner hands each worker its own admin; otherwise
+        # register a new user (will become admin)
+        auth_session = os.environ.get("TEST_ADMIN_SESSION") or register_admin_get_cookie(admin_username, admin_email)
 
         headers = {
             "Cookie": f"auth_session={auth_session}",
@@ -82,12 +84,13 @@ def test_post_api_rooms_create_room_as_admin():
                         assert del_data.get("success") is True
                 except Exception:
                     pass
-            # Logout admin
-            try:
-                logout_url = f"{BASE_URL}/api/auth/logout"
-                requests.post(logout_url, headers=headers, timeout=30)
-            except Exception:
-                pass
+            # Logout admin, unless the session is the runner's to reuse
+            if auth_session != os.environ.get("TEST_ADMIN_SESSION"):
+                try:
+                    logout_url = f"{BASE_URL}/api/auth/logout"
+                    requests.post(logout_url, headers=headers, timeout=30)
+                except Exception:
+                    pass
 
 
 test_post_api_rooms_create_room_as_admin()
\ No newline at end of file
@@ -1,6 +1,12 @@
 import asyncio
+import re
 from playwright import async_api
 from playwright.async_api import expect
+from browser_session import launch_browser, new_context
+from game_events import cookies_for, game_sessions, running_game, wait_for_game_state
+
+BASE_URL = "http://localhost:3000"
+
 
 async def run_test():
     pw = None
@@ -8,77 +14,36 @@ async def run_test():
     context = None
 
     try:
+        # The worker's admin and two of its candidates
+        admin, (player, other) = game_sessions(2)
+
         # Start a Playwright session in asynchronous mode
         pw = await async_api.async_playwright().start()
 
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
+        # Reuse the runner's browser when there is one
+        browser = await launch_browser(pw)
 
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-
-        # Open a new page in the browser context
+        # Context logged in as the admin (no login form)
+        context = await new_context(browser, session_id=admin)
         page = await context.new_page()
 
-        # Interact with the page elements to simulate user flow
-        # -> Navigate to http://localhost:3000/login
-        await page.goto("http://localhost:3000/login", wait_until="commit", timeout=10000)
-        
-        # -> Type 'admin' into the Nombre de usuario field, type 'changeme' into the Contraseña field, then click the 'Iniciar Sesión' button.
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin')
-        
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('changeme')
-        
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the Reload button (index 75) to retry connecting to the application and then re-check whether the room list and first room card fields are visible.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[2]/div[1]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Type 'admin' into the 'Nombre de usuario' field, type 'changeme' into the 'Contraseña' field, then click the 'Iniciar Sesión' button to attempt login again.
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin')
-        
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('changeme')
-        
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('text=Salas').first).to_be_visible(timeout=3000)
-        await expect(frame.locator('text=Sala 1').first).to_be_visible(timeout=3000)
-        await expect(frame.locator('text=En espera').first).to_be_visible(timeout=3000)
-        await expect(frame.locator('text=participantes').first).to_be_visible(timeout=3000)
-        await asyncio.sleep(5)
-
+        with running_game(admin, [player, other]) as game_id:
+            state = await asyncio.to_thread(
+                wait_for_game_state, cookies_for(player), lambda s: s["phase"] == "question"
+            )
+
+            # -> Open the dashboard while the game runs
+            await page.goto(f"{BASE_URL}/")
+
+            # --> Assertions: game status, its actions and the connected player count
+            await expect(page.get_by_text(f"Juego en curso (ID: {game_id})")).to_be_visible(timeout=10000)
+            await expect(page.get_by_role("button", name="Supervisar")).to_be_visible()
+            await expect(page.get_by_role("button", name="Terminar Juego")).to_be_enabled()
+            await expect(page.get_by_role("button", name="Iniciar Juego")).to_have_count(0)
+            players = page.get_by_role("heading", name=re.compile(r"^Jugadores Conectados \(\d+\)$"))
+            await expect(players).to_be_visible()
+            connected = int(re.search(r"\((\d+)\)", await players.inner_text()).group(1))
+            assert connected >= state["totalPlayers"], f"{connected} connected, {state['totalPlayers']} playing"
     finally:
         if context:
             await context.close()
@@ -88,4 +53,3 @@ async def run_test():
             await pw.stop()
 
 asyncio.run(run_test())
-    
\ No newline at end of file
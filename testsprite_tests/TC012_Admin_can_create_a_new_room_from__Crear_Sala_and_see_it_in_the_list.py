@@ -1,6 +1,12 @@
 import asyncio
+import re
 from playwright import async_api
 from playwright.async_api import expect
+from browser_session import launch_browser, new_context
+from game_events import finish_game, game_sessions, mark_online
+
+BASE_URL = "http://localhost:3000"
+
 
 async def run_test():
     pw = None
@@ -8,82 +14,36 @@ async def run_test():
     context = None
 
     try:
+        # The worker's admin and two of its candidates, online
+        admin, players = game_sessions(2)
+        for session_id in players:
+            await asyncio.to_thread(mark_online, session_id)
+
         # Start a Playwright session in asynchronous mode
         pw = await async_api.async_playwright().start()
 
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
+        # Reuse the runner's browser when there is one
+        browser = await launch_browser(pw)
 
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-
-        # Open a new page in the browser context
+        # Context logged in as the admin (no login form)
+        context = await new_context(browser, session_id=admin)
         page = await context.new_page()
 
-        # Interact with the page elements to simulate user flow
-        # -> Navigate to http://localhost:3000/login
-        await page.goto("http://localhost:3000/login", wait_until="commit", timeout=10000)
-        
-        # -> Fill the login form with admin credentials and click 'Iniciar Sesión' to sign in as admin.
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin')
-        
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('changeme')
-        
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the 'Reload' button (index 75) to attempt to recover the application and load the login/dashboard so the create-room flow can be verified.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[2]/div[1]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Fill 'Nombre de usuario' with 'admin' (index 93), fill 'Contraseña' with 'changeme' (index 98), then click 'Iniciar Sesión' (index 103).
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin')
-        
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('changeme')
-        
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the 'Reload' button (index 74) to attempt to recover the application and load the login/dashboard UI.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[1]/div[1]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('text=+ Crear Sala').first).to_be_visible(timeout=3000)
-        await expect(frame.locator('xpath=//form[.//button[normalize-space(.)="Crear"]]').first).to_be_visible(timeout=3000)
-        await expect(frame.locator('text=Sala de Prueba').first).to_be_visible(timeout=3000)
-        await asyncio.sleep(5)
-
+        await page.goto(f"{BASE_URL}/")
+        start = page.get_by_role("button", name="Iniciar Juego")
+        await expect(start).to_be_enabled(timeout=15000)
+
+        try:
+            # -> Start a game from the dashboard
+            await start.click()
+
+            # --> Assertions: the dashboard switches to the running game
+            await expect(page.get_by_text(re.compile(r"^Juego en curso \(ID: \d+\)$"))).to_be_visible(timeout=10000)
+            await expect(page.get_by_role("button", name="Supervisar")).to_be_visible()
+            await expect(page.get_by_role("button", name="Terminar Juego")).to_be_visible()
+            await expect(start).to_have_count(0)
+        finally:
+            await asyncio.to_thread(finish_game, admin)
     finally:
         if context:
             await context.close()
@@ -93,4 +53,3 @@ async def run_test():
             await pw.stop()
 
 asyncio.run(run_test())
-    
\ No newline at end of file
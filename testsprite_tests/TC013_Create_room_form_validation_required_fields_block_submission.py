@@ -1,6 +1,11 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from browser_session import launch_browser, new_context
+from game_events import cookies_for, game_sessions, running_game, wait_for_game_state
+
+BASE_URL = "http://localhost:3000"
+
 
 async def run_test():
     pw = None
@@ -8,65 +13,38 @@ async def run_test():
     context = None
 
     try:
+        # The worker's admin and two of its candidates
+        admin, (player, other) = game_sessions(2)
+
         # Start a Playwright session in asynchronous mode
         pw = await async_api.async_playwright().start()
 
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
+        # Reuse the runner's browser when there is one
+        browser = await launch_browser(pw)
 
-        # Open a new page in the browser context
+        # Context logged in as the admin (no login form)
+        context = await new_context(browser, session_id=admin)
         page = await context.new_page()
 
-        # Interact with the page elements to simulate user flow
-        # -> Navigate to http://localhost:3000/login
-        await page.goto("http://localhost:3000/login", wait_until="commit", timeout=10000)
-        
-        # -> Type 'admin' into the username field ('Nombre de usuario') and 'changeme' into the password field, then submit the login form.
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin')
-        
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('changeme')
-        
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the 'Reload' button to retry loading the application so the test can continue.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[1]/div[1]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the 'Reload' button one more time to retry loading the application (final reload attempt). If the app still fails to load after this, stop and report the failure.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[1]/div[1]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('text=Crear Sala').first).to_be_visible(timeout=3000)
-        await expect(frame.locator('text=requerido').first).to_be_visible(timeout=3000)
-        await asyncio.sleep(5)
+        with running_game(admin, [player, other]):
+            await asyncio.to_thread(
+                wait_for_game_state, cookies_for(player), lambda s: s["phase"] == "question"
+            )
+
+            # -> Open the dashboard while a game is already running
+            await page.goto(f"{BASE_URL}/")
+
+            # --> Assertions: no way to start a second game from the UI
+            await expect(page.get_by_role("button", name="Terminar Juego")).to_be_visible(timeout=10000)
+            await expect(page.get_by_role("button", name="Iniciar Juego")).to_have_count(0)
+
+            # -> Try to start one anyway with the admin's session
+            response = await page.request.post(f"{BASE_URL}/api/game/start")
 
+            # --> Assertions: the server refuses it with a Spanish error
+            assert response.status == 409, f"expected 409, got {response.status}"
+            body = await response.json()
+            assert body.get("error") == "Ya hay un juego en curso", body
     finally:
         if context:
             await context.close()
@@ -76,4 +54,3 @@ async def run_test():
             await pw.stop()
 
 asyncio.run(run_test())
-    
\ No newline at end of file
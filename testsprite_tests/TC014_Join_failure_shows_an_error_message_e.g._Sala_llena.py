@@ -1,6 +1,11 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from browser_session import launch_browser, new_context, new_session
+from game_events import cookies_for, game_sessions, running_game, wait_for_game_state
+
+BASE_URL = "http://localhost:3000"
+
 
 async def run_test():
     pw = None
@@ -8,49 +13,39 @@ async def run_test():
     context = None
 
     try:
+        # The worker's admin and two of its candidates
+        admin, (player, other) = game_sessions(2)
+
         # Start a Playwright session in asynchronous mode
         pw = await async_api.async_playwright().start()
 
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-
-        # Open a new page in the browser context
-        page = await context.new_page()
-
-        # Interact with the page elements to simulate user flow
-        # -> Navigate to http://localhost:3000/login
-        await page.goto("http://localhost:3000/login", wait_until="commit", timeout=10000)
-        
-        # -> Click the 'Reload' button (index 74) to retry loading the login page, then wait 3 seconds and re-evaluate the page.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[1]/div[1]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the 'Reload' button (index 201) again to retry loading the login page, then wait 3 seconds and re-evaluate the page.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[1]/div[1]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('text=Sala llena').first).to_be_visible(timeout=3000)
-        assert '/' in frame.url
-        await asyncio.sleep(5)
+        # Reuse the runner's browser when there is one
+        browser = await launch_browser(pw)
+
+        with running_game(admin, [player, other]):
+            await asyncio.to_thread(
+                wait_for_game_state, cookies_for(player), lambda s: s["phase"] == "question"
+            )
+
+            # A candidate registered after the start is not part of the game
+            late = await asyncio.to_thread(new_session, "candidate")
+            context = await new_context(browser, session_id=late)
+            page = await context.new_page()
+
+            # -> The late candidate opens the home page
+            await page.goto(f"{BASE_URL}/")
+
+            # --> Assertions: spectator view, no answer buttons
+            await expect(page.get_by_text("ESPECTADOR")).to_be_visible(timeout=10000)
+            await expect(page.get_by_text("Selecciona tu respuesta")).to_have_count(0)
+
+            # -> Try to answer anyway
+            response = await page.request.post(f"{BASE_URL}/api/game/answer", data={"answerIndex": 0})
 
+            # --> Assertions: the server explains why joining failed
+            assert response.status == 403, f"expected 403, got {response.status}"
+            body = await response.json()
+            assert body.get("error") == "No eres participante de este juego", body
     finally:
         if context:
             await context.close()
@@ -60,4 +55,3 @@ async def run_test():
             await pw.stop()
 
 asyncio.run(run_test())
-    
\ No newline at end of file
@@ -1,6 +1,10 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from browser_session import launch_browser, new_context
+
+BASE_URL = "http://localhost:3000"
+
 
 async def run_test():
     pw = None
@@ -11,78 +15,30 @@ async def run_test():
         # Start a Playwright session in asynchronous mode
         pw = await async_api.async_playwright().start()
 
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
+        # Reuse the runner's browser when there is one
+        browser = await launch_browser(pw)
 
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
+        # Context logged in as admin with its own session, since this test logs out
+        context = await new_context(browser, role="admin", fresh=True)
 
         # Open a new page in the browser context
         page = await context.new_page()
 
-        # Interact with the page elements to simulate user flow
-        # -> Navigate to http://localhost:3000/login
-        await page.goto("http://localhost:3000/login", wait_until="commit", timeout=10000)
-        
-        # -> Type 'admin' into Nombre de usuario (index 95), type 'changeme' into Contraseña (index 100), then click 'Iniciar Sesión' (index 105).
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin')
-        
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('changeme')
-        
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the 'Reload' button (index 74) to attempt to recover the application so the logout verification can proceed.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[1]/div[1]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Type 'admin' into Nombre de usuario (index 86), type 'changeme' into Contraseña (index 90), then click 'Iniciar Sesión' (index 95) to perform the second login attempt.
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin')
-        
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('changeme')
-        
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the Reload button (index 75) to attempt to recover the application so the logout verification can proceed.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[2]/div[1]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        assert '/' in frame.url
-        assert '/login' in frame.url
-        await expect(frame.locator('text=Iniciar Sesión').first).to_be_visible(timeout=3000)
-        await asyncio.sleep(5)
+        # -> Open the home page while logged in
+        await page.goto(f"{BASE_URL}/")
+        logout = page.get_by_role("button", name="Cerrar sesión")
+        await expect(logout).to_be_visible(timeout=10000)
+
+        # -> Log out from the header
+        await logout.click()
+
+        # --> Assertions: back on the login page, and the session is gone
+        await page.wait_for_url("**/login")
+        await expect(page.get_by_role("button", name="Iniciar Sesión")).to_be_visible()
+
+        await page.goto(f"{BASE_URL}/")
+        await page.wait_for_url("**/login")
+        await expect(page.get_by_label("Nombre de usuario")).to_be_visible()
 
     finally:
         if context:
@@ -93,4 +49,3 @@ async def run_test():
             await pw.stop()
 
 asyncio.run(run_test())
-    
\ No newline at end of file
@@ -1,6 +1,11 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from browser_session import launch_browser, new_context
+from game_events import cookies_for, game_sessions, running_game, submit_answer, wait_for_game_state
+
+BASE_URL = "http://localhost:3000"
+
 
 async def run_test():
     pw = None
@@ -8,65 +13,43 @@ async def run_test():
     context = None
 
     try:
+        # The worker's admin and two of its candidates
+        admin, (player, other) = game_sessions(2)
+
         # Start a Playwright session in asynchronous mode
         pw = await async_api.async_playwright().start()
 
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
+        # Reuse the runner's browser when there is one
+        browser = await launch_browser(pw)
 
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-
-        # Open a new page in the browser context
+        # Context logged in as one of the players (no login form)
+        context = await new_context(browser, session_id=player)
         page = await context.new_page()
 
-        # Interact with the page elements to simulate user flow
-        # -> Navigate to http://localhost:3000/login
-        await page.goto("http://localhost:3000/login", wait_until="commit", timeout=10000)
-        
-        # -> Type 'admin' into the 'Nombre de usuario' field (input index 95) then fill password and submit the form.
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin')
-        
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('changeme')
-        
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the 'Reload' button (index 75) to attempt to load the application page again.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[2]/div[1]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the 'Reload' button (index 202) to attempt to load the application again and recover the UI so the progress display can be verified.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[1]/div[1]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('text=1/10').first).to_be_visible(timeout=3000)
-        await expect(frame.locator('text=2/10').first).to_be_visible(timeout=3000)
-        await asyncio.sleep(5)
-
+        await page.goto(f"{BASE_URL}/")
+        await expect(page.get_by_text("Esperando que el administrador inicie el juego")).to_be_visible(timeout=15000)
+
+        with running_game(admin, [player, other]):
+            # First question frame, straight from the state feed
+            state = await asyncio.to_thread(
+                wait_for_game_state, cookies_for(player), lambda s: s["phase"] == "question"
+            )
+            question = state["question"]
+            await expect(page.get_by_text(f"Pregunta 1 de {state['totalQuestions']}")).to_be_visible(timeout=10000)
+
+            assert state["totalQuestions"] >= 2, "Needs a game with at least two questions"
+
+            # -> Both players answer; the next question follows the summary
+            await page.get_by_role("button", name=question["answers"][0]).click()
+            await asyncio.to_thread(submit_answer, other, 0)
+            await asyncio.to_thread(
+                wait_for_game_state,
+                cookies_for(player),
+                lambda s: s["phase"] == "question" and s["currentQuestionIndex"] == 1,
+            )
+
+            # --> Assertions to verify the progress indicator moved on
+            await expect(page.get_by_text(f"Pregunta 2 de {state['totalQuestions']}")).to_be_visible(timeout=10000)
     finally:
         if context:
             await context.close()
@@ -76,4 +59,3 @@ async def run_test():
             await pw.stop()
 
 asyncio.run(run_test())
-    
\ No newline at end of file
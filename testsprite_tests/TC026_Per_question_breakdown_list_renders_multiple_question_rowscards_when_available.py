@@ -1,6 +1,11 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from browser_session import launch_browser, new_context
+from game_events import cookies_for, game_sessions, running_game, submit_answer, wait_for_game_state
+
+BASE_URL = "http://localhost:3000"
+
 
 async def run_test():
     pw = None
@@ -8,49 +13,41 @@ async def run_test():
     context = None
 
     try:
+        # The worker's admin and two of its candidates
+        admin, (player, other) = game_sessions(2)
+
+        # Play the first question (one answer) and let the admin end the game
+        with running_game(admin, [player, other]) as game_id:
+            await asyncio.to_thread(
+                wait_for_game_state, cookies_for(player), lambda s: s["phase"] == "question"
+            )
+            await asyncio.to_thread(submit_answer, player, 0)
+
         # Start a Playwright session in asynchronous mode
         pw = await async_api.async_playwright().start()
 
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-
-        # Open a new page in the browser context
-        page = await context.new_page()
+        # Reuse the runner's browser when there is one
+        browser = await launch_browser(pw)
 
-        # Interact with the page elements to simulate user flow
-        # -> Navigate to http://localhost:3000/login
-        await page.goto("http://localhost:3000/login", wait_until="commit", timeout=10000)
-        
-        # -> Click the visible 'Reload' button to retry loading the site and then re-check whether the login form appears.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[1]/div[1]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the visible 'Reload' button to retry loading the site, then wait a few seconds and re-check whether the login form appears.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[1]/div[1]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        assert '/' in frame.url
-        await expect(frame.locator('text=Desglose por pregunta').first).to_be_visible(timeout=3000)
-        await asyncio.sleep(5)
+        # Context logged in as the player who answered (no login form)
+        context = await new_context(browser, session_id=player)
+        page = await context.new_page()
 
+        # The results as the API returns them, to compare against the page
+        response = await page.request.get(f"{BASE_URL}/api/game/{game_id}/results")
+        assert response.ok, f"results API answered {response.status}"
+        results = await response.json()
+
+        # -> Open the results page
+        await page.goto(f"{BASE_URL}/results/{game_id}")
+        await expect(page.get_by_role("heading", name="Desglose de Preguntas")).to_be_visible(timeout=10000)
+
+        # --> Assertions: one row per question of the game, in order
+        questions = results["questions"]
+        assert len(questions) > 1, f"expected several questions, got {len(questions)}"
+        await expect(page.get_by_text("Correcta:")).to_have_count(len(questions))
+        for question in questions:
+            await expect(page.get_by_text(f"Q{question['index'] + 1}.", exact=True)).to_be_visible()
     finally:
         if context:
             await context.close()
@@ -60,4 +57,3 @@ async def run_test():
             await pw.stop()
 
 asyncio.run(run_test())
-    
\ No newline at end of file
@@ -1,6 +1,11 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from browser_session import launch_browser, new_context
+from game_events import cookies_for, game_sessions, running_game, wait_for_game_state
+
+BASE_URL = "http://localhost:3000"
+
 
 async def run_test():
     pw = None
@@ -8,50 +13,35 @@ async def run_test():
     context = None
 
     try:
+        # The worker's admin and two of its candidates
+        admin, (player, other) = game_sessions(2)
+
         # Start a Playwright session in asynchronous mode
         pw = await async_api.async_playwright().start()
 
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
+        # Reuse the runner's browser when there is one
+        browser = await launch_browser(pw)
 
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-
-        # Open a new page in the browser context
+        # Context logged in as the admin (no login form)
+        context = await new_context(browser, session_id=admin)
         page = await context.new_page()
 
-        # Interact with the page elements to simulate user flow
-        # -> Navigate to http://localhost:3000/login
-        await page.goto("http://localhost:3000/login", wait_until="commit", timeout=10000)
-        
-        # -> Click the Reload button (index 74) to retry loading the login page.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[1]/div[1]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the 'Reload' button (index 202) to retry loading the login page.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[1]/div[1]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        assert '/' in frame.url
-        await expect(frame.locator('text=Crear sala').first).to_be_visible(timeout=3000)
-        await expect(frame.locator('text=Supervisar').first).to_be_visible(timeout=3000)
-        await asyncio.sleep(5)
-
+        with running_game(admin, [player, other]):
+            await asyncio.to_thread(
+                wait_for_game_state, cookies_for(player), lambda s: s["phase"] == "question"
+            )
+
+            # -> Go from the dashboard to the supervision view
+            await page.goto(f"{BASE_URL}/")
+            await page.get_by_role("button", name="Supervisar").click(timeout=10000)
+            await page.wait_for_url(f"{BASE_URL}/supervise")
+
+            # --> Assertions: the supervision sections are shown
+            await expect(page.get_by_text("SUPERVISANDO")).to_be_visible(timeout=10000)
+            await expect(page.get_by_text("Solo lectura")).to_be_visible()
+            await expect(page.get_by_role("heading", name="Juego en Curso")).to_be_visible()
+            await expect(page.get_by_role("heading", name="Clasificación")).to_be_visible()
+            await expect(page.get_by_role("button", name="Salir")).to_be_visible()
     finally:
         if context:
             await context.close()
@@ -61,4 +51,3 @@ async def run_test():
             await pw.stop()
 
 asyncio.run(run_test())
-    
\ No newline at end of file
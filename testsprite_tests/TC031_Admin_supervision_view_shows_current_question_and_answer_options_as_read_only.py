@@ -1,6 +1,12 @@
 import asyncio
+import re
 from playwright import async_api
 from playwright.async_api import expect
+from browser_session import launch_browser, new_context
+from game_events import cookies_for, game_sessions, running_game, wait_for_game_state
+
+BASE_URL = "http://localhost:3000"
+
 
 async def run_test():
     pw = None
@@ -8,43 +14,36 @@ async def run_test():
     context = None
 
     try:
+        # The worker's admin and two of its candidates
+        admin, (player, other) = game_sessions(2)
+
         # Start a Playwright session in asynchronous mode
         pw = await async_api.async_playwright().start()
 
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-
-        # Open a new page in the browser context
-        page = await context.new_page()
+        # Reuse the runner's browser when there is one
+        browser = await launch_browser(pw)
 
-        # Interact with the page elements to simulate user flow
-        # -> Navigate to http://localhost:3000/login
-        await page.goto("http://localhost:3000/login", wait_until="commit", timeout=10000)
-        
-        # -> Click the Reload button to retry loading the site and then re-check the login page elements.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[1]/div[1]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('text=Pregunta').first).to_be_visible(timeout=3000)
-        await expect(frame.locator('xpath=//ul[contains(@class, "answer") or contains(@class, "options")]').first).to_be_visible(timeout=3000)
-        await asyncio.sleep(5)
+        # Context logged in as the admin (no login form)
+        context = await new_context(browser, session_id=admin)
+        page = await context.new_page()
 
+        with running_game(admin, [player, other]):
+            # First question frame, straight from the state feed
+            state = await asyncio.to_thread(
+                wait_for_game_state, cookies_for(player), lambda s: s["phase"] == "question"
+            )
+
+            # -> Open the supervision view while the question is live
+            await page.goto(f"{BASE_URL}/supervise")
+            await expect(page.get_by_text("Solo lectura")).to_be_visible(timeout=10000)
+
+            # --> Assertions: question and answers shown, none of them clickable
+            question = state["question"]
+            await expect(page.get_by_text(question["text"])).to_be_visible()
+            for answer in question["answers"]:
+                await expect(page.get_by_text(answer).first).to_be_visible()
+                await expect(page.get_by_role("button", name=answer)).to_have_count(0)
+            await expect(page.get_by_text(re.compile(r"\d+/\d+ jugadores respondieron"))).to_be_visible()
     finally:
         if context:
             await context.close()
@@ -54,4 +53,3 @@ async def run_test():
             await pw.stop()
 
 asyncio.run(run_test())
-    
\ No newline at end of file
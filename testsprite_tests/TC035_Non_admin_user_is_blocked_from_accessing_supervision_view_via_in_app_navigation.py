@@ -1,6 +1,10 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from browser_session import launch_browser, new_context
+
+BASE_URL = "http://localhost:3000"
+
 
 async def run_test():
     pw = None
@@ -11,131 +15,30 @@ async def run_test():
         # Start a Playwright session in asynchronous mode
         pw = await async_api.async_playwright().start()
 
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
+        # Reuse the runner's browser when there is one
+        browser = await launch_browser(pw)
 
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
+        # Context already logged in as a candidate (no login form)
+        context = await new_context(browser, role="candidate")
 
         # Open a new page in the browser context
         page = await context.new_page()
 
-        # Interact with the page elements to simulate user flow
-        # -> Navigate to http://localhost:3000/login
-        await page.goto("http://localhost:3000/login", wait_until="commit", timeout=10000)
-        
-        # -> Fill the login form with the provided non-admin credentials and submit: input 'nonadmin_user@example.com' into Nombre de usuario (index 95), input 'wrong-or-nonadmin-password' into Contraseña (index 100), then click Iniciar Sesión (index 105).
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('nonadmin_user@example.com')
-        
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('wrong-or-nonadmin-password')
-        
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the Reload button (index 75) to try to recover the application and continue the verification steps.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[2]/div[1]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the Reload button (index 202) to attempt to recover the application, then wait a few seconds and re-check the page.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[1]/div[1]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Open the registration page by clicking 'Registrarse' so a non-admin user can be created.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/p/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Fill the registration form fields (username, email, password) and scroll down to reveal the 'Registrarse' submit button so it can be clicked next.
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('testuser_nonadmin_836')
-        
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('testuser_nonadmin_836@example.com')
-        
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[3]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('password123')
-        
-        # -> Click the 'Registrarse' submit button (index 289) to create the non-admin account.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Fill the 'Confirmar contraseña' field with the same password and submit the registration form to create the non-admin account (fill index 284 with 'password123' then click the 'Registrarse' button index 289).
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[4]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('password123')
-        
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the 'Iniciar sesión' link to go to the login page so the new non-admin can be logged in (click element index 291).
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/p/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Navigate to the login page (/login) to sign in as testuser_nonadmin_836@example.com and then verify access to the supervise page
-        await page.goto("http://localhost:3000/login", wait_until="commit", timeout=10000)
-        
-        # -> Fill the login form with the non-admin credentials and submit to attempt login (then the test will try to access /supervise).
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('testuser_nonadmin_836')
-        
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('password123')
-        
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Open the registration page to attempt creating/confirming a non-admin account so it can be used to log in (click 'Registrarse' link).
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/p/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        assert '/login' in frame.url
-        await expect(frame.locator('text=Credenciales inválidas').first).to_be_visible(timeout=3000)
-        await asyncio.sleep(5)
+        # -> Open the home page as a non-admin
+        await page.goto(f"{BASE_URL}/")
+        await expect(page.get_by_role("button", name="Cerrar sesión")).to_be_visible(timeout=10000)
+
+        # --> Assertions: no way into supervision from the app
+        await expect(page.get_by_role("button", name="Supervisar")).to_have_count(0)
+        await expect(page.get_by_role("button", name="Iniciar Juego")).to_have_count(0)
+
+        # -> Try the supervision page directly
+        await page.goto(f"{BASE_URL}/supervise")
+
+        # --> Assertions: sent back home, still logged in
+        await page.wait_for_url(f"{BASE_URL}/")
+        await expect(page.get_by_role("button", name="Cerrar sesión")).to_be_visible()
+        await expect(page.get_by_role("button", name="Supervisar")).to_have_count(0)
 
     finally:
         if context:
@@ -146,4 +49,3 @@ async def run_test():
             await pw.stop()
 
 asyncio.run(run_test())
-    
\ No newline at end of file
@@ -1,6 +1,10 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from browser_session import launch_browser, new_context
+
+BASE_URL = "http://localhost:3000"
+
 
 async def run_test():
     pw = None
@@ -11,94 +15,30 @@ async def run_test():
         # Start a Playwright session in asynchronous mode
         pw = await async_api.async_playwright().start()
 
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
+        # Reuse the runner's browser when there is one
+        browser = await launch_browser(pw)
 
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
+        # Context already logged in as a candidate (no login form)
+        context = await new_context(browser, role="candidate")
 
         # Open a new page in the browser context
         page = await context.new_page()
 
-        # Interact with the page elements to simulate user flow
-        # -> Navigate to http://localhost:3000/login
-        await page.goto("http://localhost:3000/login", wait_until="commit", timeout=10000)
-        
-        # -> Click the 'Registrarse' link to create a non-admin user account
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/p/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Fill the registration form to create a non-admin user: enter 'Nombre de usuario', 'Correo electrónico', 'Contraseña', 'Confirmar contraseña' and submit by clicking 'Registrarse'. The immediate next actions will input the visible fields and scroll to reveal the remaining fields/buttons.
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div/div/form/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('nonadmin_427')
-        
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div/div/form/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('nonadmin_427@example.com')
-        
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div/div/form/div[3]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('password123')
-        
-        # -> Fill the 'Confirmar contraseña' field with the same password ('password123') and click the 'Registrarse' button to submit the registration form.
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[4]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('password123')
-        
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the 'Iniciar sesión' link on the registration page to go to the login page so the non-admin user can sign in (use element index 547).
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/p/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the 'Iniciar sesión' link (index=547) again to open the login page. If clicking does not navigate, then re-evaluate the page state.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/p/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Log in as nonadmin_427 by entering username and password into the login form and clicking 'Iniciar Sesión' (submit). Then observe whether login succeeds and the app presents the room list so the test can continue to click the first room and 'Supervisar'.
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('nonadmin_427')
-        
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('password123')
-        
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=/html/body/div[4]/main/div[1]/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('xpath=//*[contains(text(), "Solo administradores")]').first).to_be_visible(timeout=3000)
-        await expect(frame.locator('text=Acceso denegado').first).not_to_be_visible(timeout=3000)
-        await asyncio.sleep(5)
+        # -> Open the supervision page directly as a non-admin
+        await page.goto(f"{BASE_URL}/supervise")
+
+        # --> Assertions: access denied by sending the user home, still logged in
+        await page.wait_for_url(f"{BASE_URL}/")
+        await expect(page.get_by_role("button", name="Cerrar sesión")).to_be_visible(timeout=10000)
+        await expect(page.get_by_role("button", name="Supervisar")).to_have_count(0)
+
+        # -> Ask the admin-only supervision API with the same session
+        response = await page.request.get(f"{BASE_URL}/api/game/online-players")
+
+        # --> Assertions: the API explains why access was denied
+        assert response.status == 403, f"expected 403, got {response.status}"
+        body = await response.json()
+        assert body.get("error") == "Se requiere acceso de administrador", body
 
     finally:
         if context:
@@ -109,4 +49,3 @@ async def run_test():
             await pw.stop()
 
 asyncio.run(run_test())
-    
\ No newline at end of file
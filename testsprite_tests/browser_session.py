@@ -0,0 +1,172 @@
+"""
+Shared browser and pre-authenticated contexts for the Playwright tests.
+
+Logging in through the form costs every browser test several seconds and
+depends on brittle XPaths. Instead, admin and candidate sessions are
+created once through the API and saved as Playwright storage state under
+`.auth/`. Each test then opens a context that already carries the
+`auth_session` cookie:
+
+    browser = await launch_browser(pw)
+    context = await new_context(browser, role="admin")
+
+Saved states are reused across runs while the session is still valid. When
+run_tests.py sets TEST_CDP_ENDPOINT, tests connect to the runner's Chromium
+instead of starting their own. Closing the connection leaves that browser
+running.
+
+Admin credentials come from ADMIN_USERNAME / ADMIN_PASSWORD (the seeded
+admin). The candidate is registered through the API on first use. When the
+runner provisions users, TEST_ADMIN_SESSION / TEST_USER_SESSIONS are used
+as-is.
+"""
+
+import json
+import os
+import random
+import string
+from pathlib import Path
+from urllib.parse import urlparse
+
+import requests
+
+BASE_URL = os.environ.get("BASE_URL", "http://localhost:3000")
+AUTH_DIR = Path(__file__).resolve().parent / ".auth"
+SESSION_COOKIE_NAME = "auth_session"
+TIMEOUT = 30
+ROLES = ("admin", "candidate")
+
+SHARED_LAUNCH_ARGS = [
+    "--window-size=1280,720",         # Set the browser window size
+    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+    "--ipc=host",                     # Use host-level IPC for better stability
+]
+# A browser of its own only ever hosts one test
+LAUNCH_ARGS = SHARED_LAUNCH_ARGS + ["--single-process"]
+
+
+def session_is_valid(session_id):
+    resp = requests.get(
+        f"{BASE_URL}/api/auth/session",
+        cookies={SESSION_COOKIE_NAME: session_id},
+        timeout=TIMEOUT,
+    )
+    return resp.status_code == 200 and resp.json().get("user") is not None
+
+
+def login(username, password):
+    resp = requests.post(
+        f"{BASE_URL}/api/auth/login",
+        json={"username": username, "password": password},
+        timeout=TIMEOUT,
+    )
+    assert resp.status_code == 200, f"Login as '{username}' failed: {resp.status_code} {resp.text}"
+    return resp.cookies[SESSION_COOKIE_NAME]
+
+
+def register_candidate():
+    username = "pw_" + "".join(random.choices(string.ascii_lowercase + string.digits, k=8))
+    password = "Password123!"
+    resp = requests.post(
+        f"{BASE_URL}/api/auth/register",
+        json={
+            "username": username,
+            "email": f"{username}@example.com",
+            "password": password,
+            "confirmPassword": password,
+        },
+        timeout=TIMEOUT,
+    )
+    assert resp.status_code == 201, f"Registering '{username}' failed: {resp.status_code} {resp.text}"
+    user = resp.json()["user"]
+    assert user["role"] == "candidate", "Registered the first user: seed the admin before running browser tests"
+    return resp.cookies[SESSION_COOKIE_NAME]
+
+
+def new_session(role):
+    """A brand-new session for `role` (not shared with other tests)."""
+    if role == "admin":
+        return login(os.environ.get("ADMIN_USERNAME", "admin"), os.environ.get("ADMIN_PASSWORD", "changeme"))
+    return register_candidate()
+
+
+def provided_session(role):
+    if role == "admin":
+        return os.environ.get("TEST_ADMIN_SESSION")
+    sessions = os.environ.get("TEST_USER_SESSIONS")
+    return sessions.split(",")[0] if sessions else None
+
+
+def storage_state(session_id):
+    return {
+        "cookies": [{
+            "name": SESSION_COOKIE_NAME,
+            "value": session_id,
+            "domain": urlparse(BASE_URL).hostname,
+            "path": "/",
+            "expires": -1,
+            "httpOnly": True,
+            "secure": False,
+            "sameSite": "Lax",
+        }],
+        "origins": [],
+    }
+
+
+def load_storage_state(role):
+    """
+    Storage state for `role`: the runner's provisioned session if there is
+    one, else the file under .auth/, (re)creating its session if needed.
+    """
+    assert role in ROLES, f"Unknown role '{role}'"
+    session_id = provided_session(role)
+    if session_id is not None:
+        return storage_state(session_id)
+
+    path = AUTH_DIR / f"{role}.json"
+    if path.exists():
+        saved = json.loads(path.read_text())["cookies"][0]["value"]
+        if session_is_valid(saved):
+            return str(path)
+
+    AUTH_DIR.mkdir(exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(storage_state(new_session(role)), indent=2))
+    tmp.replace(path)  # Atomic, so concurrent tests never read half a file
+    return str(path)
+
+
+def bootstrap_storage_states():
+    """Create or refresh every role's saved state once, before tests start in parallel."""
+    for role in ROLES:
+        load_storage_state(role)
+
+
+async def launch_shared_browser(pw, port):
+    """The runner's browser: tests attach to it at http://127.0.0.1:<port>."""
+    return await pw.chromium.launch(headless=True, args=SHARED_LAUNCH_ARGS + [f"--remote-debugging-port={port}"])
+
+
+async def launch_browser(pw):
+    endpoint = os.environ.get("TEST_CDP_ENDPOINT")
+    if endpoint:
+        return await pw.chromium.connect_over_cdp(endpoint)
+    return await pw.chromium.launch(headless=True, args=LAUNCH_ARGS)
+
+
+async def new_context(browser, role=None, fresh=False, session_id=None):
+    """
+    A context logged in as `role` (None = logged out), or with the given
+    `session_id`. Pass fresh=True for tests that end the session (e.g.
+    logout), so the shared one survives.
+    """
+    if session_id is not None:
+        context = await browser.new_context(storage_state=storage_state(session_id))
+    elif role is None:
+        context = await browser.new_context()
+    elif fresh:
+        context = await browser.new_context(storage_state=storage_state(new_session(role)))
+    else:
+        context = await browser.new_context(storage_state=load_storage_state(role))
+    context.set_default_timeout(5000)
+    return context
@@ -0,0 +1,114 @@
+"""
+Game helpers for the Python tests: start a game with known players and wait
+on the game state feed instead of sleeping.
+
+    from game_events import game_sessions, running_game, wait_for_game_state
+
+    admin, players = game_sessions(2)
+    with running_game(admin, players):
+        state = wait_for_game_state(cookies_for(players[0]), lambda s: s["phase"] == "question")
+
+The waits follow /api/game/stream (the same SSE feed the client uses) and
+return as soon as a frame matches. There is only one active game at a time,
+so run_tests.py runs scripts that use running_game() one after another.
+
+Players are the worker's provisioned candidates (TEST_USER_SESSIONS) and the
+admin its TEST_ADMIN_SESSION. Without provisioning, new candidates are
+registered and the seeded admin logs in (browser_session.new_session).
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+
+import requests
+
+from browser_session import SESSION_COOKIE_NAME, new_session
+
+BASE_URL = os.environ.get("BASE_URL", "http://localhost:3000")
+DEFAULT_TIMEOUT_SECONDS = 60
+TIMEOUT = 30
+
+
+def cookies_for(session_id):
+    return {SESSION_COOKIE_NAME: session_id}
+
+
+def game_sessions(players=2):
+    """(admin session, [player sessions]) for a game test."""
+    admin = os.environ.get("TEST_ADMIN_SESSION") or new_session("admin")
+    provided = [s for s in os.environ.get("TEST_USER_SESSIONS", "").split(",") if s]
+    if len(provided) >= players:
+        return admin, provided[:players]
+    return admin, [new_session("candidate") for _ in range(players)]
+
+
+def mark_online(session_id):
+    resp = requests.post(f"{BASE_URL}/api/game/heartbeat", cookies=cookies_for(session_id), timeout=TIMEOUT)
+    resp.raise_for_status()
+
+
+def submit_answer(session_id, answer_index):
+    resp = requests.post(
+        f"{BASE_URL}/api/game/answer",
+        json={"answerIndex": answer_index},
+        cookies=cookies_for(session_id),
+        timeout=TIMEOUT,
+    )
+    assert resp.status_code == 200, f"Answer failed: {resp.status_code} {resp.text}"
+    return resp.json()
+
+
+def finish_game(admin_session):
+    resp = requests.post(f"{BASE_URL}/api/game/finish", cookies=cookies_for(admin_session), timeout=TIMEOUT)
+    assert resp.status_code in (200, 404), f"Finishing the game failed: {resp.status_code} {resp.text}"
+
+
+@contextmanager
+def running_game(admin_session, player_sessions):
+    """
+    Mark the players online, start a game as the admin and yield its id.
+    The game is finished on exit. Other candidates online at the time join
+    it too, which only makes phases wait for their time limit.
+    """
+    for session_id in player_sessions:
+        mark_online(session_id)
+    resp = requests.post(f"{BASE_URL}/api/game/start", cookies=cookies_for(admin_session), timeout=TIMEOUT)
+    assert resp.status_code == 201, f"Could not start a game: {resp.status_code} {resp.text}"
+    try:
+        yield resp.json()["gameId"]
+    finally:
+        finish_game(admin_session)
+
+
+def iter_game_states(cookies, timeout=DEFAULT_TIMEOUT_SECONDS):
+    """Yield each `state` frame's data (plain JSON encoding) until `timeout` elapses."""
+    deadline = time.monotonic() + timeout
+    with requests.get(
+        f"{BASE_URL}/api/game/stream",
+        cookies=cookies,
+        stream=True,
+        timeout=(10, timeout),
+    ) as response:
+        response.raise_for_status()
+        for line in response.iter_lines(decode_unicode=True):
+            if time.monotonic() > deadline:
+                return
+            if not line or not line.startswith("data: "):
+                continue
+            message = json.loads(line[len("data: "):])
+            if message["type"] == "error":
+                raise RuntimeError(f"Game stream error: {message['error']}")
+            if message["type"] == "state":
+                yield message["data"]
+
+
+def wait_for_game_state(cookies, predicate, timeout=DEFAULT_TIMEOUT_SECONDS):
+    """First state frame for which `predicate(state)` is true. Raises TimeoutError otherwise."""
+    last = None
+    for state in iter_game_states(cookies, timeout):
+        last = state
+        if predicate(state):
+            return state
+    raise TimeoutError(f"No matching game state within {timeout}s (last phase: {last and last.get('phase')})")
@@ -0,0 +1,144 @@
+"""
+Bulk user provisioning for the Python tests.
+
+Registering through /api/auth/register costs an argon2 hash and several
+lookups per user. Tests that only need *some* logged-in candidates can
+instead insert users and sessions straight into Postgres:
+
+    from provisioning import provisioned_users
+
+    with provisioned_users(200) as users:
+        for user in users:
+            requests.get(f"{BASE_URL}/api/auth/session", cookies=user.cookies)
+
+Every user shares one password (hashed once per process, so they can also
+log in through the form) and gets a ready-made `auth_session` cookie.
+Provisioned users are named `<prefix>_<n>` and deleted on exit, along with
+their sessions, game participations and answers.
+
+Requires `psycopg` (v3) and, unless `password=None`, `argon2-cffi`. The
+connection string comes from `TEST_DATABASE_URL` or `DATABASE_URL`.
+Use a development database only.
+"""
+
+import os
+import secrets
+import string
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import psycopg
+
+SESSION_COOKIE_NAME = "auth_session"
+SESSION_DURATION_DAYS = 30
+DEFAULT_PASSWORD = "Password123!"
+# Matches hashOptions in lib/auth/password.ts
+ARGON2_OPTIONS = {"memory_cost": 19456, "time_cost": 2, "hash_len": 32, "parallelism": 1}
+# Not an argon2 hash: users provisioned with password=None cannot log in
+UNUSABLE_PASSWORD_HASH = "!"
+SESSION_ID_ALPHABET = string.ascii_letters + string.digits + "_-"  # nanoid's alphabet
+
+
+@dataclass
+class ProvisionedUser:
+    id: int
+    username: str
+    email: str
+    password: str | None
+    session_id: str
+    cookies: dict = field(repr=False, default_factory=dict)
+
+
+def database_url():
+    url = os.environ.get("TEST_DATABASE_URL") or os.environ.get("DATABASE_URL")
+    if not url:
+        raise RuntimeError("Set TEST_DATABASE_URL or DATABASE_URL to provision test users")
+    return url
+
+
+@lru_cache(maxsize=None)
+def password_hash(password):
+    """argon2id hash of `password`, computed once per process."""
+    from argon2 import PasswordHasher
+
+    return PasswordHasher(**ARGON2_OPTIONS).hash(password)
+
+
+def random_prefix():
+    return "tp_" + "".join(secrets.choice(string.ascii_lowercase + string.digits) for _ in range(8))
+
+
+def new_session_id():
+    return "".join(secrets.choice(SESSION_ID_ALPHABET) for _ in range(40))
+
+
+def provision_users(conn, count, prefix=None, password=DEFAULT_PASSWORD, role="candidate"):
+    """
+    Insert `count` users and one session each, in two statements.
+    Returns ProvisionedUser objects in order (`<prefix>_1` first).
+    """
+    prefix = prefix or random_prefix()
+    usernames = [f"{prefix}_{n}" for n in range(1, count + 1)]
+    emails = [f"{username}@example.com" for username in usernames]
+    hashed = password_hash(password) if password is not None else UNUSABLE_PASSWORD_HASH
+
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO users (username, email, password_hash, role)
+            SELECT u.username, u.email, %(hash)s, %(role)s
+            FROM unnest(%(usernames)s::text[], %(emails)s::text[]) AS u(username, email)
+            RETURNING id, username
+            """,
+            {"hash": hashed, "role": role, "usernames": usernames, "emails": emails},
+        )
+        ids = {username: user_id for user_id, username in cur.fetchall()}
+
+        user_ids = [ids[username] for username in usernames]
+        session_ids = [new_session_id() for _ in usernames]
+        cur.execute(
+            """
+            INSERT INTO sessions (id, user_id, expires_at)
+            SELECT s.id, s.user_id, now() + make_interval(days => %(days)s)
+            FROM unnest(%(ids)s::text[], %(user_ids)s::int[]) AS s(id, user_id)
+            """,
+            {"days": SESSION_DURATION_DAYS, "ids": session_ids, "user_ids": user_ids},
+        )
+    conn.commit()
+
+    return [
+        ProvisionedUser(
+            id=user_id,
+            username=username,
+            email=email,
+            password=password,
+            session_id=session_id,
+            cookies={SESSION_COOKIE_NAME: session_id},
+        )
+        for user_id, username, email, session_id in zip(user_ids, usernames, emails, session_ids)
+    ]
+
+
+def delete_provisioned_users(conn, prefix):
+    """Delete the users named `<prefix>_<n>`. Returns the count deleted."""
+    with conn.cursor() as cur:
+        cur.execute(
+            "DELETE FROM users WHERE username LIKE %s",
+            (prefix.replace("_", r"\_") + r"\_%",),
+        )
+        deleted = cur.rowcount
+    conn.commit()
+    return deleted
+
+
+@contextmanager
+def provisioned_users(count, prefix=None, password=DEFAULT_PASSWORD, role="candidate"):
+    """Provision `count` users for the duration of the block, then delete them."""
+    prefix = prefix or random_prefix()
+    with psycopg.connect(database_url()) as conn:
+        try:
+            yield provision_users(conn, count, prefix=prefix, password=password, role=role)
+        finally:
+            conn.rollback()
+            delete_provisioned_users(conn, prefix)
@@ -0,0 +1,238 @@
+"""
+Parallel runner for the testsprite scripts.
+
+Each TC*.py runs its test at import time, so every script gets its own
+Python process. API scripts run up to --jobs at a time. Playwright (UI)
+scripts start a browser each, so they run up to --ui-jobs at a time.
+
+    python testsprite_tests/run_tests.py                  # API + UI
+    python testsprite_tests/run_tests.py --api -k auth    # API scripts matching "auth"
+    python testsprite_tests/run_tests.py --provision      # per-worker users (needs DATABASE_URL)
+
+Every script runs on a worker slot. The slot is passed in TEST_WORKER_ID,
+and TEST_RUN_PREFIX is unique to that slot and run. With --provision, each
+slot also owns one admin and --users-per-worker candidates, created through
+provisioning.py. Their cookies are passed in TEST_ADMIN_SESSION and
+TEST_USER_SESSIONS (comma-separated). No two scripts share a slot's users
+at the same time. The browser scripts and the game-flow scripts
+(game_events.py) use them; the auth API scripts register their own users.
+
+The server has a single active game, so scripts that start one
+(`running_game`, or the dashboard button followed by `finish_game`) never
+run concurrently, whichever pool they are in.
+
+Before the Playwright scripts start, the runner saves logged-in storage
+states once (browser_session.py). It also launches one Chromium that every
+script attaches to over CDP (TEST_CDP_ENDPOINT), unless --no-shared-browser.
+
+Prints each script's wall time and exits 1 if any script failed.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import time
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+TESTS_DIR = Path(__file__).resolve().parent
+DEFAULT_TIMEOUT_SECONDS = 120
+DEFAULT_CDP_PORT = 9333
+OUTPUT_TAIL_LINES = 20
+# Helpers that mark a script as starting a game (see game_turn)
+GAME_MARKERS = ("running_game", "finish_game")
+
+
+@dataclass
+class TestResult:
+    name: str
+    kind: str  # 'api' | 'ui'
+    passed: bool
+    seconds: float
+    worker: int
+    output: str
+
+
+def discover(pattern=None, kinds=("api", "ui")):
+    """(path, kind, needs_game) for every matching script."""
+    scripts = []
+    for path in sorted(TESTS_DIR.glob("TC*.py")):
+        source = path.read_text(encoding="utf-8")
+        kind = "ui" if "playwright" in source else "api"
+        if kind in kinds and (pattern is None or re.search(pattern, path.stem, re.IGNORECASE)):
+            scripts.append((path, kind, any(marker in source for marker in GAME_MARKERS)))
+    return scripts
+
+
+@asynccontextmanager
+async def game_turn(needs_game, game_lock):
+    if not needs_game:
+        yield
+        return
+    async with game_lock:
+        yield
+
+
+async def run_script(path, kind, needs_game, slots, game_lock, base_env, timeout):
+    # Wait for the game before taking a slot, so waiting doesn't hold one
+    async with game_turn(needs_game, game_lock):
+        return await run_in_slot(path, kind, slots, base_env, timeout)
+
+
+async def run_in_slot(path, kind, slots, base_env, timeout):
+    worker, worker_env = await slots.get()
+    env = {**base_env, **worker_env}
+    started = time.perf_counter()
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, str(path),
+            cwd=TESTS_DIR,
+            env=env,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+            passed = proc.returncode == 0
+            output = stdout.decode(errors="replace")
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            passed = False
+            output = f"Timed out after {timeout}s"
+    finally:
+        slots.put_nowait((worker, worker_env))
+
+    result = TestResult(path.stem, kind, passed, time.perf_counter() - started, worker, output)
+    print(f"  {'PASS' if passed else 'FAIL'}  {result.seconds:6.2f}s  [{kind}] {result.name}", flush=True)
+    return result
+
+
+def worker_envs(count, prefix, conn, users_per_worker):
+    envs = []
+    for worker in range(count):
+        worker_prefix = f"{prefix}_w{worker}"
+        env = {"TEST_WORKER_ID": str(worker), "TEST_RUN_PREFIX": worker_prefix}
+        if conn is not None:
+            from provisioning import provision_users
+
+            [admin] = provision_users(conn, 1, prefix=f"{worker_prefix}a", role="admin")
+            users = provision_users(conn, users_per_worker, prefix=f"{worker_prefix}c")
+            env["TEST_ADMIN_SESSION"] = admin.session_id
+            env["TEST_USER_SESSIONS"] = ",".join(user.session_id for user in users)
+        envs.append((worker, env))
+    return envs
+
+
+@contextmanager
+def provisioning_connection(enabled, prefix):
+    """One connection for the whole run; everything under `prefix` is deleted at the end."""
+    if not enabled:
+        yield None
+        return
+
+    import psycopg
+    from provisioning import database_url, delete_provisioned_users
+
+    with psycopg.connect(database_url()) as conn:
+        try:
+            yield conn
+        finally:
+            conn.rollback()
+            delete_provisioned_users(conn, prefix)
+
+
+async def run_pool(scripts, envs, game_lock, base_env, timeout):
+    slots = asyncio.Queue()
+    for slot in envs:
+        slots.put_nowait(slot)
+    return await asyncio.gather(*(
+        run_script(path, kind, needs_game, slots, game_lock, base_env, timeout)
+        for path, kind, needs_game in scripts
+    ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the testsprite scripts in parallel")
+    parser.add_argument("-k", dest="pattern", help="only scripts whose name matches this regex")
+    parser.add_argument("--api", action="store_true", help="API scripts only")
+    parser.add_argument("--ui", action="store_true", help="Playwright scripts only")
+    parser.add_argument("--jobs", type=int, default=8, help="concurrent API scripts (default 8)")
+    parser.add_argument("--ui-jobs", type=int, default=4, help="concurrent Playwright scripts (default 4)")
+    parser.add_argument("--timeout", type=int, default=DEFAULT_TIMEOUT_SECONDS, help="per-script timeout in seconds")
+    parser.add_argument("--provision", action="store_true", help="provision users per worker slot in the database")
+    parser.add_argument("--users-per-worker", type=int, default=4)
+    parser.add_argument("--no-shared-browser", action="store_true", help="let each Playwright script launch its own browser")
+    parser.add_argument("--cdp-port", type=int, default=DEFAULT_CDP_PORT, help="debugging port of the shared browser")
+    parser.add_argument("--json", dest="json_path", help="also write the results to this file")
+    args = parser.parse_args()
+
+    kinds = ("api",) if args.api else ("ui",) if args.ui else ("api", "ui")
+    scripts = discover(args.pattern, kinds)
+    if not scripts:
+        print("No scripts matched")
+        return 1
+
+    prefix = f"tp{int(time.time()) % 100000:05d}"
+    base_env = {**os.environ, "PYTHONUNBUFFERED": "1"}
+    api = [s for s in scripts if s[1] == "api"]
+    ui = [s for s in scripts if s[1] == "ui"]
+    print(f"Running {len(api)} API and {len(ui)} UI script(s)")
+
+    started = time.perf_counter()
+    with provisioning_connection(args.provision, prefix) as conn:
+        api_envs = worker_envs(args.jobs, f"{prefix}_api", conn, args.users_per_worker)
+        ui_envs = worker_envs(args.ui_jobs, f"{prefix}_ui", conn, args.users_per_worker)
+        game_lock = asyncio.Lock()  # Shared by both pools
+
+        async def run_ui():
+            if not ui:
+                return []
+            from browser_session import bootstrap_storage_states, launch_shared_browser
+
+            if not args.provision:
+                bootstrap_storage_states()
+            if args.no_shared_browser:
+                return await run_pool(ui, ui_envs, game_lock, base_env, args.timeout)
+
+            from playwright.async_api import async_playwright
+
+            async with async_playwright() as pw:
+                browser = await launch_shared_browser(pw, args.cdp_port)
+                try:
+                    ui_env = {**base_env, "TEST_CDP_ENDPOINT": f"http://127.0.0.1:{args.cdp_port}"}
+                    return await run_pool(ui, ui_envs, game_lock, ui_env, args.timeout)
+                finally:
+                    await browser.close()
+
+        async def run_all():
+            # The two pools run side by side with separate slots
+            return await asyncio.gather(run_pool(api, api_envs, game_lock, base_env, args.timeout), run_ui())
+
+        api_results, ui_results = asyncio.run(run_all())
+    total = time.perf_counter() - started
+
+    results = [*api_results, *ui_results]
+    failed = [r for r in results if not r.passed]
+    for result in failed:
+        tail = "\n".join(result.output.strip().splitlines()[-OUTPUT_TAIL_LINES:])
+        print(f"\n--- {result.name} (worker {result.worker}) ---\n{tail}")
+
+    print("\nSlowest:")
+    for result in sorted(results, key=lambda r: r.seconds, reverse=True)[:5]:
+        print(f"  {result.seconds:6.2f}s  {result.name}")
+    print(f"\n{len(results) - len(failed)} passed, {len(failed)} failed in {total:.1f}s")
+
+    if args.json_path:
+        Path(args.json_path).write_text(
+            json.dumps({"seconds": round(total, 3), "results": [asdict(r) for r in results]}, indent=2) + "\n"
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,38 @@
+// Type surface of the `ws` package used by lib/game/ws-gateway.ts. Kept local so
+// the lockfile only carries the runtime package.
+declare module 'ws' {
+  import type { EventEmitter } from 'events';
+  import type { IncomingMessage } from 'http';
+  import type { Duplex } from 'stream';
+
+  export type RawData = Buffer | ArrayBuffer | Buffer[];
+
+  export class WebSocket extends EventEmitter {
+    static readonly CONNECTING: 0;
+    static readonly OPEN: 1;
+    static readonly CLOSING: 2;
+    static readonly CLOSED: 3;
+    readonly readyState: 0 | 1 | 2 | 3;
+    send(data: string | Buffer, cb?: (err?: Error) => void): void;
+    close(code?: number, reason?: string): void;
+    terminate(): void;
+    on(event: 'message', listener: (data: RawData, isBinary: boolean) => void): this;
+    on(event: 'close', listener: (code: number, reason: Buffer) => void): this;
+    on(event: 'error', listener: (err: Error) => void): this;
+  }
+
+  export interface ServerOptions {
+    noServer?: boolean;
+    maxPayload?: number;
+  }
+
+  export class WebSocketServer extends EventEmitter {
+    constructor(options?: ServerOptions);
+    handleUpgrade(
+      request: IncomingMessage,
+      socket: Duplex,
+      head: Buffer,
+      callback: (client: WebSocket, request: IncomingMessage) => void,
+    ): void;
+  }
+}